@@ -20,6 +20,8 @@ from app.repositories.implementations.domain_repository import DomainRepository
 from app.repositories.implementations.source_repository import SourceRepository
 from app.repositories.implementations.search_repository import SearchRepository
 from app.repositories.implementations.feedback_repository import FeedbackRepository
+from app.repositories.implementations.rollup_repository import RollupRepository
+from app.repositories.implementations.embedding_cache_repository import EmbeddingCacheRepository
 from app.core.config import settings
 from app.services.analysis_orchestrator import AnalysisOrchestrator
 from app.services.claim_conversation_service import ClaimConversationService
@@ -37,6 +39,7 @@ from app.services.domain_service import DomainService
 from app.services.source_service import SourceService
 from app.services.search_service import SearchService
 from app.services.feedback_service import FeedbackService
+from app.services.rollup_service import RollupService
 from app.db.session import AsyncSessionLocal
 
 logger = logging.getLogger(__name__)
@@ -97,8 +100,18 @@ async def get_feedback_repository(session: AsyncSession = Depends(get_db)) -> Fe
     return FeedbackRepository(session)
 
 
-async def get_embedding_generator() -> EmbeddingGeneratorInterface:
-    return EmbeddingGenerator()
+async def get_rollup_repository(session: AsyncSession = Depends(get_db)) -> RollupRepository:
+    return RollupRepository(session)
+
+
+async def get_embedding_cache_repository(session: AsyncSession = Depends(get_db)) -> EmbeddingCacheRepository:
+    return EmbeddingCacheRepository(session)
+
+
+async def get_embedding_generator(
+    cache_repository: EmbeddingCacheRepository = Depends(get_embedding_cache_repository),
+) -> EmbeddingGeneratorInterface:
+    return EmbeddingGenerator(cache_repository)
 
 
 async def get_user_service(user_repository: UserRepository = Depends(get_user_repository)) -> UserService:
@@ -169,6 +182,15 @@ async def get_feedback_service(
     return FeedbackService(feedback_repository, analysis_repository)
 
 
+async def get_rollup_service(
+    rollup_repository: RollupRepository = Depends(get_rollup_repository),
+    claim_repository: ClaimRepository = Depends(get_claim_repository),
+    analysis_repository: AnalysisRepository = Depends(get_analysis_repository),
+    source_repository: SourceRepository = Depends(get_source_repository),
+) -> RollupService:
+    return RollupService(rollup_repository, claim_repository, analysis_repository, source_repository)
+
+
 async def get_llm_provider():
     try:
         provider = VertexAILlamaProvider(settings)
@@ -1,6 +1,6 @@
 import json
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 import logging
 from datetime import datetime
@@ -11,10 +11,13 @@ from app.api.dependencies import (
     get_current_user,
     get_claim_service,
     get_together_orchestrator_service,
+    get_rollup_service,
 )
 from app.models.domain.user import User
+from app.repositories.aggregates import AggregationPeriod
 from app.services.analysis_service import AnalysisService
 from app.services.claim_service import ClaimService
+from app.services.rollup_service import RollupService
 from app.services.analysis_orchestrator import AnalysisOrchestrator
 from app.schemas.analysis_schema import AnalysisRead
 from app.core.exceptions import NotFoundException
@@ -34,12 +37,16 @@ async def get_analysis(
     analysis_id: UUID,
     include_sources: bool = Query(False),
     include_feedback: bool = Query(False),
+    include_log_probs: bool = Query(False),
     current_user: User = Depends(get_current_user),
     analysis_service: AnalysisService = Depends(get_analysis_service),
 ) -> AnalysisRead:
     try:
         analysis = await analysis_service.get_analysis(
-            analysis_id=analysis_id, include_sources=include_sources, include_feedback=include_feedback
+            analysis_id=analysis_id,
+            include_sources=include_sources,
+            include_feedback=include_feedback,
+            include_log_probs=include_log_probs,
         )
         return AnalysisRead.model_validate(analysis)
     except NotFoundException as e:
@@ -147,13 +154,17 @@ async def get_claim_analyses(
     claim_id: UUID,
     include_sources: bool = Query(False),
     include_feedback: bool = Query(False),
+    include_log_probs: bool = Query(False),
     current_user: User = Depends(get_current_user),
     analysis_service: AnalysisService = Depends(get_analysis_service),
 ) -> List[AnalysisRead]:
     try:
         logger.info("Fetching analysis...")
         analyses = await analysis_service.get_claim_analyses(
-            claim_id=claim_id, include_sources=include_sources, include_feedback=include_feedback
+            claim_id=claim_id,
+            include_sources=include_sources,
+            include_feedback=include_feedback,
+            include_log_probs=include_log_probs,
         )
         return [AnalysisRead.model_validate(a) for a in analyses]
     except Exception as e:
@@ -166,19 +177,23 @@ async def get_claim(
     start_date: datetime,
     end_date: datetime,
     language: str = "english",
-    analysis_service: AnalysisService = Depends(get_analysis_service),
+    group_by: Optional[AggregationPeriod] = None,
+    rollup_service: RollupService = Depends(get_rollup_service),
 ) -> dict:
-    """Get average reliability score for claims by language."""
+    """Get average reliability score for claims by language, optionally broken down by day or week."""
     try:
-        analyses = await analysis_service.get_analysis_list(start_date=start_date, end_date=end_date, language=language)
-
-        if not analyses:
-            return {"avg_score": 0.0}  # Return 0 if the list is empty to avoid division by zero
+        average_score, buckets = await rollup_service.average_veracity(
+            start_date=start_date, end_date=end_date, language=language, period=group_by
+        )
+        response = {"avg_score": average_score}
 
-        total_score = sum(analysis.veracity_score for analysis in analyses)
-        average_score = total_score / len(analyses)
+        if group_by:
+            response["buckets"] = [
+                {"period": period.isoformat(), "avg_score": avg_score, "count": count}
+                for period, avg_score, count in buckets
+            ]
 
-        return {"avg_score": average_score}
+        return response
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to get analysis list: {str(e)}"
@@ -9,23 +9,28 @@ from app.api.dependencies import (
     get_current_user,
     get_embedding_generator,
     get_serper_orchestrator_service,
+    get_rollup_service,
 )
 from app.models.database.models import ClaimStatus
 from app.models.domain.user import User
+from app.repositories.aggregates import AggregationPeriod
 from app.schemas.claim_schema import (
     ClaimCreate,
     ClaimList,
     ClaimRead,
     ClaimStatusUpdate,
     WordCloudRequest,
+    ClaimEmbeddingsRequest,
+    ClaimEmbeddingsResult,
     BatchAnalysisResponse,
     BatchResponse,
 )
 from app.services.claim_service import ClaimService
+from app.services.rollup_service import RollupService
 from app.services.analysis_orchestrator import AnalysisOrchestrator
 from app.core.exceptions import NotFoundException, NotAuthorizedException
 from app.services.interfaces.embedding_generator import EmbeddingGeneratorInterface
-from app.core.exceptions import MonthlyLimitExceededError
+from app.core.exceptions import AnalyticsTimeoutError, MonthlyLimitExceededError
 
 router = APIRouter(prefix="/claims", tags=["claims"])
 logger = logging.getLogger(__name__)
@@ -188,20 +193,39 @@ async def update_claim_embedding(
         )
 
 
+@router.post("/embeddings", response_model=ClaimEmbeddingsResult, summary="Generate embeddings for many claims")
+async def generate_claim_embeddings(
+    data: ClaimEmbeddingsRequest,
+    current_user: User = Depends(get_current_user),
+    claim_service: ClaimService = Depends(get_claim_service),
+    embedding_generator: EmbeddingGeneratorInterface = Depends(get_embedding_generator),
+) -> ClaimEmbeddingsResult:
+    """Generate and store embeddings for many of the user's claims in one batch."""
+    try:
+        updated, missing = await claim_service.generate_claim_embeddings(
+            claim_ids=data.claim_ids, user_id=current_user.id, embedding_generator=embedding_generator
+        )
+        return ClaimEmbeddingsResult(updated=updated, missing=missing)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to generate embeddings: {str(e)}"
+        )
+
+
 @router.post("/wordcloud/generate", response_model=dict, summary="Get the JSON for plotting a word cloud")
 async def generate_word_cloud(
     data: WordCloudRequest,
-    claim_service: ClaimService = Depends(get_claim_service),
+    rollup_service: RollupService = Depends(get_rollup_service),
 ) -> dict:
-    """Generate and update a claim's embedding."""
+    """Generate a word cloud of the claims analyzed in a date range."""
     try:
-        claims = await claim_service.list_time_bound_claims(
+        plot = await rollup_service.word_cloud(
             start_date=data.start_date, end_date=data.end_date, language=data.language
         )
 
-        plot = await claim_service.generate_word_cloud(claims)
-
         return plot
+    except AnalyticsTimeoutError:
+        raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail="Timed out generating word cloud")
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to generate word cloud: {str(e)}"
@@ -213,16 +237,15 @@ async def generate_clustering_graph(
     data: WordCloudRequest,
     claim_service: ClaimService = Depends(get_claim_service),
 ) -> dict:
-    """Generate and update a claim's embedding."""
+    """Generate a clustering graph of the claims analyzed in a date range."""
     try:
-        claims = await claim_service.list_time_bound_claims(
+        plot = await claim_service.generate_clustering_graph(
             start_date=data.start_date, end_date=data.end_date, language=data.language
         )
-        # logger.info(claims)
-
-        plot = await claim_service.generate_clustering_graph(claims=claims, num_clusters=3)
 
         return plot
+    except AnalyticsTimeoutError:
+        raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail="Timed out generating clustering graph")
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to generate clustering graph: {str(e)}"
@@ -234,12 +257,20 @@ async def get_all_claim(
     start_date: datetime,
     end_date: datetime,
     language: str = "english",
-    claim_service: ClaimService = Depends(get_claim_service),
+    group_by: Optional[AggregationPeriod] = None,
+    rollup_service: RollupService = Depends(get_rollup_service),
 ) -> dict:
-    """Get total claims by language."""
+    """Get total claims by language, optionally broken down by day or week."""
     try:
-        claims = await claim_service.list_time_bound_claims(start_date=start_date, end_date=end_date, language=language)
-        return {"total_claims": len(claims)}
+        total, buckets = await rollup_service.count_claims(
+            start_date=start_date, end_date=end_date, language=language, period=group_by
+        )
+        response = {"total_claims": total}
+
+        if group_by:
+            response["buckets"] = [{"period": period.isoformat(), "count": count} for period, count in buckets]
+
+        return response
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to get list of claim: {str(e)}"
@@ -1,4 +1,9 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.core.analytics_executor import analytics_executor
+from app.core.config import settings
+from app.services.implementations.embedding_generator import get_warm_up_error, is_model_loaded
 
 router = APIRouter()
 
@@ -6,3 +11,25 @@ router = APIRouter()
 @router.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+@router.get("/ready")
+async def readiness_check():
+    """
+    Ready once the embedding model has been loaded by the startup warm-up.
+
+    With the warm-up disabled the model loads on first use, so the API is ready immediately.
+    A failed warm-up is reported as such instead of as loading.
+    """
+    if is_model_loaded() or not settings.EMBEDDING_WARM_UP_ON_STARTUP:
+        return {"status": "ready"}
+    error = get_warm_up_error()
+    if error is not None:
+        return JSONResponse(status_code=503, content={"status": "failed", "detail": error})
+    return JSONResponse(status_code=503, content={"status": "loading"})
+
+
+@router.get("/health/analytics")
+async def analytics_health():
+    """Queue depth and timeouts of the analytics process pool."""
+    return analytics_executor.stats()
@@ -1,22 +1,47 @@
 import logging
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
-from collections import defaultdict
 
 
-from app.api.dependencies import get_source_service, get_current_user, get_search_service
+from app.api.dependencies import get_source_service, get_current_user, get_rollup_service
 from app.models.domain.user import User
 from app.services.source_service import SourceService
-from app.services.search_service import SearchService
-from app.schemas.source_schema import SourceRead, SourceList
-from app.core.exceptions import NotFoundException, NotAuthorizedException
+from app.services.rollup_service import RollupService
+from app.schemas.source_schema import SourceRead, SourceList, SourceSearchResults
+from app.core.exceptions import NotFoundException, NotAuthorizedException, ValidationError
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/sources", tags=["sources"])
 
 
+@router.get("/search", response_model=SourceSearchResults, summary="Search sources")
+async def search_sources(
+    query: str = Query(..., min_length=3),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    current_user: User = Depends(get_current_user),
+    source_service: SourceService = Depends(get_source_service),
+) -> SourceSearchResults:
+    """
+    Full-text search through source titles, snippets and content, best match first.
+    Only searches through sources from analyses the user has access to.
+    """
+    try:
+        sources, next_cursor = await source_service.search_sources(
+            query=query, user_id=current_user.id, limit=limit, cursor=cursor
+        )
+        return SourceSearchResults(
+            items=[SourceRead.model_validate(s) for s in sources], limit=limit, next_cursor=next_cursor
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error searching sources: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to search sources")
+
+
 @router.get("/{source_id}", response_model=SourceRead, summary="Get source by ID")
 async def get_source(
     source_id: UUID,
@@ -47,7 +72,6 @@ async def get_analysis_sources(
     include_content: bool = Query(False, description="Include full source content in response"),
     current_user: User = Depends(get_current_user),
     source_service: SourceService = Depends(get_source_service),
-    search_service: SearchService = Depends(get_search_service),
 ) -> List[SourceRead]:
     """
     Get all sources used in a specific analysis.
@@ -55,18 +79,8 @@ async def get_analysis_sources(
     """
     # TODO include content does not do anything at the moment, it either needs to be removed or created
     try:
-        searches = await search_service.get_analysis_searches(analysis_id=analysis_id, user_id=current_user.id)
-        sources = []
-        for search in searches:
-            temp = await source_service.get_search_sources_without_auth_check(
-                search_id=search.id, user_id=current_user.id, include_content=include_content
-            )
-            sources.append(temp)
-
-        flat_sources = [item for sublist in sources for item in sublist]
-
-        sorted_sources = sorted(flat_sources, key=lambda x: (x.credibility_score is None, -(x.credibility_score or 0)))
-        return [SourceRead.model_validate(s) for s in sorted_sources]
+        sources = await source_service.get_analysis_sources(analysis_id=analysis_id, user_id=current_user.id)
+        return [SourceRead.model_validate(s) for s in sources]
     except NotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except NotAuthorizedException:
@@ -108,7 +122,6 @@ async def get_analysis_sources_unique(
     include_content: bool = Query(False, description="Include full source content in response"),
     current_user: User = Depends(get_current_user),
     source_service: SourceService = Depends(get_source_service),
-    search_service: SearchService = Depends(get_search_service),
 ) -> List[SourceRead]:
     """
     Get all sources used in a specific analysis.
@@ -116,28 +129,10 @@ async def get_analysis_sources_unique(
     """
     # TODO include content does not do anything at the moment, it either needs to be removed or created
     try:
-        searches = await search_service.get_analysis_searches(analysis_id=analysis_id, user_id=current_user.id)
-        sources = []
-        for search in searches:
-            temp = await source_service.get_search_sources_without_auth_check(
-                search_id=search.id, user_id=current_user.id, include_content=include_content
-            )
-            sources.append(temp)
-
-        flat_sources = [item for sublist in sources for item in sublist]
-
-        seen_urls = set()
-        unique_sources = []
-
-        for source in flat_sources:
-            if source.url not in seen_urls:
-                unique_sources.append(source)
-                seen_urls.add(source.url)
-
-        sorted_sources = sorted(
-            unique_sources, key=lambda x: (x.credibility_score is None, -(x.credibility_score or 0))
+        sources = await source_service.get_analysis_sources(
+            analysis_id=analysis_id, user_id=current_user.id, unique=True
         )
-        return [SourceRead.model_validate(s) for s in sorted_sources]
+        return [SourceRead.model_validate(s) for s in sources]
     except NotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except NotAuthorizedException:
@@ -172,57 +167,20 @@ async def get_domain_sources(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to access these sources")
 
 
-@router.get("/search", response_model=SourceList, summary="Search sources")
-async def search_sources(
-    query: str = Query(..., min_length=3),
-    limit: int = Query(50, ge=1, le=100),
-    offset: int = Query(0, ge=0),
-    current_user: User = Depends(get_current_user),
-    source_service: SourceService = Depends(get_source_service),
-) -> SourceList:
-    """
-    Search through sources based on title, content, or URL.
-    Only searches through sources from analyses the user has access to.
-    """
-    try:
-        sources, total = await source_service.search_sources(
-            query=query, user_id=current_user.id, limit=limit, offset=offset
-        )
-        return SourceList(
-            items=[SourceRead.model_validate(s) for s in sources], total=total, limit=limit, offset=offset
-        )
-    except Exception as e:
-        logger.error(f"Error searching sources: {str(e)}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to search sources")
-
-
 @router.get("/total/table", response_model=dict, summary="Total Sources")
 async def source_total(
     start_date: datetime,
     end_date: datetime,
     language: str = "english",
-    source_service: SourceService = Depends(get_source_service),
-) -> List[dict]:
-    """Get total claims by language."""
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of domains to return"),
+    rollup_service: RollupService = Depends(get_rollup_service),
+) -> dict:
+    """Get the share of retrieved sources per domain by language."""
     try:
-        # TODO Put a limit on how many can be retrieved
-        sources = await source_service.list_time_bound_sources(
-            start_date=start_date, end_date=end_date, language=language
+        sorted_aggregates, total_sources = await rollup_service.domain_stats(
+            start_date=start_date, end_date=end_date, language=language, limit=limit
         )
 
-        total_sources = len(sources)
-        grouped_sources = defaultdict(list)
-        for source in sources:
-            domain_url = source.domain.domain_name
-            grouped_sources[domain_url].append(source)
-
-        # Convert to list of lists
-        groups = list(grouped_sources.values())
-
-        aggregates = await source_service.calculate_domain_stats(groups, total_sources)
-
-        sorted_aggregates = sorted(aggregates, key=lambda x: x["percent_retrieved"], reverse=True)
-
         return {"sorted_aggregates": sorted_aggregates, "total_sources": total_sources}
     except Exception as e:
         raise HTTPException(
@@ -0,0 +1,115 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+
+from app.core.config import settings
+from app.core.exceptions import AnalyticsTimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_worker(worker_pids=None) -> None:
+    """Import the heavy analytics libraries once per worker instead of on its first job."""
+    # As the pool initializer, report this worker's pid so a stuck worker can be killed.
+    if worker_pids is not None:
+        worker_pids.put(os.getpid())
+    import numpy  # noqa: F401
+    import pandas  # noqa: F401
+    import plotly.express  # noqa: F401
+    import sklearn.cluster  # noqa: F401
+    import wordcloud  # noqa: F401
+
+
+class AnalyticsExecutor:
+    """
+    Process pool for CPU-heavy dashboard jobs (word clouds, clustering figures).
+
+    Jobs run outside the API process so they neither hold the GIL nor queue behind
+    each other on a single thread. Functions and arguments must be picklable.
+
+    A worker process cannot be interrupted, so when a job times out the whole pool is
+    terminated and recreated on the next job; other jobs running in it at that moment fail.
+    """
+
+    def __init__(self, max_workers: int, timeout_seconds: float):
+        self.max_workers = max_workers
+        self.timeout_seconds = timeout_seconds
+        self.pending_jobs = 0
+        self.timed_out_jobs = 0
+        self.recycled_pools = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._worker_pids = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn rather than fork: the API process runs threads (event loop executors, torch).
+            context = multiprocessing.get_context("spawn")
+            self._worker_pids = context.SimpleQueue()
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=context,
+                initializer=_warm_worker,
+                initargs=(self._worker_pids,),
+            )
+        return self._pool
+
+    def start(self) -> None:
+        """Start the workers ahead of the first job."""
+        pool = self._get_pool()
+        for _ in range(self.max_workers):
+            pool.submit(_warm_worker)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run fn(*args) in a worker, raising AnalyticsTimeoutError if it takes longer than the job timeout."""
+        loop = asyncio.get_running_loop()
+        self.pending_jobs += 1
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(self._get_pool(), fn, *args), timeout=self.timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            self.timed_out_jobs += 1
+            logger.warning(f"Analytics job {fn.__name__} timed out after {self.timeout_seconds}s, recycling workers")
+            self._recycle()
+            raise AnalyticsTimeoutError(f"{fn.__name__} did not finish within {self.timeout_seconds}s")
+        finally:
+            self.pending_jobs -= 1
+
+    def _recycle(self) -> None:
+        """Kill the workers, including any still running a timed-out job; the pool is recreated lazily."""
+        pool, self._pool = self._pool, None
+        worker_pids, self._worker_pids = self._worker_pids, None
+        if pool is None:
+            return
+
+        pool.shutdown(wait=False, cancel_futures=True)
+        # Every worker reports its pid before taking a job, so the stuck ones are all in the queue.
+        while not worker_pids.empty():
+            try:
+                os.kill(worker_pids.get(), signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        worker_pids.close()
+        self.recycled_pools += 1
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.max_workers,
+            "pending_jobs": self.pending_jobs,
+            "timed_out_jobs": self.timed_out_jobs,
+            "recycled_pools": self.recycled_pools,
+        }
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+analytics_executor = AnalyticsExecutor(
+    max_workers=settings.ANALYTICS_WORKERS, timeout_seconds=settings.ANALYTICS_JOB_TIMEOUT_SECONDS
+)
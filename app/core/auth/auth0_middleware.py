@@ -1,6 +1,10 @@
-from typing import Optional
+from dataclasses import replace
+from typing import Optional, Tuple
 from uuid import uuid4
 import aiohttp
+import hashlib
+import time
+from cachetools import TLRUCache
 from fastapi import HTTPException, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import ExpiredSignatureError, jwt
@@ -9,6 +13,7 @@ import logging
 from datetime import UTC, datetime
 
 from app.core.config import get_settings
+from app.core.auth.jwks_cache import jwks_cache
 
 # from app.api.dependencies import get_db
 from app.repositories.implementations.user_repository import UserRepository
@@ -20,6 +25,15 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+def _token_expiry(_key: str, value: Tuple[User, float], now: float) -> float:
+    return min(value[1], now + settings.AUTH0_TOKEN_CACHE_TTL_SECONDS)
+
+
+# sha256(token) -> (user, exp). Entries expire with the token, or after the TTL if sooner,
+# so that deactivated users and profile changes are picked up.
+_token_cache: TLRUCache = TLRUCache(maxsize=settings.AUTH0_TOKEN_CACHE_SIZE, ttu=_token_expiry, timer=time.time)
+
+
 class Auth0Bearer(HTTPBearer):
     def __init__(self, auto_error: bool = True):
         super().__init__(auto_error=auto_error)
@@ -53,43 +67,16 @@ class Auth0Middleware:
         self.audience = settings.AUTH0_AUDIENCE
         self.issuer = f"https://{settings.AUTH0_DOMAIN}/"
         self.algorithms = settings.AUTH0_ALGORITHMS
-        self.jwks = None
         # self.user_service = user_service
         self.security = Auth0Bearer()
 
-    async def _get_jwks(self) -> dict:
-        """Fetch and cache JWKS from Auth0."""
-        if not self.jwks:
-            try:
-                jwks_url = f"https://{self.domain}/.well-known/jwks.json"
-                logger.debug(f"Fetching JWKS from: {jwks_url}")
-
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(jwks_url) as response:
-                        if response.status != 200:
-                            logger.error(f"Failed to fetch JWKS. Status: {response.status}")
-                            raise HTTPException(status_code=500, detail="Failed to fetch authentication keys")
-                        self.jwks = await response.json()
-                        logger.debug(f"Successfully fetched JWKS: {json.dumps(self.jwks, indent=2)}")
-            except aiohttp.ClientError as e:
-                logger.error(f"Network error fetching JWKS: {str(e)}")
-                raise HTTPException(status_code=500, detail="Authentication service unavailable")
-        return self.jwks
-
     async def _verify_token(self, token: str) -> dict:
         """Verify JWT token and return payload."""
         try:
             unverified_header = jwt.get_unverified_header(token)
             logger.debug(f"Unverified token header: {json.dumps(unverified_header, indent=2)}")
 
-            jwks = await self._get_jwks()
-            rsa_key = None
-
-            for key in jwks["keys"]:
-                if key["kid"] == unverified_header["kid"]:
-                    rsa_key = key
-                    break
-
+            rsa_key = await jwks_cache.get_key(unverified_header["kid"])
             if not rsa_key:
                 raise HTTPException(status_code=401, detail="Invalid token key")
 
@@ -135,9 +122,17 @@ class Auth0Middleware:
                 raise HTTPException(status_code=401, detail="No valid authentication credentials found")
 
             token = credentials.credentials
+            token_key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+            cached = _token_cache.get(token_key)
+            if cached is not None:
+                return replace(cached[0])
+
             payload = await self._verify_token(token)
             user_info = await self._fetch_user_info(token)
-            return await self._get_or_create_user({**payload, **user_info})
+            user = await self._get_or_create_user({**payload, **user_info})
+            if "exp" in payload:
+                _token_cache[token_key] = (user, float(payload["exp"]))
+            return replace(user)
         except Exception as e:
             logger.error(f"Authentication error: {str(e)}")
             raise HTTPException(status_code=401, detail="Authentication failed")
@@ -151,7 +146,7 @@ class Auth0Middleware:
                 # Try to get user by Auth0 ID
                 user = await user_service.get_by_auth0_id(user_data["sub"])
                 if user:
-                    return await user_service.record_login(user.id)
+                    return await user_service.record_login(user)
 
                 # Try to get user by email
                 email = user_data.get("email")
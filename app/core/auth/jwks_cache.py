@@ -0,0 +1,76 @@
+from typing import Optional
+import asyncio
+import logging
+import time
+
+import aiohttp
+from fastapi import HTTPException
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class JWKSCache:
+    """
+    Process-wide cache of the Auth0 signing keys.
+
+    Keys are refetched when older than ttl_seconds, or when a token names a kid we do not
+    know (key rotation), at most once per min_refresh_interval_seconds. Concurrent callers
+    share a single fetch, and stale keys keep being served if a refresh fails.
+    """
+
+    def __init__(self, jwks_url: str, ttl_seconds: float, min_refresh_interval_seconds: float):
+        self.jwks_url = jwks_url
+        self.ttl_seconds = ttl_seconds
+        self.min_refresh_interval_seconds = min_refresh_interval_seconds
+        self._keys: dict = {}
+        self._fetched_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return self._fetched_at is not None and time.monotonic() - self._fetched_at < self.ttl_seconds
+
+    async def _fetch(self) -> dict:
+        logger.debug(f"Fetching JWKS from: {self.jwks_url}")
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(self.jwks_url) as response:
+                    if response.status != 200:
+                        logger.error(f"Failed to fetch JWKS. Status: {response.status}")
+                        raise HTTPException(status_code=500, detail="Failed to fetch authentication keys")
+                    jwks = await response.json()
+        except aiohttp.ClientError as e:
+            logger.error(f"Network error fetching JWKS: {str(e)}")
+            raise HTTPException(status_code=500, detail="Authentication service unavailable")
+        return {key["kid"]: key for key in jwks.get("keys", [])}
+
+    async def _refresh(self, seen_fetched_at: Optional[float]) -> None:
+        async with self._lock:
+            # Someone else refreshed while we were waiting for the lock.
+            if self._fetched_at != seen_fetched_at:
+                return
+
+            try:
+                self._keys = await self._fetch()
+                logger.info(f"Fetched {len(self._keys)} JWKS keys")
+            except HTTPException:
+                if not self._keys:
+                    raise
+                logger.warning("JWKS refresh failed, keeping previously fetched keys")
+            self._fetched_at = time.monotonic()
+
+    async def get_key(self, kid: str) -> Optional[dict]:
+        """Signing key for kid, or None if Auth0 does not publish it."""
+        if not self._is_fresh():
+            await self._refresh(self._fetched_at)
+        elif kid not in self._keys and time.monotonic() - self._fetched_at >= self.min_refresh_interval_seconds:
+            await self._refresh(self._fetched_at)
+        return self._keys.get(kid)
+
+
+jwks_cache = JWKSCache(
+    jwks_url=f"https://{settings.AUTH0_DOMAIN}/.well-known/jwks.json",
+    ttl_seconds=settings.AUTH0_JWKS_TTL_SECONDS,
+    min_refresh_interval_seconds=settings.AUTH0_JWKS_MIN_REFRESH_INTERVAL_SECONDS,
+)
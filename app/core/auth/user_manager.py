@@ -25,7 +25,7 @@ class UserManager:
             user = await self._user_service.get_by_auth0_id(auth0_payload["sub"])
             if user:
                 logger.debug(f"Found existing user by Auth0 ID: {user.id}")
-                user = await self._user_service.record_login(user.id)
+                user = await self._user_service.record_login(user)
                 return user, False
 
             email = self._extract_email(auth0_payload)
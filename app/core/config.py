@@ -37,6 +37,39 @@ class Settings(BaseSettings):
     AUTH0_CLIENT_SECRET: str = ""
     AUTH0_ALGORITHMS: str = "RS256"
     AUTH0_ISSUER: str = "https://veri-fact.ca.auth0.com/"
+    AUTH0_JWKS_TTL_SECONDS: int = 3600
+    AUTH0_JWKS_MIN_REFRESH_INTERVAL_SECONDS: int = 30
+    AUTH0_TOKEN_CACHE_SIZE: int = 10000
+    AUTH0_TOKEN_CACHE_TTL_SECONDS: int = 300
+    LAST_LOGIN_UPDATE_INTERVAL_SECONDS: int = 300
+    MESSAGE_FLUSH_INTERVAL_SECONDS: float = 1.0
+    MESSAGE_FLUSH_CHARS: int = 1024
+    CONTEXT_TOKEN_BUDGET: int = 3000
+    CONTEXT_MAX_MESSAGES: int = 50
+    CONTEXT_SUMMARY_MAX_WORDS: int = 200
+    # Per-process cache; entries are revalidated against the database on every hit, so writes
+    # from other workers are seen, and the TTL only bounds memory.
+    DISCUSSION_CONTEXT_CACHE_SIZE: int = 1024
+    DISCUSSION_CONTEXT_CACHE_TTL_SECONDS: int = 600
+
+    ROLLUP_REFRESH_INTERVAL_SECONDS: int = 300
+    ROLLUP_REFRESH_DAYS: int = 3
+    ROLLUP_TOP_TERMS: int = 200
+    # Per-process cache keyed on when the range was last rolled up; the TTL bounds staleness of live days.
+    WORD_CLOUD_CACHE_SIZE: int = 256
+    WORD_CLOUD_CACHE_TTL_SECONDS: int = 600
+    CLUSTERING_NUM_CLUSTERS: int = 3
+    CLUSTERING_BATCH_SIZE: int = 1024
+    # Most recent claims plotted in a clustering figure; wider ranges are truncated to these.
+    CLUSTERING_MAX_POINTS: int = 20000
+    ANALYTICS_WORKERS: int = 2
+    ANALYTICS_JOB_TIMEOUT_SECONDS: float = 30.0
+    EMBEDDING_BATCH_SIZE: int = 256
+    EMBEDDING_MAX_BATCH_SIZE: int = 64
+    EMBEDDING_MAX_WAIT_MS: int = 10
+    EMBEDDING_TORCH_THREADS: int = 4
+    EMBEDDING_CACHE_SIZE: int = 10000
+    EMBEDDING_WARM_UP_ON_STARTUP: bool = True
 
     DEBUG: bool = False
 
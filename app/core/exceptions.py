@@ -21,6 +21,12 @@ class ValidationError(Exception):
     pass
 
 
+class AnalyticsTimeoutError(Exception):
+    """Raised when a dashboard analytics job exceeds its time budget."""
+
+    pass
+
+
 """
 User exceptions
 """
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import math
 from typing import AsyncGenerator, List
@@ -59,8 +60,9 @@ class TogetherAIProvider(LLMProvider):
         try:
             logger.debug(f"Generating response with temperature {temperature}")
 
-            # Synchronous call (OpenAI Python client is sync by default, can use AsyncOpenAI if needed)
-            response = self.client.chat.completions.create(
+            # The OpenAI Python client is synchronous, so the call runs in a thread to keep the event loop free
+            response = await asyncio.to_thread(
+                self.client.chat.completions.create,
                 model=self.model_id,
                 messages=[{"role": m.role, "content": m.content} for m in messages],
                 temperature=temperature,
@@ -96,13 +96,15 @@ class VertexAILlamaProvider(LLMProvider):
 
     async def generate_response(self, messages: List[Message], temperature: float = 0.7) -> Response:
         try:
-            self._refresh_token_if_needed()
+            # Both the token refresh and the OpenAI client block, so they run in a thread.
+            await asyncio.to_thread(self._refresh_token_if_needed)
 
             logger.debug(f"Generating response with temperature {temperature}")
             logger.debug(f"Number of messages: {len(messages)}")
             logger.debug(f"Model ID: {self.model_id}")
 
-            response = self.client.chat.completions.create(
+            response = await asyncio.to_thread(
+                self.client.chat.completions.create,
                 model=self.model_id,
                 messages=[{"role": m.role, "content": m.content} for m in messages],
                 temperature=temperature,
@@ -0,0 +1,41 @@
+from typing import Optional, Sequence
+import hashlib
+import re
+
+import numpy as np
+
+# Embeddings are stored as raw little-endian float32, 4 bytes per dimension.
+EMBEDDING_DTYPE = np.dtype("<f4")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def encode_embedding(embedding: Optional[Sequence[float]]) -> Optional[bytes]:
+    """Pack an embedding into the bytes stored in claims.embedding."""
+    if embedding is None:
+        return None
+    return np.asarray(embedding, dtype=EMBEDDING_DTYPE).tobytes()
+
+
+def decode_embedding(data: Optional[bytes]) -> Optional[np.ndarray]:
+    """View stored embedding bytes as a float32 vector without copying."""
+    if data is None:
+        return None
+    return np.frombuffer(data, dtype=EMBEDDING_DTYPE)
+
+
+def decode_embeddings(rows: Sequence[bytes]) -> np.ndarray:
+    """Stack stored embeddings of equal dimension into an (n, dim) float32 matrix."""
+    if not rows:
+        return np.empty((0, 0), dtype=EMBEDDING_DTYPE)
+    return np.frombuffer(b"".join(rows), dtype=EMBEDDING_DTYPE).reshape(len(rows), -1)
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace runs; the tokenizer splits on whitespace, so the embedding is unchanged."""
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def embedding_cache_key(text: str, model_name: str) -> str:
+    """Hex sha256 of the model name and normalized text, used as the embedding cache key."""
+    return hashlib.sha256(f"{model_name}\n{normalize_text(text)}".encode("utf-8")).hexdigest()
@@ -0,0 +1,63 @@
+from typing import Any, List, Optional, Sequence, Tuple
+import math
+import struct
+
+import numpy as np
+
+# Versioned layout for analysis.log_probs:
+#   header (magic, version, number of probs, number of tokens)
+#   probs as little-endian float32 (NaN where the provider returned none)
+#   token byte lengths as little-endian uint32
+#   utf-8 token bytes, concatenated
+MAGIC = b"LPB"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<3sBII")
+
+
+def _as_logprob(value: Any) -> float:
+    """Reduce what a provider attached to a streamed chunk to that chunk's log-probability."""
+    if value is None:
+        return math.nan
+    if isinstance(value, (int, float)):
+        return float(value)
+    # OpenAI-style ChoiceLogprobs: one entry per token in the chunk.
+    content = getattr(value, "content", None)
+    if content:
+        return float(sum(token.logprob for token in content))
+    return math.nan
+
+
+def encode_log_probs(tokens: Sequence[str], probs: Sequence[Any]) -> bytes:
+    """Encode token texts and per-chunk log-probabilities for storage."""
+    encoded_tokens = [token.encode("utf-8") for token in tokens]
+    return b"".join(
+        [
+            _HEADER.pack(MAGIC, FORMAT_VERSION, len(probs), len(encoded_tokens)),
+            np.asarray([_as_logprob(p) for p in probs], dtype="<f4").tobytes(),
+            np.asarray([len(token) for token in encoded_tokens], dtype="<u4").tobytes(),
+            *encoded_tokens,
+        ]
+    )
+
+
+def decode_log_probs(data: bytes) -> Tuple[List[str], List[Optional[float]]]:
+    """Decode stored log-probabilities, raising ValueError for anything not in the current format."""
+    if len(data) < _HEADER.size:
+        raise ValueError("log_probs payload is truncated")
+
+    magic, version, prob_count, token_count = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported log_probs format {magic!r} v{version}")
+
+    offset = _HEADER.size
+    probs = np.frombuffer(data, dtype="<f4", count=prob_count, offset=offset)
+    offset += probs.nbytes
+    lengths = np.frombuffer(data, dtype="<u4", count=token_count, offset=offset)
+    offset += lengths.nbytes
+
+    tokens = []
+    for length in lengths.tolist():
+        tokens.append(data[offset : offset + length].decode("utf-8"))
+        offset += length
+
+    return tokens, [None if math.isnan(p) else p for p in probs.tolist()]
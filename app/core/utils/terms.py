@@ -0,0 +1,51 @@
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Optional
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# Same token shape WordCloud uses when it tokenizes raw text itself.
+TOKEN_PATTERN = re.compile(r"\w[\w']+")
+
+
+@lru_cache(maxsize=None)
+def get_stopwords(language: str) -> FrozenSet[str]:
+    """
+    Stopwords excluded from term counts for a claim language.
+
+    Always includes the WordCloud defaults and the French NLTK list (the word cloud has
+    always filtered both), plus the NLTK list for the language itself when there is one.
+    """
+    from nltk.corpus import stopwords
+    from wordcloud import STOPWORDS
+
+    words = {word.lower() for word in STOPWORDS}
+    for nltk_language in {"french", language}:
+        try:
+            words.update(stopwords.words(nltk_language))
+        except (LookupError, OSError):
+            logger.warning(f"NLTK stopwords not available for {nltk_language}")
+
+    return frozenset(words)
+
+
+def count_terms(texts: Iterable[str], language: str, limit: Optional[int] = None) -> Dict[str, int]:
+    """
+    Count word frequencies across texts, ignoring case, numbers and stopwords.
+
+    Examples:
+        >>> count_terms(["The vaccine works", "Vaccine claims"], "english")
+        {'vaccine': 2, 'works': 1, 'claims': 1}
+    """
+    stopwords = get_stopwords(language)
+    counts: Counter = Counter()
+
+    for text in texts:
+        for token in TOKEN_PATTERN.findall(text.lower()):
+            if token.isdigit() or token in stopwords:
+                continue
+            counts[token] += 1
+
+    return dict(counts.most_common(limit))
@@ -0,0 +1,38 @@
+from functools import lru_cache
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Approximation: the served models use their own tokenizers, but cl100k_base counts are close
+# enough to keep prompts inside a budget.
+TOKEN_ENCODING = "cl100k_base"
+
+# Per-message overhead of the chat format (role and separators).
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Fallback when the encoding cannot be loaded (it is downloaded on first use outside the image).
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(TOKEN_ENCODING)
+    except Exception as e:
+        logger.warning(f"Could not load {TOKEN_ENCODING}, estimating tokens from length: {str(e)}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Number of tokens in text."""
+    encoding = _encoding()
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(content: str) -> int:
+    """Tokens a chat message with this content takes up in a prompt."""
+    return count_tokens(content) + MESSAGE_OVERHEAD_TOKENS
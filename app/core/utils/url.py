@@ -1,4 +1,4 @@
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlsplit, urlunsplit
 import tld
 import re
 
@@ -45,6 +45,34 @@ def normalize_domain_name(url: str) -> str:
         return url.lower().strip()
 
 
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL so the same page always maps to the same string.
+
+    Lowercases the scheme and host, drops default ports and the fragment, and gives an empty path
+    a "/". The path and query are kept as is, since they can be case- or order-sensitive.
+
+    Examples:
+        >>> normalize_url("HTTPS://Example.COM:443/News/Story?id=1#comments")
+        'https://example.com/News/Story?id=1'
+        >>> normalize_url("http://example.com")
+        'http://example.com/'
+    """
+    try:
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or "").lower()
+        if ":" in host:
+            host = f"[{host}]"
+        if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+            host = f"{host}:{parts.port}"
+        if parts.username or parts.password:
+            host = f"{parts.netloc.rsplit('@', 1)[0]}@{host}"
+        return urlunsplit((scheme, host, parts.path or "/", parts.query, ""))
+    except ValueError:
+        return url.strip()
+
+
 def extract_urls_from_text(text: str) -> list[str]:
     """
     Extract URLs from text content.
@@ -0,0 +1,28 @@
+from typing import Dict
+import json
+
+
+def render_word_cloud(frequencies: Dict[str, int]) -> dict:
+    """
+    Render term frequencies as a word cloud image wrapped in a Plotly figure.
+
+    CPU bound; call it from an executor rather than on the event loop.
+    """
+    import plotly.graph_objects as go
+    from wordcloud import WordCloud
+
+    wordcloud = WordCloud(background_color="white", colormap="rainbow", margin=0)
+    if frequencies:
+        wordcloud.generate_from_frequencies(frequencies)
+    else:
+        wordcloud.generate("Empty")
+
+    fig = go.Figure(go.Image(z=wordcloud.to_array()))
+    fig.update_layout(
+        xaxis=dict(showgrid=False, zeroline=False, visible=False),
+        yaxis=dict(showgrid=False, zeroline=False, visible=False),
+        paper_bgcolor="white",
+        plot_bgcolor="white",
+        margin=dict(l=20, r=20, t=20, b=20),
+    )
+    return json.loads(fig.to_json())
@@ -1,8 +1,14 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.api.router import router
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.auth.auth0_middleware import Auth0Middleware
+from app.core.analytics_executor import analytics_executor
+from app.services.rollup_service import run_rollup_refresh_loop
+from app.services.clustering_engine import clustering_engine
+from app.services.implementations.embedding_generator import embedding_batcher, warm_up_embedding_model
+from app.core.config import settings
 
 # from app.services.user_service import UserService
 # from app.repositories.implementations.user_repository import UserRepository
@@ -33,8 +39,24 @@ async def lifespan(app: FastAPI):
     logging.info("API Starting up")
     # user_service = await get_user_service_startup()
     app.state.auth_middleware = Auth0Middleware()
+    analytics_executor.start()
+    rollup_task = asyncio.create_task(run_rollup_refresh_loop())
+    clustering_task = clustering_engine.start_warm_up()
+    # The embedding model loads in the background; /ready reports 503 until it is done.
+    warm_up_task = asyncio.create_task(warm_up_embedding_model()) if settings.EMBEDDING_WARM_UP_ON_STARTUP else None
     yield
     logging.info("API Shutting down")
+    analytics_executor.shutdown()
+    if warm_up_task is not None:
+        warm_up_task.cancel()
+    if clustering_task is not None:
+        clustering_task.cancel()
+    await embedding_batcher.close()
+    rollup_task.cancel()
+    try:
+        await rollup_task
+    except asyncio.CancelledError:
+        pass
 
 
 app = FastAPI(
@@ -1,10 +1,11 @@
 import enum
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from typing import Optional, List
 import uuid
 from sqlalchemy import (
     UUID,
     CheckConstraint,
+    Date,
     DateTime,
     Float,
     Index,
@@ -16,9 +17,10 @@ from sqlalchemy import (
     ForeignKey,
     text,
     ARRAY,
-    DOUBLE_PRECISION,
     LargeBinary,
+    Computed,
 )
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.database.base import Base
@@ -117,7 +119,8 @@ class ClaimModel(Base):
     )
     language: Mapped[str] = mapped_column(Text, nullable=False, server_default="english")
 
-    embedding: Mapped[list[float]] = mapped_column(ARRAY(DOUBLE_PRECISION), nullable=True)
+    # Packed little-endian float32, see app.core.utils.embeddings.
+    embedding: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
 
     user: Mapped["UserModel"] = relationship(back_populates="claims")
     analyses: Mapped[List["AnalysisModel"]] = relationship(back_populates="claim", cascade="all, delete-orphan")
@@ -126,6 +129,8 @@ class ClaimModel(Base):
     )
     messages: Mapped[List["MessageModel"]] = relationship(back_populates="claim", cascade="all, delete-orphan")
 
+    __table_args__ = (Index("ix_claims_language_status_created_at", "language", "status", "created_at"),)
+
 
 class AnalysisModel(Base):
     __tablename__ = "analysis"
@@ -141,7 +146,8 @@ class AnalysisModel(Base):
         index=True,
     )
 
-    log_probs: Mapped[bytes] = mapped_column(LargeBinary, nullable=True)
+    # Encoded with app.core.utils.log_probs; deferred so only requests that ask for it read the blob.
+    log_probs: Mapped[bytes] = mapped_column(LargeBinary, nullable=True, deferred=True)
 
     claim: Mapped["ClaimModel"] = relationship(back_populates="analyses", doc="Related claim")
     searches: Mapped[List["SearchModel"]] = relationship(back_populates="analysis", cascade="all, delete-orphan")
@@ -155,6 +161,7 @@ class AnalysisModel(Base):
     __table_args__ = (
         CheckConstraint("veracity_score >= 0 AND veracity_score <= 1", name="check_veracity_score_range"),
         CheckConstraint("confidence_score >= 0 AND confidence_score <= 1", name="check_confidence_score_range"),
+        Index("ix_analysis_status_created_at", "status", "created_at"),
     )
 
 
@@ -183,15 +190,20 @@ class SearchModel(Base):
     sources: Mapped[List["SourceModel"]] = relationship(back_populates="search", cascade="all, delete-orphan")
 
 
-class SourceModel(Base):
-    __tablename__ = "sources"
+# Text search configuration for source documents; "simple" because sources come in every claim language.
+SOURCE_SEARCH_CONFIG = "simple"
+SOURCE_SEARCH_VECTOR = (
+    f"setweight(to_tsvector('{SOURCE_SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SOURCE_SEARCH_CONFIG}', coalesce(snippet, '')), 'B') || "
+    # Page text is capped so long documents stay well under the tsvector size limit.
+    f"setweight(to_tsvector('{SOURCE_SEARCH_CONFIG}', left(coalesce(content, ''), 100000)), 'C')"
+)
 
-    search_id: Mapped[UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("searches.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
-    )
+
+class SourceDocumentModel(Base):
+    """A web page, stored once per normalized URL and shared by every search that returned it."""
+
+    __tablename__ = "source_documents"
 
     url: Mapped[str] = mapped_column(String(2048), nullable=False)
     title: Mapped[str] = mapped_column(
@@ -203,22 +215,77 @@ class SourceModel(Base):
         UUID(as_uuid=True), ForeignKey("domains.id"), nullable=True, index=True
     )
     content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    credibility_score: Mapped[float] = mapped_column(Float, nullable=True)
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR, Computed(SOURCE_SEARCH_VECTOR, persisted=True), nullable=True, deferred=True
+    )
 
-    search: Mapped["SearchModel"] = relationship(back_populates="sources")
     domain: Mapped[Optional["DomainModel"]] = relationship(
         "DomainModel",
         lazy="joined",
     )
 
+    __table_args__ = (
+        Index("ix_source_documents_url_hash", text("md5(url)"), unique=True),
+        Index("ix_source_documents_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+
+class SourceModel(Base):
+    """A search result: links a search to the document it returned, with the credibility it was given."""
+
+    __tablename__ = "sources"
+
+    search_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("searches.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    document_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("source_documents.id"), nullable=False, index=True
+    )
+    credibility_score: Mapped[float] = mapped_column(Float, nullable=True)
+
+    search: Mapped["SearchModel"] = relationship(back_populates="sources")
+    document: Mapped["SourceDocumentModel"] = relationship(
+        "SourceDocumentModel",
+        lazy="joined",
+        innerjoin=True,
+    )
+
     __table_args__ = (
         CheckConstraint(
             "(credibility_score IS NULL OR (credibility_score >= 0 AND credibility_score <= 1))",
             name="check_source_credibility_score_range",
         ),
-        Index("ix_source_url_hash", text("md5(url)"), unique=False),
+        Index("ix_sources_created_at", "created_at"),
     )
 
+    # Document fields, read through the link so a source still looks like a single record.
+    @property
+    def url(self) -> str:
+        return self.document.url
+
+    @property
+    def title(self) -> str:
+        return self.document.title
+
+    @property
+    def snippet(self) -> Optional[str]:
+        return self.document.snippet
+
+    @property
+    def content(self) -> Optional[str]:
+        return self.document.content
+
+    @property
+    def domain_id(self) -> Optional[UUID]:
+        return self.document.domain_id
+
+    @property
+    def domain(self) -> Optional["DomainModel"]:
+        return self.document.domain
+
 
 class FeedbackModel(Base):
     __tablename__ = "feedback"
@@ -267,6 +334,9 @@ class ClaimConversationModel(Base):
         nullable=False,
         index=True,
     )
+    # Rolling summary of the turns that no longer fit in the LLM context window.
+    context_summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    summary_through: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     conversation: Mapped["ConversationModel"] = relationship(back_populates="claim_conversations")
     claim: Mapped["ClaimModel"] = relationship(back_populates="claim_conversations")
@@ -314,3 +384,57 @@ class MessageModel(Base):
         Index("idx_message_conversation_timestamp", conversation_id, timestamp.desc()),
         Index("idx_message_claim_conversation_timestamp", claim_conversation_id, timestamp.desc()),
     )
+
+
+class DailyClaimRollupModel(Base):
+    """Per-day, per-language dashboard aggregates, maintained by the rollup job.
+
+    claim_count counts analyzed claims by their creation day, while analysis_count
+    and veracity_sum cover claims whose latest completed analysis was created that day.
+    """
+
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    language: Mapped[str] = mapped_column(Text, nullable=False)
+    claim_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    analysis_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    veracity_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    source_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    term_counts: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+
+    __table_args__ = (Index("ix_daily_claim_rollups_day_language", "day", "language", unique=True),)
+
+
+class DailyDomainRollupModel(Base):
+    """Per-day, per-language count of sources retrieved from each domain."""
+
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    language: Mapped[str] = mapped_column(Text, nullable=False)
+    domain_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("domains.id", ondelete="CASCADE"), nullable=False
+    )
+    source_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_daily_domain_rollups_day_language_domain", "day", "language", "domain_id", unique=True),
+    )
+
+
+class RollupDirtyDayModel(Base):
+    """A day whose rollups must be recomputed, shared by every worker until the refresh catches up."""
+
+    day: Mapped[date] = mapped_column(Date, nullable=False, unique=True, index=True)
+
+
+class RolledUpDayModel(Base):
+    """A day whose rollups have been computed, even if it had no claims; other days are read live."""
+
+    day: Mapped[date] = mapped_column(Date, nullable=False, unique=True, index=True)
+
+
+class EmbeddingCacheModel(Base):
+    """Sentence embedding of a claim text, keyed by the hash of the normalized text and model name."""
+
+    __tablename__ = "embedding_cache"
+
+    text_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
+    embedding: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
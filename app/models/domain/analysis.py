@@ -2,8 +2,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
-import pickle
 
+from sqlalchemy import inspect
+
+from app.core.utils.log_probs import decode_log_probs, encode_log_probs
 from app.models.database.models import AnalysisModel, AnalysisStatus
 from app.models.domain.feedback import Feedback
 from app.models.domain.search import Search
@@ -12,7 +14,18 @@ from app.models.domain.search import Search
 @dataclass
 class LogProbsData:
     tokens: List[str]
-    probs: List[float]
+    probs: List[Optional[float]]
+
+    @classmethod
+    def from_model(cls, model: "AnalysisModel") -> Optional["LogProbsData"]:
+        """Decode log_probs if the (deferred) column was loaded with the model."""
+        if "log_probs" in inspect(model).unloaded or not model.log_probs:
+            return None
+        try:
+            tokens, probs = decode_log_probs(model.log_probs)
+        except ValueError:
+            return None
+        return cls(tokens=tokens, probs=probs)
 
 
 @dataclass
@@ -35,14 +48,6 @@ class Analysis:
     def from_model(cls, model: "AnalysisModel") -> "Analysis":
         """Create domain model from database model."""
 
-        log_probs_obj = None
-        if model.log_probs:
-            try:
-                log_probs_obj = pickle.loads(model.log_probs)
-            except Exception:
-                # Fallback in case unpickling fails (e.g., corrupt data)
-                log_probs_obj = None
-
         return cls(
             id=model.id,
             claim_id=model.claim_id,
@@ -52,7 +57,7 @@ class Analysis:
             status=model.status.value,
             created_at=model.created_at,
             updated_at=model.updated_at,
-            log_probs=log_probs_obj,
+            log_probs=LogProbsData.from_model(model),
             searches=[Search.from_model(s) for s in model.searches] if model.searches else None,
             feedback=[Feedback.from_model(f) for f in model.feedbacks] if model.feedbacks else None,
         )
@@ -61,13 +66,6 @@ class Analysis:
     def from_model_safe(cls, model: "AnalysisModel") -> "Analysis":
         """Create domain model from database model, explicitly ignoring relationships."""
 
-        log_probs_obj = None
-        if model.log_probs:
-            try:
-                log_probs_obj = pickle.loads(model.log_probs)
-            except Exception:
-                log_probs_obj = None
-
         return cls(
             id=model.id,
             claim_id=model.claim_id,
@@ -77,7 +75,7 @@ class Analysis:
             status=model.status.value,
             created_at=model.created_at,
             updated_at=model.updated_at,
-            log_probs=log_probs_obj,
+            log_probs=LogProbsData.from_model(model),
             # empty initalization (they are empty at creation)
             searches=None,
             feedback=None,
@@ -86,16 +84,16 @@ class Analysis:
     def to_model(self) -> "AnalysisModel":
         """Convert to database model."""
 
-        log_probs_bytes = None
-        if self.log_probs:
-            log_probs_bytes = pickle.dumps(self.log_probs)
-
-        return AnalysisModel(
+        model = AnalysisModel(
             id=self.id,
             claim_id=self.claim_id,
             veracity_score=self.veracity_score,
             confidence_score=self.confidence_score,
             analysis_text=self.analysis_text,
             status=AnalysisStatus(self.status),
-            log_probs=log_probs_bytes,
         )
+        # Left unset when not loaded so merging an update doesn't wipe the stored value.
+        if self.log_probs:
+            model.log_probs = encode_log_probs(self.log_probs.tokens, self.log_probs.probs)
+
+        return model
@@ -3,6 +3,7 @@ from datetime import datetime
 from uuid import UUID
 from typing import Optional, List
 
+from app.core.utils.embeddings import decode_embedding, encode_embedding
 from app.models.database.models import ClaimModel, ClaimStatus
 
 
@@ -34,7 +35,7 @@ class Claim:
             batch_post_id=model.batch_post_id,
             status=ClaimStatus(model.status),
             language=model.language,
-            embedding=model.embedding,
+            embedding=decode_embedding(model.embedding).tolist() if model.embedding is not None else None,
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
@@ -50,5 +51,5 @@ class Claim:
             batch_post_id=self.batch_post_id,
             status=ClaimStatus(self.status).value,
             language=self.language,
-            embedding=self.embedding,
+            embedding=encode_embedding(self.embedding),
         )
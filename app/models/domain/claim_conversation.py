@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 from uuid import UUID
 from datetime import datetime
 
@@ -14,6 +14,8 @@ class ClaimConversation:
     start_time: datetime
     status: str
     end_time: Optional[datetime] = None
+    context_summary: Optional[str] = None
+    summary_through: Optional[datetime] = None
 
     @classmethod
     def from_model(cls, model: "ClaimConversationModel") -> "ClaimConversation":
@@ -24,10 +26,12 @@ class ClaimConversation:
             start_time=model.start_time,
             end_time=model.end_time,
             status=model.status.value,
+            context_summary=model.context_summary,
+            summary_through=model.summary_through,
         )
 
     def to_model(self) -> "ClaimConversationModel":
-        return ClaimConversationModel(
+        model = ClaimConversationModel(
             id=self.id,
             conversation_id=self.conversation_id,
             claim_id=self.claim_id,
@@ -35,3 +39,25 @@ class ClaimConversation:
             end_time=self.end_time,
             status=ConversationStatus(self.status),
         )
+        # Only set when known, so merging a partially loaded object keeps the stored summary.
+        if self.context_summary is not None:
+            model.context_summary = self.context_summary
+            model.summary_through = self.summary_through
+        return model
+
+
+@dataclass
+class ClaimDiscussionContext:
+    """What a claim discussion reply needs: the claim conversation, its claim and the latest analysis scores."""
+
+    claim_conversation: ClaimConversation
+    claim_text: str
+    analysis_id: Optional[UUID] = None
+    veracity_score: Optional[float] = None
+    confidence_score: Optional[float] = None
+    analysis_updated_at: Optional[datetime] = None
+
+    @property
+    def version(self) -> Tuple[Optional[UUID], Optional[datetime], Optional[datetime]]:
+        """Changes whenever the latest analysis or the stored summary does; see get_discussion_version."""
+        return self.analysis_id, self.analysis_updated_at, self.claim_conversation.summary_through
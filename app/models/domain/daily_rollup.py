@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict
+
+from app.models.database.models import DailyClaimRollupModel
+
+
+@dataclass
+class DailyClaimRollup:
+    """Domain model for per-day dashboard aggregates."""
+
+    day: date
+    language: str
+    claim_count: int = 0
+    analysis_count: int = 0
+    veracity_sum: float = 0.0
+    source_count: int = 0
+    term_counts: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_model(cls, model: "DailyClaimRollupModel") -> "DailyClaimRollup":
+        """Create domain model from database model."""
+        return cls(
+            day=model.day,
+            language=model.language,
+            claim_count=model.claim_count,
+            analysis_count=model.analysis_count,
+            veracity_sum=model.veracity_sum,
+            source_count=model.source_count,
+            term_counts=model.term_counts or {},
+        )
+
+    def to_model(self) -> "DailyClaimRollupModel":
+        """Convert to database model."""
+        return DailyClaimRollupModel(
+            day=self.day,
+            language=self.language,
+            claim_count=self.claim_count,
+            analysis_count=self.analysis_count,
+            veracity_sum=self.veracity_sum,
+            source_count=self.source_count,
+            term_counts=self.term_counts,
+        )
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.core.utils.embeddings import decode_embedding, encode_embedding
+from app.models.database.models import EmbeddingCacheModel
+
+
+@dataclass
+class EmbeddingCacheEntry:
+    """Domain model for a cached text embedding."""
+
+    text_hash: str
+    embedding: np.ndarray
+
+    @classmethod
+    def from_model(cls, model: "EmbeddingCacheModel") -> "EmbeddingCacheEntry":
+        """Create domain model from database model."""
+        return cls(text_hash=model.text_hash, embedding=decode_embedding(model.embedding))
+
+    def to_model(self) -> "EmbeddingCacheModel":
+        """Convert to database model."""
+        return EmbeddingCacheModel(text_hash=self.text_hash, embedding=encode_embedding(self.embedding))
@@ -12,6 +12,7 @@ class Source:
 
     id: UUID
     search_id: UUID
+    document_id: UUID
     url: str
     title: str
     snippet: str
@@ -27,6 +28,7 @@ class Source:
         return cls(
             id=model.id,
             search_id=model.search_id,
+            document_id=model.document_id,
             url=model.url,
             title=model.title,
             snippet=model.snippet,
@@ -38,14 +40,10 @@ class Source:
         )
 
     def to_model(self) -> "SourceModel":
-        """Convert to database model."""
+        """Convert to database model; the document fields live on the shared source document."""
         return SourceModel(
             id=self.id,
             search_id=self.search_id,
-            url=self.url,
-            title=self.title,
-            snippet=self.snippet,
-            domain_id=self.domain_id,
-            content=self.content,
+            document_id=self.document_id,
             credibility_score=self.credibility_score,
         )
@@ -9,3 +9,9 @@ print("⏳ Downloading embedding model to build...")
 # 2. This triggers the download
 model = SentenceTransformer("all-MiniLM-L6-v2")
 print("✅ Model downloaded successfully.")
+
+# 3. Same for the tokenizer used to budget LLM context (cached under TIKTOKEN_CACHE_DIR)
+import tiktoken  # noqa: E402
+
+tiktoken.get_encoding("cl100k_base")
+print("✅ Tokenizer downloaded successfully.")
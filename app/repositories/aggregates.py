@@ -0,0 +1,39 @@
+import enum
+
+from sqlalchemy import func, literal_column, select, tuple_
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.database.models import AnalysisModel, AnalysisStatus
+
+
+class AggregationPeriod(str, enum.Enum):
+    day = "day"
+    week = "week"
+
+
+def date_bucket(column: ColumnElement, period: AggregationPeriod) -> ColumnElement:
+    """Truncate a timestamp column to the start of its day/week bucket.
+
+    The period is rendered inline rather than as a bind parameter so the same
+    expression can be repeated in SELECT and GROUP BY.
+    """
+    return func.date_trunc(literal_column(f"'{AggregationPeriod(period).value}'"), column)
+
+
+def is_latest_completed_analysis(analysis=AnalysisModel) -> ColumnElement:
+    """True for the newest completed analysis of its claim, by created_at then id.
+
+    Shared by the live and rollup dashboard queries so both count the same analysis for each
+    claim, in the day of its created_at, whatever date range is asked for.
+    """
+    later = aliased(AnalysisModel)
+    return ~(
+        select(later.id)
+        .where(
+            later.claim_id == analysis.claim_id,
+            later.status == AnalysisStatus.completed,
+            tuple_(later.created_at, later.id) > tuple_(analysis.created_at, analysis.id),
+        )
+        .exists()
+    )
@@ -1,14 +1,15 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
-from sqlalchemy import desc, select, and_
+from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
 from datetime import datetime
 
-from app.models.database.models import AnalysisModel, AnalysisStatus, SearchModel
-from app.models.domain.analysis import Analysis
+from app.models.database.models import AnalysisModel, AnalysisStatus, ClaimModel, SearchModel
+from app.models.domain.analysis import Analysis, LogProbsData
 from app.models.domain.feedback import Feedback
 from app.models.domain.search import Search
+from app.repositories.aggregates import AggregationPeriod, date_bucket, is_latest_completed_analysis
 from app.repositories.base import BaseRepository
 
 
@@ -34,7 +35,20 @@ class AnalysisRepository(BaseRepository[AnalysisModel, Analysis]):
 
         return self._to_domain(model)
 
-    async def get_with_relations(self, analysis_id: UUID) -> Optional[Analysis]:
+    def _with_log_probs(self, query, include_log_probs: bool):
+        """Load the deferred log_probs column only when the caller needs it."""
+        return query.options(undefer(self._model_class.log_probs)) if include_log_probs else query
+
+    async def get(self, analysis_id: UUID, include_log_probs: bool = False) -> Optional[Analysis]:
+        """Get analysis by ID."""
+        query = self._with_log_probs(
+            select(self._model_class).where(self._model_class.id == analysis_id), include_log_probs
+        )
+        result = await self._session.execute(query)
+        model = result.scalar_one_or_none()
+        return self._to_domain(model) if model else None
+
+    async def get_with_relations(self, analysis_id: UUID, include_log_probs: bool = False) -> Optional[Analysis]:
         """Get analysis with related sources and feedback."""
         query = (
             select(self._model_class)
@@ -44,6 +58,7 @@ class AnalysisRepository(BaseRepository[AnalysisModel, Analysis]):
                 selectinload(self._model_class.feedbacks),
             )
         )
+        query = self._with_log_probs(query, include_log_probs)
 
         result = await self._session.execute(query)
         model = result.scalar_one_or_none()
@@ -61,9 +76,11 @@ class AnalysisRepository(BaseRepository[AnalysisModel, Analysis]):
         include_searches: bool = False,
         include_sources: bool = False,
         include_feedback: bool = False,
+        include_log_probs: bool = False,
     ) -> List[Analysis]:
         """Get all analyses for a claim."""
         query = select(self._model_class).where(self._model_class.claim_id == claim_id)
+        query = self._with_log_probs(query, include_log_probs)
 
         if include_sources or include_searches or include_feedback:
             if include_searches:
@@ -87,6 +104,7 @@ class AnalysisRepository(BaseRepository[AnalysisModel, Analysis]):
                     status=model.status.value,
                     created_at=model.created_at,
                     updated_at=model.updated_at,
+                    log_probs=LogProbsData.from_model(model),
                     searches=(
                         [Search.from_model(s) for s in model.searches] if include_searches and model.searches else None
                     ),
@@ -125,6 +143,7 @@ class AnalysisRepository(BaseRepository[AnalysisModel, Analysis]):
         include_searches: bool = False,
         include_sources: bool = False,
         include_feedback: bool = False,
+        include_log_probs: bool = False,
     ) -> Optional[Analysis]:
         """Get the most recent analysis for a claim."""
         query = (
@@ -133,6 +152,7 @@ class AnalysisRepository(BaseRepository[AnalysisModel, Analysis]):
             .order_by(desc(self._model_class.created_at))
             .limit(1)
         )
+        query = self._with_log_probs(query, include_log_probs)
 
         if include_searches:
             if include_sources:
@@ -160,9 +180,10 @@ class AnalysisRepository(BaseRepository[AnalysisModel, Analysis]):
                 status=model.status.value,
                 created_at=model.created_at,
                 updated_at=model.updated_at,
-                searches=[Search.from_model(s) for s in model.searches]
-                if include_searches and model.searches
-                else None,
+                log_probs=LogProbsData.from_model(model),
+                searches=(
+                    [Search.from_model(s) for s in model.searches] if include_searches and model.searches else None
+                ),
                 feedback=(
                     [Feedback.from_model(f) for f in model.feedbacks] if include_feedback and model.feedbacks else None
                 ),
@@ -170,13 +191,58 @@ class AnalysisRepository(BaseRepository[AnalysisModel, Analysis]):
         else:
             return self._to_domain(model)
 
-    async def get_analysis_in_date_range(self, start_date: datetime, end_date: datetime) -> List[Analysis]:
-        stmt = select(self._model_class).where(
-            and_(
+    async def get_previous_completed_created_at(self, claim_id: UUID, analysis_id: UUID) -> Optional[datetime]:
+        """Creation time of the newest completed analysis of a claim other than analysis_id, if any."""
+        query = select(func.max(self._model_class.created_at)).where(
+            self._model_class.claim_id == claim_id,
+            self._model_class.status == AnalysisStatus.completed,
+            self._model_class.id != analysis_id,
+        )
+        result = await self._session.execute(query)
+        return result.scalar_one()
+
+    def _latest_completed_per_claim(self, start_date: datetime, end_date: datetime, language: str):
+        """Completed analyses created in the range that are their claim's latest, in the given language, as a subquery."""
+        return (
+            select(
+                self._model_class.claim_id,
+                self._model_class.veracity_score,
+                self._model_class.created_at,
+            )
+            .join(ClaimModel, ClaimModel.id == self._model_class.claim_id)
+            .where(
+                self._model_class.status == AnalysisStatus.completed,
                 self._model_class.created_at >= start_date,
                 self._model_class.created_at <= end_date,
-                self._model_class.status == AnalysisStatus.completed,
+                ClaimModel.language == language,
+                is_latest_completed_analysis(self._model_class),
             )
+            .subquery()
         )
-        result = await self._session.execute(stmt)
-        return [self._to_domain(model) for model in result.scalars().all()]
+
+    async def get_average_latest_veracity(
+        self, start_date: datetime, end_date: datetime, language: str
+    ) -> Tuple[Optional[float], int]:
+        """Average veracity over the latest analysis of each claim, and the number of claims averaged."""
+        latest = self._latest_completed_per_claim(start_date, end_date, language)
+        query = select(func.avg(latest.c.veracity_score), func.count()).select_from(latest)
+
+        result = await self._session.execute(query)
+        average, count = result.one()
+        return average, count
+
+    async def get_average_latest_veracity_by_period(
+        self, start_date: datetime, end_date: datetime, language: str, period: AggregationPeriod
+    ) -> List[Tuple[datetime, float, int]]:
+        """Same as get_average_latest_veracity, bucketed by the day or week of the analysis."""
+        latest = self._latest_completed_per_claim(start_date, end_date, language)
+        bucket = date_bucket(latest.c.created_at, period)
+        query = (
+            select(bucket, func.avg(latest.c.veracity_score), func.count())
+            .select_from(latest)
+            .group_by(bucket)
+            .order_by(bucket)
+        )
+
+        result = await self._session.execute(query)
+        return [(row[0], row[1], row[2]) for row in result.all()]
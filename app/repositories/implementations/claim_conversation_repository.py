@@ -1,10 +1,11 @@
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple
 from uuid import UUID
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, true, update
 from sqlalchemy.orm import joinedload
 
-from app.models.database.models import ClaimConversationModel, ConversationModel
-from app.models.domain.claim_conversation import ClaimConversation
+from app.models.database.models import AnalysisModel, ClaimConversationModel, ClaimModel, ConversationModel
+from app.models.domain.claim_conversation import ClaimConversation, ClaimDiscussionContext
 from app.repositories.base import BaseRepository
 
 
@@ -13,7 +14,7 @@ class ClaimConversationRepository(BaseRepository[ClaimConversationModel, ClaimCo
         super().__init__(session, ClaimConversationModel)
 
     def _to_model(self, claim_conv: ClaimConversation) -> ClaimConversationModel:
-        return ClaimConversationModel(
+        model = ClaimConversationModel(
             id=claim_conv.id,
             conversation_id=claim_conv.conversation_id,
             claim_id=claim_conv.claim_id,
@@ -21,6 +22,10 @@ class ClaimConversationRepository(BaseRepository[ClaimConversationModel, ClaimCo
             end_time=claim_conv.end_time,
             status=claim_conv.status,
         )
+        if claim_conv.context_summary is not None:
+            model.context_summary = claim_conv.context_summary
+            model.summary_through = claim_conv.summary_through
+        return model
 
     def _to_domain(self, model: ClaimConversationModel) -> ClaimConversation:
         return ClaimConversation(
@@ -30,6 +35,8 @@ class ClaimConversationRepository(BaseRepository[ClaimConversationModel, ClaimCo
             start_time=model.start_time,
             end_time=model.end_time,
             status=model.status,
+            context_summary=model.context_summary,
+            summary_through=model.summary_through,
         )
 
     async def get_with_conversation(self, claim_conversation_id: UUID) -> Optional[ClaimConversationModel]:
@@ -66,3 +73,102 @@ class ClaimConversationRepository(BaseRepository[ClaimConversationModel, ClaimCo
         result = await self._session.execute(query)
         model = result.scalar_one_or_none()
         return self._to_domain(model) if model else None
+
+    async def update_summary(self, claim_conversation_id: UUID, summary: str, summary_through: datetime) -> None:
+        """Store the rolling context summary, covering messages up to summary_through."""
+        query = (
+            update(self._model_class)
+            .where(self._model_class.id == claim_conversation_id)
+            .values(context_summary=summary, summary_through=summary_through)
+        )
+        await self._session.execute(query)
+        await self._session.commit()
+
+    def _latest_analysis(self):
+        """Latest analysis of the joined claim, as a lateral subquery."""
+        return (
+            select(
+                AnalysisModel.id,
+                AnalysisModel.veracity_score,
+                AnalysisModel.confidence_score,
+                AnalysisModel.updated_at,
+            )
+            .where(AnalysisModel.claim_id == ClaimModel.id)
+            .order_by(AnalysisModel.created_at.desc())
+            .limit(1)
+            .lateral("latest_analysis")
+        )
+
+    def _owned_discussion(
+        self, query, claim_conversation_id: UUID, conversation_id: UUID, claim_id: UUID, user_id: UUID
+    ):
+        """Restrict a query to the claim conversation, if it belongs to the conversation, claim and user."""
+        return (
+            query.join(ConversationModel, ConversationModel.id == self._model_class.conversation_id)
+            .join(ClaimModel, ClaimModel.id == self._model_class.claim_id)
+            .where(
+                self._model_class.id == claim_conversation_id,
+                self._model_class.conversation_id == conversation_id,
+                self._model_class.claim_id == claim_id,
+                ConversationModel.user_id == user_id,
+            )
+        )
+
+    async def get_discussion_context(
+        self, claim_conversation_id: UUID, conversation_id: UUID, claim_id: UUID, user_id: UUID
+    ) -> Optional[ClaimDiscussionContext]:
+        """
+        Claim conversation, claim text and latest analysis scores in one query.
+
+        Returns None unless the claim conversation belongs to conversation_id and claim_id and the
+        conversation belongs to user_id. The analysis fields are None when the claim has no analysis.
+        """
+        latest_analysis = self._latest_analysis()
+        query = self._owned_discussion(
+            select(
+                self._model_class,
+                ClaimModel.claim_text,
+                latest_analysis.c.id,
+                latest_analysis.c.veracity_score,
+                latest_analysis.c.confidence_score,
+                latest_analysis.c.updated_at,
+            ),
+            claim_conversation_id,
+            conversation_id,
+            claim_id,
+            user_id,
+        ).outerjoin(latest_analysis, true())
+        result = await self._session.execute(query)
+        row = result.one_or_none()
+        if row is None:
+            return None
+
+        model, claim_text, analysis_id, veracity_score, confidence_score, analysis_updated_at = row
+        return ClaimDiscussionContext(
+            claim_conversation=self._to_domain(model),
+            claim_text=claim_text,
+            analysis_id=analysis_id,
+            veracity_score=veracity_score,
+            confidence_score=confidence_score,
+            analysis_updated_at=analysis_updated_at,
+        )
+
+    async def get_discussion_version(
+        self, claim_conversation_id: UUID, conversation_id: UUID, claim_id: UUID, user_id: UUID
+    ) -> Optional[Tuple[Optional[UUID], Optional[datetime], Optional[datetime]]]:
+        """
+        Ownership check plus ClaimDiscussionContext.version, without loading the discussion.
+
+        Returns None when get_discussion_context would; lets a cached context be revalidated cheaply.
+        """
+        latest_analysis = self._latest_analysis()
+        query = self._owned_discussion(
+            select(latest_analysis.c.id, latest_analysis.c.updated_at, self._model_class.summary_through),
+            claim_conversation_id,
+            conversation_id,
+            claim_id,
+            user_id,
+        ).outerjoin(latest_analysis, true())
+        result = await self._session.execute(query)
+        row = result.one_or_none()
+        return (row[0], row[1], row[2]) if row else None
@@ -1,12 +1,15 @@
 import logging
-from typing import Optional, List, Tuple
+from typing import AsyncIterator, Optional, List, Tuple
 from uuid import UUID
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, UTC
+import numpy as np
 
+from app.core.utils.embeddings import decode_embedding, decode_embeddings, encode_embedding
 from app.models.database.models import ClaimModel, ClaimStatus
 from app.models.domain.claim import Claim
+from app.repositories.aggregates import AggregationPeriod, date_bucket
 from app.repositories.base import BaseRepository
 from app.repositories.interfaces.claim_repository import ClaimRepositoryInterface
 
@@ -26,7 +29,7 @@ class ClaimRepository(BaseRepository[ClaimModel, Claim], ClaimRepositoryInterfac
             batch_user_id=claim.batch_user_id,
             batch_post_id=claim.batch_post_id,
             language=claim.language,
-            embedding=claim.embedding,
+            embedding=encode_embedding(claim.embedding),
             status=ClaimStatus(claim.status).value,
         )
 
@@ -39,7 +42,7 @@ class ClaimRepository(BaseRepository[ClaimModel, Claim], ClaimRepositoryInterfac
             language=model.language,
             batch_user_id=model.batch_user_id,
             batch_post_id=model.batch_post_id,
-            embedding=model.embedding,
+            embedding=decode_embedding(model.embedding).tolist() if model.embedding is not None else None,
             status=ClaimStatus(model.status),
             created_at=model.created_at,
             updated_at=model.updated_at,
@@ -82,17 +85,83 @@ class ClaimRepository(BaseRepository[ClaimModel, Claim], ClaimRepositoryInterfac
             logger.exception("Error updating claim status")
             raise
 
-    async def get_claims_in_date_range(self, start_date: datetime, end_date: datetime, language: str) -> List[Claim]:
-        stmt = select(self._model_class).where(
-            and_(
-                self._model_class.created_at >= start_date,
-                self._model_class.created_at <= end_date,
-                self._model_class.status == ClaimStatus.analyzed,
-                self._model_class.language == language,
+    def _analyzed_in_date_range(self, start_date: datetime, end_date: datetime, language: str):
+        """Filter matching ix_claims_language_status_created_at."""
+        return and_(
+            self._model_class.language == language,
+            self._model_class.status == ClaimStatus.analyzed,
+            self._model_class.created_at >= start_date,
+            self._model_class.created_at <= end_date,
+        )
+
+    async def stream_claim_texts_in_date_range(
+        self, start_date: datetime, end_date: datetime, language: str, batch_size: int = 1000
+    ) -> AsyncIterator[List[str]]:
+        """Text of analyzed claims in a date range, in batches read through a server-side cursor."""
+        stmt = select(self._model_class.claim_text).where(self._analyzed_in_date_range(start_date, end_date, language))
+        result = await self._session.stream_scalars(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.partitions(batch_size):
+            yield list(partition)
+
+    async def stream_claim_embeddings_in_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        language: str,
+        limit: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Tuple[List[str], np.ndarray]]:
+        """
+        Text and embedding of analyzed claims in a date range that have an embedding, newest first.
+
+        Yields batches of up to batch_size texts with their float32 embedding matrix, so callers
+        can reduce each batch instead of holding every embedding of a wide range at once.
+        """
+        stmt = (
+            select(self._model_class.claim_text, self._model_class.embedding)
+            .where(
+                self._analyzed_in_date_range(start_date, end_date, language),
+                self._model_class.embedding.is_not(None),
             )
+            .order_by(self._model_class.created_at.desc())
+            .limit(limit)
         )
-        result = await self._session.execute(stmt)
-        return [self._to_domain(claim) for claim in result.scalars().all()]
+        result = await self._session.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.partitions(batch_size):
+            yield [claim_text for claim_text, _ in partition], decode_embeddings(
+                [embedding for _, embedding in partition]
+            )
+
+    async def stream_embeddings(self, batch_size: int = 1000) -> AsyncIterator[np.ndarray]:
+        """Every stored claim embedding as float32 matrices of up to batch_size rows."""
+        stmt = select(self._model_class.embedding).where(self._model_class.embedding.is_not(None))
+        result = await self._session.stream_scalars(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.partitions(batch_size):
+            yield decode_embeddings(partition)
+
+    async def count_claims_in_date_range(self, start_date: datetime, end_date: datetime, language: str) -> int:
+        """Count analyzed claims in a date range without loading them."""
+        query = (
+            select(func.count())
+            .select_from(self._model_class)
+            .where(self._analyzed_in_date_range(start_date, end_date, language))
+        )
+        result = await self._session.execute(query)
+        return result.scalar_one()
+
+    async def count_claims_by_period(
+        self, start_date: datetime, end_date: datetime, language: str, period: AggregationPeriod
+    ) -> List[Tuple[datetime, int]]:
+        """Count analyzed claims in a date range, grouped by day or week."""
+        bucket = date_bucket(self._model_class.created_at, period)
+        query = (
+            select(bucket, func.count())
+            .where(self._analyzed_in_date_range(start_date, end_date, language))
+            .group_by(bucket)
+            .order_by(bucket)
+        )
+        result = await self._session.execute(query)
+        return [(row[0], row[1]) for row in result.all()]
 
     async def get_monthly_claim_count(self, user_id: str) -> int:
         """Counts how many claims a user has created this month."""
@@ -110,6 +179,44 @@ class ClaimRepository(BaseRepository[ClaimModel, Claim], ClaimRepositoryInterfac
         result = await self._session.execute(query)
         return result.scalar_one()
 
+    async def get_claim_texts_by_ids(self, claim_ids: List[UUID], user_id: UUID) -> List[Tuple[UUID, str]]:
+        """(id, claim_text) of the given claims that belong to the user."""
+        stmt = select(self._model_class.id, self._model_class.claim_text).where(
+            self._model_class.id.in_(claim_ids), self._model_class.user_id == user_id
+        )
+        result = await self._session.execute(stmt)
+        return [(claim_id, claim_text) for claim_id, claim_text in result.all()]
+
+    async def get_claims_without_embedding(self, limit: int) -> List[Tuple[UUID, str]]:
+        """(id, claim_text) of up to limit claims that have no embedding yet, oldest first."""
+        stmt = (
+            select(self._model_class.id, self._model_class.claim_text)
+            .where(self._model_class.embedding.is_(None))
+            .order_by(self._model_class.created_at)
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return [(claim_id, claim_text) for claim_id, claim_text in result.all()]
+
+    async def update_embeddings(self, embeddings: List[Tuple[UUID, List[float]]]) -> int:
+        """Store many embeddings with one executemany UPDATE."""
+        if not embeddings:
+            return 0
+        now = datetime.now(UTC)
+        try:
+            await self._session.execute(
+                update(self._model_class),
+                [
+                    {"id": claim_id, "embedding": encode_embedding(embedding), "updated_at": now}
+                    for claim_id, embedding in embeddings
+                ],
+            )
+            await self._session.commit()
+            return len(embeddings)
+        except Exception as e:
+            await self._session.rollback()
+            raise e
+
     async def insert_many(self, claim: List[Claim]) -> List[Claim]:
         models = [self._to_model(claim) for claim in claim]
         self._session.add_all(models)
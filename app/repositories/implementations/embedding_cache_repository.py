@@ -0,0 +1,60 @@
+from datetime import UTC, datetime
+from typing import Dict, List
+import uuid
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.utils.embeddings import decode_embedding, encode_embedding
+from app.models.database.models import EmbeddingCacheModel
+from app.models.domain.embedding_cache import EmbeddingCacheEntry
+from app.repositories.base import BaseRepository
+
+
+class EmbeddingCacheRepository(BaseRepository[EmbeddingCacheModel, EmbeddingCacheEntry]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, EmbeddingCacheModel)
+
+    def _to_model(self, entry: EmbeddingCacheEntry) -> EmbeddingCacheModel:
+        return entry.to_model()
+
+    def _to_domain(self, model: EmbeddingCacheModel) -> EmbeddingCacheEntry:
+        return EmbeddingCacheEntry.from_model(model)
+
+    async def get_many(self, text_hashes: List[str]) -> Dict[str, np.ndarray]:
+        """Cached embeddings for the given text hashes; hashes without an entry are omitted."""
+        if not text_hashes:
+            return {}
+
+        query = select(self._model_class.text_hash, self._model_class.embedding).where(
+            self._model_class.text_hash.in_(text_hashes)
+        )
+        result = await self._session.execute(query)
+        return {text_hash: decode_embedding(embedding) for text_hash, embedding in result.all()}
+
+    async def put_many(self, embeddings: Dict[str, np.ndarray]) -> None:
+        """Store embeddings by text hash, leaving existing entries untouched."""
+        if not embeddings:
+            return
+
+        now = datetime.now(UTC)
+        query = (
+            insert(self._model_class)
+            .values(
+                [
+                    {
+                        "id": uuid.uuid4(),
+                        "text_hash": text_hash,
+                        "embedding": encode_embedding(embedding),
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for text_hash, embedding in sorted(embeddings.items(), key=lambda item: item[0])
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=[self._model_class.text_hash])
+        )
+        await self._session.execute(query)
+        await self._session.commit()
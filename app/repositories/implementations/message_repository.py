@@ -67,3 +67,11 @@ class MessageRepository(BaseRepository[MessageModel, Message], MessageRepository
 
         result = await self._session.execute(query)
         return [self._to_domain(model) for model in result.scalars().all()]
+
+    async def insert_many(self, messages: List[Message]) -> List[Message]:
+        """Create several messages in one commit."""
+        models = [self._to_model(message) for message in messages]
+        self._session.add_all(models)
+        await self._session.flush()
+        await self._session.commit()
+        return [self._to_domain(model) for model in models]
@@ -0,0 +1,227 @@
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.database.models import (
+    AnalysisModel,
+    AnalysisStatus,
+    ClaimModel,
+    ClaimStatus,
+    DailyClaimRollupModel,
+    DailyDomainRollupModel,
+    DomainModel,
+    RolledUpDayModel,
+    RollupDirtyDayModel,
+    SearchModel,
+    SourceDocumentModel,
+    SourceModel,
+)
+from app.models.domain.daily_rollup import DailyClaimRollup
+from app.repositories.aggregates import is_latest_completed_analysis
+from app.repositories.base import BaseRepository
+
+# With the day's ordinal, serializes concurrent refreshes of the same day from several workers.
+ROLLUP_LOCK_KEY = 7_291_004
+
+
+class RollupRepository(BaseRepository[DailyClaimRollupModel, DailyClaimRollup]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, DailyClaimRollupModel)
+
+    def _to_model(self, rollup: DailyClaimRollup) -> DailyClaimRollupModel:
+        return rollup.to_model()
+
+    def _to_domain(self, model: DailyClaimRollupModel) -> DailyClaimRollup:
+        return DailyClaimRollup.from_model(model)
+
+    async def get_claim_rollups(self, start_day: date, end_day: date, language: str) -> List[DailyClaimRollup]:
+        """Rollups for the days in [start_day, end_day)."""
+        query = (
+            select(self._model_class)
+            .where(
+                self._model_class.language == language,
+                self._model_class.day >= start_day,
+                self._model_class.day < end_day,
+            )
+            .order_by(self._model_class.day)
+        )
+        result = await self._session.execute(query)
+        return [self._to_domain(model) for model in result.scalars().all()]
+
+    async def get_rolled_up_days(self, start_day: date, end_day: date) -> List[date]:
+        """Days in [start_day, end_day) whose rollups have been computed."""
+        query = select(RolledUpDayModel.day).where(RolledUpDayModel.day >= start_day, RolledUpDayModel.day < end_day)
+        result = await self._session.execute(query)
+        return list(result.scalars().all())
+
+    async def get_rollups_updated_at(self, start_day: date, end_day: date) -> Optional[datetime]:
+        """When a day in [start_day, end_day) was last rolled up, if any has been."""
+        query = select(func.max(RolledUpDayModel.updated_at)).where(
+            RolledUpDayModel.day >= start_day, RolledUpDayModel.day < end_day
+        )
+        result = await self._session.execute(query)
+        return result.scalar_one()
+
+    async def get_domain_counts(
+        self, start_day: date, end_day: date, language: str
+    ) -> List[Tuple[str, Optional[float], int]]:
+        """Sources retrieved per domain over [start_day, end_day), as (domain_name, credibility_score, count)."""
+        source_count = func.sum(DailyDomainRollupModel.source_count)
+        query = (
+            select(DomainModel.domain_name, DomainModel.credibility_score, source_count)
+            .join(DomainModel, DomainModel.id == DailyDomainRollupModel.domain_id)
+            .where(
+                DailyDomainRollupModel.language == language,
+                DailyDomainRollupModel.day >= start_day,
+                DailyDomainRollupModel.day < end_day,
+            )
+            .group_by(DomainModel.id)
+        )
+        result = await self._session.execute(query)
+        return [(row[0], row[1], int(row[2])) for row in result.all()]
+
+    async def compute_claim_counts(self, start: datetime, end: datetime) -> Dict[str, int]:
+        """Analyzed claims created in [start, end), per language."""
+        query = (
+            select(ClaimModel.language, func.count())
+            .where(
+                ClaimModel.status == ClaimStatus.analyzed,
+                ClaimModel.created_at >= start,
+                ClaimModel.created_at < end,
+            )
+            .group_by(ClaimModel.language)
+        )
+        result = await self._session.execute(query)
+        return {language: count for language, count in result.all()}
+
+    async def compute_latest_veracity(self, start: datetime, end: datetime) -> Dict[str, Tuple[int, float]]:
+        """(count, veracity sum) of claims whose latest completed analysis was created in [start, end)."""
+        query = (
+            select(ClaimModel.language, func.count(), func.sum(AnalysisModel.veracity_score))
+            .join(ClaimModel, ClaimModel.id == AnalysisModel.claim_id)
+            .where(
+                AnalysisModel.status == AnalysisStatus.completed,
+                AnalysisModel.created_at >= start,
+                AnalysisModel.created_at < end,
+                is_latest_completed_analysis(AnalysisModel),
+            )
+            .group_by(ClaimModel.language)
+        )
+        result = await self._session.execute(query)
+        return {language: (count, veracity_sum or 0.0) for language, count, veracity_sum in result.all()}
+
+    def _sources_by_language(self, query, start: datetime, end: datetime):
+        return (
+            query.join(SearchModel, SourceModel.search_id == SearchModel.id)
+            .join(AnalysisModel, SearchModel.analysis_id == AnalysisModel.id)
+            .join(ClaimModel, AnalysisModel.claim_id == ClaimModel.id)
+            .where(SourceModel.created_at >= start, SourceModel.created_at < end)
+        )
+
+    async def compute_source_counts(self, start: datetime, end: datetime) -> Dict[str, int]:
+        """Sources retrieved in [start, end), per claim language."""
+        query = self._sources_by_language(
+            select(ClaimModel.language, func.count(SourceModel.id)).select_from(SourceModel), start, end
+        ).group_by(ClaimModel.language)
+        result = await self._session.execute(query)
+        return {language: count for language, count in result.all()}
+
+    async def compute_domain_counts(self, start: datetime, end: datetime) -> List[Tuple[str, UUID, int]]:
+        """Sources retrieved in [start, end), per claim language and domain."""
+        query = (
+            self._sources_by_language(
+                select(ClaimModel.language, SourceDocumentModel.domain_id, func.count(SourceModel.id)).select_from(
+                    SourceModel
+                ),
+                start,
+                end,
+            )
+            .join(SourceDocumentModel, SourceModel.document_id == SourceDocumentModel.id)
+            .where(SourceDocumentModel.domain_id.is_not(None))
+            .group_by(ClaimModel.language, SourceDocumentModel.domain_id)
+        )
+        result = await self._session.execute(query)
+        return [(language, domain_id, count) for language, domain_id, count in result.all()]
+
+    async def get_claim_texts(self, start: datetime, end: datetime) -> List[Tuple[str, str]]:
+        """(language, claim_text) of analyzed claims created in [start, end)."""
+        query = select(ClaimModel.language, ClaimModel.claim_text).where(
+            ClaimModel.status == ClaimStatus.analyzed,
+            ClaimModel.created_at >= start,
+            ClaimModel.created_at < end,
+        )
+        result = await self._session.execute(query)
+        return [(language, claim_text) for language, claim_text in result.all()]
+
+    async def lock_day(self, day: date) -> None:
+        """
+        Take the day's refresh lock for the current transaction.
+
+        Taken before the day is computed and held until replace_day commits, so a refresh that read
+        older data can never write after one that read newer data.
+        """
+        await self._session.execute(select(func.pg_advisory_xact_lock(ROLLUP_LOCK_KEY, day.toordinal())))
+
+    async def release_day(self) -> None:
+        """Roll back a refresh that failed before replace_day, releasing the day's lock."""
+        await self._session.rollback()
+
+    async def replace_day(
+        self, day: date, rollups: List[DailyClaimRollup], domain_counts: List[Tuple[str, UUID, int]]
+    ) -> None:
+        """Atomically replace every rollup row of a day, committing and releasing the day's lock."""
+        try:
+            await self._session.execute(delete(DailyDomainRollupModel).where(DailyDomainRollupModel.day == day))
+            await self._session.execute(delete(self._model_class).where(self._model_class.day == day))
+
+            self._session.add_all([self._to_model(rollup) for rollup in rollups])
+            self._session.add_all(
+                [
+                    DailyDomainRollupModel(day=day, language=language, domain_id=domain_id, source_count=count)
+                    for language, domain_id, count in domain_counts
+                ]
+            )
+            await self._session.execute(
+                insert(RolledUpDayModel)
+                .values(day=day, created_at=func.now(), updated_at=func.now())
+                .on_conflict_do_update(index_elements=["day"], set_={"updated_at": func.now()})
+            )
+            await self._session.commit()
+        except Exception as e:
+            await self._session.rollback()
+            raise e
+
+    async def mark_dirty(self, days: Iterable[date]) -> None:
+        """Record days to recompute; re-marking a pending day moves its mark forward."""
+        days = sorted(set(days))
+        if not days:
+            return
+        try:
+            # Database time on both paths, so clear_dirty_day compares marks from every worker consistently.
+            query = insert(RollupDirtyDayModel).values(
+                [{"day": day, "created_at": func.now(), "updated_at": func.now()} for day in days]
+            )
+            query = query.on_conflict_do_update(index_elements=["day"], set_={"updated_at": func.now()})
+            await self._session.execute(query)
+            await self._session.commit()
+        except Exception as e:
+            await self._session.rollback()
+            raise e
+
+    async def get_dirty_days(self) -> List[Tuple[date, datetime]]:
+        """Pending days with the time they were last marked."""
+        query = select(RollupDirtyDayModel.day, RollupDirtyDayModel.updated_at).order_by(RollupDirtyDayModel.day)
+        result = await self._session.execute(query)
+        return [(day, marked_at) for day, marked_at in result.all()]
+
+    async def clear_dirty_day(self, day: date, marked_at: datetime) -> None:
+        """Drop a day's mark unless it was marked again after marked_at, while it was being refreshed."""
+        await self._session.execute(
+            delete(RollupDirtyDayModel).where(
+                RollupDirtyDayModel.day == day, RollupDirtyDayModel.updated_at <= marked_at
+            )
+        )
+        await self._session.commit()
@@ -1,36 +1,48 @@
-from typing import Optional, List
-from uuid import UUID
-from sqlalchemy import select, desc
-from sqlalchemy.orm import selectinload
+import hashlib
+from typing import Dict, Optional, List, Tuple
+from uuid import UUID, uuid4
+from sqlalchemy import REAL, cast, literal_column, select, desc, func, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import contains_eager, defer, joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
 from app.models.domain.source import Source
 from app.repositories.base import BaseRepository
-from app.models.database.models import SourceModel, SearchModel, AnalysisModel, ClaimModel
+from app.models.database.models import (
+    SOURCE_SEARCH_CONFIG,
+    SourceDocumentModel,
+    SourceModel,
+    SearchModel,
+    AnalysisModel,
+    ClaimModel,
+    DomainModel,
+)
+
+
+def _url_hash(url: str) -> str:
+    """Hex md5 of a URL, as computed by Postgres md5(url) for the document URL index."""
+    return hashlib.md5(url.encode()).hexdigest()
+
+
+def _with_document():
+    """
+    Populate sources' documents from the join already in the query, and their domains.
+
+    The page content is not part of listings and is left unloaded.
+    """
+    return contains_eager(SourceModel.document).options(
+        defer(SourceDocumentModel.content), joinedload(SourceDocumentModel.domain)
+    )
 
 
 class SourceRepository(BaseRepository[SourceModel, Source]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, SourceModel)
 
-    async def get_by_url(self, url: str) -> Optional[SourceModel]:
-        """Get a source by its URL."""
-        query = (
-            select(self._model_class)
-            .where(self._model_class.url == url)
-            .order_by(desc(self._model_class.created_at))
-            .options(selectinload(self._model_class.domain))
-        )
-        result = await self._session.execute(query)
-        return result.scalars().first()
-
     async def get_by_search(self, search_id: UUID, include_domain: bool = True) -> List[SourceModel]:
         query = select(self._model_class).where(self._model_class.search_id == search_id)
 
-        if include_domain:
-            query = query.options(selectinload(self._model_class.domain))
-
         result = await self._session.execute(query)
         sources = list(result.scalars().all())
 
@@ -39,40 +51,196 @@ class SourceRepository(BaseRepository[SourceModel, Source]):
 
         return sources
 
-    async def create_with_domain(self, source: SourceModel) -> Optional[SourceModel]:
-        """Create a source with its domain relationship."""
-        try:
-            self._session.add(source)
-            await self._session.flush()
-            await self._session.refresh(source, ["domain"])
-            await self._session.commit()
-            return source
-        except Exception as e:
-            await self._session.rollback()
-            raise e
+    async def create_for_search(
+        self, search_id: UUID, results: List[Tuple[SourceDocumentModel, Optional[float]]]
+    ) -> List[SourceModel]:
+        """
+        Link a search to its results, as (document, credibility_score) pairs, reusing stored documents.
+
+        Documents are inserted with ON CONFLICT DO NOTHING on the URL hash, so a URL returned by any
+        earlier or concurrent search keeps its one row and fetched content; each result then only
+        adds a link row. Results repeating a URL within the search are linked once.
+        """
+        first_by_url: Dict[str, Tuple[SourceDocumentModel, Optional[float]]] = {}
+        for document, credibility_score in results:
+            first_by_url.setdefault(document.url, (document, credibility_score))
+        if not first_by_url:
+            return []
 
-    async def update(self, source: SourceModel) -> SourceModel:
-        """Update a source."""
         try:
-            merged = await self._session.merge(source)
+            # Sorted so concurrent searches take the unique-index locks in the same order.
+            rows = [
+                {
+                    "id": document.id or uuid4(),
+                    "url": document.url,
+                    # One over-long title must not fail the whole batch.
+                    "title": document.title[:512],
+                    "snippet": document.snippet,
+                    "domain_id": document.domain_id,
+                    "content": document.content,
+                }
+                for url, (document, _) in sorted(first_by_url.items())
+            ]
+            await self._session.execute(
+                insert(SourceDocumentModel)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=[func.md5(SourceDocumentModel.url)])
+            )
+            stored = await self._session.execute(
+                select(SourceDocumentModel.url, SourceDocumentModel.id).where(
+                    func.md5(SourceDocumentModel.url).in_([_url_hash(url) for url in first_by_url])
+                )
+            )
+            document_ids = {url: document_id for url, document_id in stored.all() if url in first_by_url}
+
+            links = [
+                self._model_class(
+                    id=uuid4(),
+                    search_id=search_id,
+                    document_id=document_ids[url],
+                    credibility_score=credibility_score,
+                )
+                for url, (_, credibility_score) in first_by_url.items()
+                if url in document_ids
+            ]
+            self._session.add_all(links)
             await self._session.commit()
-            return merged
         except Exception as e:
             await self._session.rollback()
             raise e
 
-    async def get_sources_filtered_by_date_and_language(
-        self, start_date: datetime, end_date: datetime, language: str
-    ) -> List[SourceModel]:
-        query = (
-            select(SourceModel)
+        # Reload with their documents and domains, in result order.
+        result = await self._session.execute(
+            select(self._model_class)
+            .where(self._model_class.id.in_([link.id for link in links]))
+            .execution_options(populate_existing=True)
+        )
+        by_id = {source.id: source for source in result.scalars().all()}
+        return [by_id[link.id] for link in links if link.id in by_id]
+
+    def _owned_by(self, query, user_id: UUID):
+        """Restrict a sources query to sources of analyses of the user's claims, joining their documents."""
+        return (
+            query.join(SourceDocumentModel, SourceModel.document_id == SourceDocumentModel.id)
             .join(SearchModel, SourceModel.search_id == SearchModel.id)
             .join(AnalysisModel, SearchModel.analysis_id == AnalysisModel.id)
             .join(ClaimModel, AnalysisModel.claim_id == ClaimModel.id)
+            .where(ClaimModel.user_id == user_id)
+        )
+
+    async def _paginate(self, query, limit: int, offset: int) -> Tuple[List[SourceModel], int]:
+        """Page of a filtered sources query, newest first, with the total number of matches."""
+        count_query = select(func.count()).select_from(query.subquery())
+        total = (await self._session.execute(count_query)).scalar_one()
+
+        page = (
+            query.options(_with_document())
+            .order_by(desc(self._model_class.created_at), self._model_class.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self._session.execute(page)
+        return list(result.scalars().all()), total
+
+    async def get_by_domain_for_user(
+        self, domain_id: UUID, user_id: UUID, limit: int = 50, offset: int = 0
+    ) -> Tuple[List[SourceModel], int]:
+        """Sources from a domain that belong to the user's claims, paginated after the ownership filter."""
+        query = self._owned_by(select(self._model_class), user_id).where(SourceDocumentModel.domain_id == domain_id)
+        return await self._paginate(query, limit, offset)
+
+    async def search_sources_for_user(
+        self, text: str, user_id: UUID, limit: int = 50, after: Optional[Tuple[float, UUID]] = None
+    ) -> List[Tuple[SourceModel, float]]:
+        """
+        Full-text search over the sources of the user's claims, as (source, rank) pairs, best match first.
+
+        Matches come from the GIN index on the documents' search_vector. Pages are keyed rather than offset:
+        pass the (rank, id) of the last row of the previous page as after.
+        """
+        ts_query = func.websearch_to_tsquery(literal_column(f"'{SOURCE_SEARCH_CONFIG}'::regconfig"), text)
+        rank = func.ts_rank_cd(SourceDocumentModel.search_vector, ts_query)
+
+        query = self._owned_by(select(self._model_class, rank), user_id).where(
+            SourceDocumentModel.search_vector.op("@@")(ts_query)
+        )
+        if after:
+            after_rank, after_id = after
+            query = query.where(tuple_(rank, self._model_class.id) < tuple_(cast(after_rank, REAL), after_id))
+
+        query = query.options(_with_document()).order_by(rank.desc(), self._model_class.id.desc()).limit(limit)
+        result = await self._session.execute(query)
+        return [(row[0], row[1]) for row in result.all()]
+
+    async def get_by_analysis_for_user(
+        self, analysis_id: UUID, user_id: UUID, unique: bool = False
+    ) -> List[SourceModel]:
+        """
+        Sources of every search of an analysis of the user's claims, with their domain, most credible first.
+
+        With unique, only the first source retrieved for each URL is kept.
+        """
+        query = self._owned_by(select(self._model_class), user_id).where(SearchModel.analysis_id == analysis_id)
+
+        if unique:
+            first_per_url = (
+                self._owned_by(select(self._model_class.id).select_from(self._model_class), user_id)
+                .where(SearchModel.analysis_id == analysis_id)
+                .distinct(self._model_class.document_id)
+                .order_by(self._model_class.document_id, self._model_class.created_at)
+            )
+            query = (
+                select(self._model_class)
+                .join(SourceDocumentModel, self._model_class.document_id == SourceDocumentModel.id)
+                .where(self._model_class.id.in_(first_per_url))
+            )
+
+        query = query.options(_with_document()).order_by(
+            self._model_class.credibility_score.desc().nulls_last(), self._model_class.created_at
+        )
+        result = await self._session.execute(query)
+        return list(result.scalars().all())
+
+    def _for_claims_in_date_range(self, query, start_date: datetime, end_date: datetime, language: str):
+        """Restrict a sources query to sources created in a range for claims in the given language."""
+        return (
+            query.join(SearchModel, SourceModel.search_id == SearchModel.id)
+            .join(AnalysisModel, SearchModel.analysis_id == AnalysisModel.id)
+            .join(ClaimModel, AnalysisModel.claim_id == ClaimModel.id)
             .where(SourceModel.created_at.between(start_date, end_date), ClaimModel.language == language)
-            .order_by(desc(SourceModel.created_at))
-            .options(selectinload(self._model_class.domain))  # Adjust this based on relationships
+        )
+
+    async def count_sources_in_date_range(self, start_date: datetime, end_date: datetime, language: str) -> int:
+        query = self._for_claims_in_date_range(
+            select(func.count(SourceModel.id)).select_from(SourceModel), start_date, end_date, language
+        )
+        result = await self._session.execute(query)
+        return result.scalar_one()
+
+    async def get_domain_counts_in_date_range(
+        self, start_date: datetime, end_date: datetime, language: str, limit: Optional[int] = 50
+    ) -> List[Tuple[str, Optional[float], int]]:
+        """Top domains by number of sources retrieved in a range, as (domain_name, credibility_score, count)."""
+        source_count = func.count(SourceModel.id).label("source_count")
+        counts = (
+            self._for_claims_in_date_range(
+                select(SourceDocumentModel.domain_id, source_count).select_from(SourceModel),
+                start_date,
+                end_date,
+                language,
+            )
+            .join(SourceDocumentModel, SourceModel.document_id == SourceDocumentModel.id)
+            .where(SourceDocumentModel.domain_id.is_not(None))
+            .group_by(SourceDocumentModel.domain_id)
+            .order_by(source_count.desc())
+            .limit(limit)
+            .subquery()
+        )
+        query = (
+            select(DomainModel.domain_name, DomainModel.credibility_score, counts.c.source_count)
+            .join(counts, counts.c.domain_id == DomainModel.id)
+            .order_by(counts.c.source_count.desc(), DomainModel.domain_name)
         )
 
         result = await self._session.execute(query)
-        return result.scalars().all()
+        return [(row[0], row[1], row[2]) for row in result.all()]
@@ -1,5 +1,7 @@
+from datetime import datetime
 from typing import Optional
-from sqlalchemy import select
+from uuid import UUID
+from sqlalchemy import or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.database.models import UserModel
@@ -47,3 +49,21 @@ class UserRepository(BaseRepository[UserModel, User], UserRepositoryInterface):
         result = await self._session.execute(query)
         model = result.scalar_one_or_none()
         return self._to_domain(model) if model else None
+
+    async def touch_last_login(self, user_id: UUID, login_time: datetime, stale_before: datetime) -> bool:
+        """
+        Set last_login to login_time if it is older than stale_before, in a single conditional UPDATE.
+
+        Returns whether the row was written; recent logins are left alone so most requests do no write.
+        """
+        query = (
+            update(self._model_class)
+            .where(
+                self._model_class.id == user_id,
+                or_(self._model_class.last_login.is_(None), self._model_class.last_login < stale_before),
+            )
+            .values(last_login=login_time)
+        )
+        result = await self._session.execute(query)
+        await self._session.commit()
+        return result.rowcount > 0
@@ -4,6 +4,7 @@ from datetime import datetime
 from uuid import UUID
 from app.models.database.models import AnalysisStatus
 from app.models.domain.analysis import Analysis
+from app.repositories.aggregates import AggregationPeriod
 
 
 class AnalysisRepositoryInterface(ABC):
@@ -41,5 +42,15 @@ class AnalysisRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def get_analysis_in_date_range(self, start_date: datetime, end_date: datetime):
+    async def get_average_latest_veracity(
+        self, start_date: datetime, end_date: datetime, language: str
+    ) -> Tuple[Optional[float], int]:
+        """Average veracity of the latest completed analysis per claim."""
+        pass
+
+    @abstractmethod
+    async def get_average_latest_veracity_by_period(
+        self, start_date: datetime, end_date: datetime, language: str, period: AggregationPeriod
+    ) -> List[Tuple[datetime, float, int]]:
+        """Average veracity of the latest completed analysis per claim, grouped by period."""
         pass
@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Tuple
+from typing import AsyncIterator, Optional, List, Tuple
 from datetime import datetime
 from uuid import UUID
+import numpy as np
 from app.models.database.models import ClaimStatus
 from app.models.domain.claim import Claim
+from app.repositories.aggregates import AggregationPeriod
 
 
 class ClaimRepositoryInterface(ABC):
@@ -42,7 +44,54 @@ class ClaimRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def get_claims_in_date_range(self, start_date: datetime, end_date: datetime, language: str):
+    def stream_claim_texts_in_date_range(
+        self, start_date: datetime, end_date: datetime, language: str, batch_size: int = 1000
+    ) -> AsyncIterator[List[str]]:
+        """Stream the text of analyzed claims in a date range in batches."""
+        pass
+
+    @abstractmethod
+    def stream_claim_embeddings_in_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        language: str,
+        limit: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Tuple[List[str], np.ndarray]]:
+        """Stream the text and float32 embedding of analyzed claims in a date range, newest first, in batches."""
+        pass
+
+    @abstractmethod
+    def stream_embeddings(self, batch_size: int = 1000) -> AsyncIterator[np.ndarray]:
+        """Stream every stored claim embedding in batches."""
+        pass
+
+    @abstractmethod
+    async def get_claim_texts_by_ids(self, claim_ids: List[UUID], user_id: UUID) -> List[Tuple[UUID, str]]:
+        """Get the id and text of the given claims owned by a user."""
+        pass
+
+    @abstractmethod
+    async def get_claims_without_embedding(self, limit: int) -> List[Tuple[UUID, str]]:
+        """Get the id and text of claims that have no embedding yet."""
+        pass
+
+    @abstractmethod
+    async def update_embeddings(self, embeddings: List[Tuple[UUID, List[float]]]) -> int:
+        """Store embeddings for many claims at once."""
+        pass
+
+    @abstractmethod
+    async def count_claims_in_date_range(self, start_date: datetime, end_date: datetime, language: str) -> int:
+        """Count analyzed claims in a date range."""
+        pass
+
+    @abstractmethod
+    async def count_claims_by_period(
+        self, start_date: datetime, end_date: datetime, language: str, period: AggregationPeriod
+    ) -> List[Tuple[datetime, int]]:
+        """Count analyzed claims in a date range, grouped by period."""
         pass
 
     @abstractmethod
@@ -13,6 +13,11 @@ class MessageRepositoryInterface(ABC):
         """Create a new message."""
         pass
 
+    @abstractmethod
+    async def insert_many(self, messages: List[Message]) -> List[Message]:
+        """Create several messages in one commit."""
+        pass
+
     @abstractmethod
     async def get(self, message_id: UUID) -> Optional[Message]:
         """Get message by ID."""
@@ -29,7 +29,13 @@ class SourceRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    async def get_sources_filtered_by_date_and_language(
-        self, start_date: datetime, end_date: datetime, language: str
-    ) -> List[Source]:
+    async def count_sources_in_date_range(self, start_date: datetime, end_date: datetime, language: str) -> int:
+        """Count sources retrieved in a date range."""
+        pass
+
+    @abstractmethod
+    async def get_domain_counts_in_date_range(
+        self, start_date: datetime, end_date: datetime, language: str, limit: Optional[int] = 50
+    ) -> List[Tuple[str, Optional[float], int]]:
+        """Top domains by number of sources retrieved in a date range."""
         pass
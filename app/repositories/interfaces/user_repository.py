@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 from app.models.domain.user import User
@@ -31,3 +32,8 @@ class UserRepositoryInterface(ABC):
     async def update(self, user: User) -> User:
         """Update user."""
         pass
+
+    @abstractmethod
+    async def touch_last_login(self, user_id: UUID, login_time: datetime, stale_before: datetime) -> bool:
+        """Set last_login if it is older than stale_before."""
+        pass
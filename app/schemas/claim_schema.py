@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
@@ -26,6 +26,19 @@ class ClaimEmbeddingUpdate(BaseModel):
     embedding: List[float] = None
 
 
+class ClaimEmbeddingsRequest(BaseModel):
+    """Schema for generating embeddings for many claims."""
+
+    claim_ids: List[UUID] = Field(..., min_length=1, max_length=1000)
+
+
+class ClaimEmbeddingsResult(BaseModel):
+    """Schema for the outcome of a batch embedding request."""
+
+    updated: int
+    missing: List[UUID]
+
+
 class ClaimRead(BaseModel):
     """Schema for reading a claim."""
 
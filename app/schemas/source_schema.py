@@ -31,3 +31,9 @@ class SourceList(BaseModel):
     offset: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class SourceSearchResults(BaseModel):
+    items: list[SourceRead]
+    limit: int
+    next_cursor: Optional[str] = None
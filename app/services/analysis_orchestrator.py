@@ -25,6 +25,16 @@ from app.repositories.implementations.conversation_repository import Conversatio
 from app.repositories.implementations.source_repository import SourceRepository
 from app.repositories.implementations.search_repository import SearchRepository
 from app.services.interfaces.web_search_service import WebSearchServiceInterface
+from app.services.buffered_message_writer import BufferedMessageWriter
+from app.services.conversation_context import (
+    CachedDiscussion,
+    ConversationContextBuilder,
+    cache_discussion,
+    get_cached_discussion,
+    invalidate_discussion_context,
+    schedule_summary_update,
+)
+from app.services.rollup_service import mark_rollup_dirty
 
 from app.core.llm.prompts import AnalysisPrompt
 
@@ -85,6 +95,7 @@ class AnalysisOrchestrator:
         self._source_repo = source_repo
         self._search_repo = search_repo
         self._web_search = web_search_service
+        self._context_builder = ConversationContextBuilder(llm_provider, message_repo, claim_conversation_repo)
         self._analysis_state = AnalysisState()
 
     async def _generate_analysis(
@@ -441,12 +452,14 @@ class AnalysisOrchestrator:
 
         yield {"type": "status", "content": "Analyzing claim..."}
 
-        async for chunk in self._generate_analysis(claim_text, content, language):
-            if chunk["type"] == "content":
-                await self._store_bot_message(
-                    conversation_id=conversation_id, content=chunk["content"], claim_id=claim.id
-                )
-            yield chunk
+        writer = await self._start_bot_message(conversation_id=conversation_id, claim_id=claim.id)
+        try:
+            async for chunk in self._generate_analysis(claim_text, content, language):
+                if chunk["type"] == "content":
+                    await writer.append(chunk["content"])
+                yield chunk
+        finally:
+            await writer.close()
 
     async def _extract_claim(self, content: str) -> str:
         """Extract the main claim from message content"""
@@ -483,22 +496,28 @@ class AnalysisOrchestrator:
         self, conversation_id: UUID, content: str
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Handle regular conversational message"""
-        async for chunk in self._llm.generate_stream([LLMMessage(role="user", content=content)]):
-            if not chunk.is_complete:
-                await self._store_bot_message(conversation_id, chunk.text)
-                yield {"type": "content", "content": chunk.text}
+        writer = await self._start_bot_message(conversation_id)
+        try:
+            async for chunk in self._llm.generate_stream([LLMMessage(role="user", content=content)]):
+                if not chunk.is_complete:
+                    await writer.append(chunk.text)
+                    yield {"type": "content", "content": chunk.text}
+        finally:
+            await writer.close()
 
-    async def _store_bot_message(self, conversation_id: UUID, content: str, claim_id: Optional[UUID] = None) -> Message:
-        """Store bot message in the database"""
+    async def _start_bot_message(self, conversation_id: UUID, claim_id: Optional[UUID] = None) -> BufferedMessageWriter:
+        """Create the bot message row that a streamed reply is written into"""
         message = Message(
             id=uuid4(),
             conversation_id=conversation_id,
             sender_type="bot",
-            content=content,
+            content="",
             timestamp=datetime.now(),
             claim_id=claim_id,
         )
-        return await self._message_repo.create(message)
+        writer = BufferedMessageWriter(self._message_repo, message)
+        await writer.start()
+        return writer
 
     async def analyze_claim_stream(
         self, claim: Claim, user_id: UUID, default: bool = True
@@ -545,6 +564,8 @@ class AnalysisOrchestrator:
 
             if analysis_complete:
                 await self._claim_repo.update_status(claim.id, ClaimStatus.analyzed)
+                await self._mark_rollups_dirty(claim, analysis)
+                invalidate_discussion_context(claim.id)
                 logger.info(f"Completed analysis for claim {claim.id}")
             else:
                 await self._claim_repo.update_status(claim.id, ClaimStatus.failed)
@@ -589,6 +610,8 @@ class AnalysisOrchestrator:
         )
 
         await self._claim_repo.update_status(claim_id, ClaimStatus.analyzed)
+        await self._mark_rollups_dirty(claim, analysis)
+        invalidate_discussion_context(claim_id)
 
         return {
             "conversation_id": conversation_ids["conversation_id"],
@@ -596,6 +619,18 @@ class AnalysisOrchestrator:
             "analysis": analysis,
         }
 
+    async def _mark_rollups_dirty(self, claim: Claim, analysis: Analysis) -> None:
+        """Mark the rollup days a new analysis changes: the claim's, the analysis's and the one it supersedes."""
+        days = {claim.created_at.date(), analysis.created_at.date()}
+        previous = await self._analysis_repo.get_previous_completed_created_at(claim.id, analysis.id)
+        if previous:
+            days.add(previous.date())
+        try:
+            await mark_rollup_dirty(*days)
+        except Exception as e:
+            # Never fail the analysis over it; the trailing ROLLUP_REFRESH_DAYS are refreshed regardless
+            logger.error(f"Failed to mark rollup days for claim {claim.id}: {str(e)}", exc_info=True)
+
     async def stream_claim_discussion(
         self,
         conversation_id: UUID,
@@ -606,17 +641,10 @@ class AnalysisOrchestrator:
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Stream interactive discussion about a claim."""
         try:
-            # First verify the conversation belongs to the user
-            conversation = await self._conversation_repo.get(conversation_id)
-            if not conversation or conversation.user_id != user_id:
-                raise NotAuthorizedException("Not authorized to access this conversation")
+            cached = await self._get_discussion(conversation_id, claim_conversation_id, claim_id, user_id)
+            claim_conv = cached.discussion.claim_conversation
 
-            # Verify the claim conversation
-            claim_conv = await self._claim_conversation_repo.get(claim_conversation_id)
-            if not claim_conv or claim_conv.conversation_id != conversation_id:
-                raise NotAuthorizedException("Not authorized to access this claim conversation")
-
-            # Store user message
+            # Store user message and bot message placeholder in one commit
             user_message = Message(
                 id=uuid4(),
                 conversation_id=conversation_id,
@@ -626,27 +654,6 @@ class AnalysisOrchestrator:
                 timestamp=datetime.now(UTC),
                 claim_id=claim_id,
             )
-            await self._message_repo.create(user_message)
-
-            # Get conversation context (last few messages for context)
-            context_messages = await self._message_repo.get_claim_conversation_messages(
-                claim_conversation_id=claim_conversation_id,
-                limit=10,
-            )
-            context_messages.reverse()  # Oldest messages first
-
-            # Create LLM messages from context
-            llm_messages = [
-                LLMMessage(
-                    role="assistant" if msg.sender_type == MessageSenderType.bot else "user", content=msg.content
-                )
-                for msg in context_messages
-            ]
-
-            # Add current message
-            llm_messages.append(LLMMessage(role="user", content=message_content))
-
-            # Create bot message placeholder
             bot_message = Message(
                 id=uuid4(),
                 conversation_id=conversation_id,
@@ -656,48 +663,82 @@ class AnalysisOrchestrator:
                 timestamp=datetime.now(UTC),
                 claim_id=claim_id,
             )
-            await self._message_repo.create(bot_message)
-
-            # Get claim and analysis for context
-            claim = await self._claim_repo.get(claim_id)
-            if not claim:
-                raise NotFoundException("Claim not found")
-
-            # Get latest analysis
-            analyses = await self._analysis_repo.get_by_claim(claim_id=claim_id, include_sources=True)
-            analysis = analyses[-1] if analyses else None
-
-            if not analysis:
-                raise NotFoundException("Analysis not found")
+            writer = BufferedMessageWriter(self._message_repo, bot_message)
+            await writer.start(user_message)
 
-            system_context = (
-                f"You are a fact-checking assistant. The user is asking about this claim: '{claim.claim_text}'\n"
-                f"Your previous analysis determined this claim is {analysis.veracity_score * 100:.1f}% likely to be true "
-                f"with {analysis.confidence_score * 100:.1f}% confidence.\n"
-                "Please help the user understand the analysis and sources. "
-                "Be direct and factual in your responses."
-            )
-            llm_messages.insert(0, LLMMessage(role="system", content=system_context))
+            # Recent turns within the token budget, older ones via the rolling summary
+            context = await self._context_builder.build(claim_conv, cached.system_context, user_message)
+            llm_messages = context.messages
 
-            response_content = []
-            async for chunk in self._llm.generate_stream(llm_messages, temperature=0.7):
-                if not chunk.is_complete:
-                    response_content.append(chunk.text)
-                    yield {"type": "content", "content": chunk.text, "message_id": str(bot_message.id)}
+            try:
+                async for chunk in self._llm.generate_stream(llm_messages, temperature=0.7):
+                    if not chunk.is_complete:
+                        await writer.append(chunk.text)
+                        yield {"type": "content", "content": chunk.text, "message_id": str(bot_message.id)}
 
-                # Update bot message with complete response when done
-                if chunk.is_complete:
-                    full_response = "".join(response_content)
-                    bot_message.content = full_response
-                    await self._message_repo.update(bot_message)
+                    # Update bot message with complete response when done
+                    if chunk.is_complete:
+                        await writer.close()
+                        yield {"type": "message_complete", "message_id": str(bot_message.id)}
+            finally:
+                await writer.close()
 
-                    yield {"type": "message_complete", "message_id": str(bot_message.id)}
+            # Older turns are folded into the summary in the background, never on this stream
+            schedule_summary_update(self._llm, claim_conv, context)
 
         except Exception as e:
             logger.error(f"Error in stream_claim_discussion: {str(e)}", exc_info=True)
             yield {"type": "error", "content": str(e)}
             raise
 
+    async def _get_discussion(
+        self, conversation_id: UUID, claim_conversation_id: UUID, claim_id: UUID, user_id: UUID
+    ) -> CachedDiscussion:
+        """Ownership-checked discussion state and system prompt, cached across the turns of a discussion.
+
+        A cache hit costs one cheap version query instead of the full discussion lookup.
+        """
+        cached = get_cached_discussion(claim_conversation_id)
+        if (
+            cached
+            and cached.user_id == user_id
+            and cached.discussion.claim_conversation.conversation_id == conversation_id
+            and cached.discussion.claim_conversation.claim_id == claim_id
+        ):
+            # Revalidate on every hit: ownership, plus changes made by other workers (new analyses, summaries)
+            version = await self._claim_conversation_repo.get_discussion_version(
+                claim_conversation_id=claim_conversation_id,
+                conversation_id=conversation_id,
+                claim_id=claim_id,
+                user_id=user_id,
+            )
+            if version is None:
+                invalidate_discussion_context(claim_id)
+                raise NotAuthorizedException("Not authorized to access this claim conversation")
+            if version == cached.discussion.version:
+                return cached
+
+        # Ownership, claim text and latest analysis scores in a single query
+        discussion = await self._claim_conversation_repo.get_discussion_context(
+            claim_conversation_id=claim_conversation_id,
+            conversation_id=conversation_id,
+            claim_id=claim_id,
+            user_id=user_id,
+        )
+        if not discussion:
+            raise NotAuthorizedException("Not authorized to access this claim conversation")
+        if discussion.analysis_id is None:
+            raise NotFoundException("Analysis not found")
+
+        system_context = (
+            f"You are a fact-checking assistant. The user is asking about this claim: '{discussion.claim_text}'\n"
+            f"Your previous analysis determined this claim is {discussion.veracity_score * 100:.1f}% likely to be "
+            f"true with {discussion.confidence_score * 100:.1f}% confidence.\n"
+            "Please help the user understand the analysis and sources. "
+            "Be direct and factual in your responses."
+        )
+        return cache_discussion(user_id, discussion, system_context)
+
     def clean_text(text):
         cleaned_text = re.sub(r"[^a-zA-Z,.?!' ]", "", text)
         return cleaned_text
@@ -8,6 +8,7 @@ from app.models.domain.analysis import Analysis
 from app.repositories.implementations.analysis_repository import AnalysisRepository
 from app.repositories.implementations.claim_repository import ClaimRepository
 from app.core.exceptions import NotFoundException
+from app.services.conversation_context import invalidate_discussion_context
 
 logger = logging.getLogger(__name__)
 
@@ -40,16 +41,22 @@ class AnalysisService:
             updated_at=datetime.now(UTC),
         )
 
-        return await self._analysis_repo.create(analysis)
+        analysis = await self._analysis_repo.create(analysis)
+        invalidate_discussion_context(claim_id)
+        return analysis
 
     async def get_analysis(
-        self, analysis_id: UUID, include_sources: bool = False, include_feedback: bool = False
+        self,
+        analysis_id: UUID,
+        include_sources: bool = False,
+        include_feedback: bool = False,
+        include_log_probs: bool = False,
     ) -> Analysis:
         """Get analysis by ID."""
         if include_sources or include_feedback:
-            analysis = await self._analysis_repo.get_with_relations(analysis_id)
+            analysis = await self._analysis_repo.get_with_relations(analysis_id, include_log_probs=include_log_probs)
         else:
-            analysis = await self._analysis_repo.get(analysis_id)
+            analysis = await self._analysis_repo.get(analysis_id, include_log_probs=include_log_probs)
 
         if not analysis:
             raise NotFoundException("Analysis not found")
@@ -68,11 +75,18 @@ class AnalysisService:
             return None
 
     async def get_claim_analyses(
-        self, claim_id: UUID, include_sources: bool = False, include_feedback: bool = False
+        self,
+        claim_id: UUID,
+        include_sources: bool = False,
+        include_feedback: bool = False,
+        include_log_probs: bool = False,
     ) -> List[Analysis]:
         """Get all analyses for a claim."""
         return await self._analysis_repo.get_by_claim(
-            claim_id=claim_id, include_sources=include_sources, include_feedback=include_feedback
+            claim_id=claim_id,
+            include_sources=include_sources,
+            include_feedback=include_feedback,
+            include_log_probs=include_log_probs,
         )
 
     async def update_analysis_status(self, analysis_id: UUID, status: AnalysisStatus) -> Analysis:
@@ -80,29 +94,9 @@ class AnalysisService:
         analysis = await self._analysis_repo.update_status(analysis_id=analysis_id, status=status)
         if not analysis:
             raise NotFoundException("Analysis not found")
+        invalidate_discussion_context(analysis.claim_id)
         return analysis
 
     async def get_recent_analyses(self, limit: int = 50, offset: int = 0) -> Tuple[List[Analysis], int]:
         """Get recent analyses with pagination."""
         return await self._analysis_repo.get_recent_analyses(limit=limit, offset=offset)
-
-    async def get_analysis_list(self, start_date: datetime, end_date: datetime, language: str) -> List[Analysis]:
-        """Get analysis by ID."""
-
-        analysis_list = await self._analysis_repo.get_analysis_in_date_range(start_date=start_date, end_date=end_date)
-
-        latest_analysis = {}
-
-        for analysis in analysis_list:
-            claim_id = analysis.claim_id
-            if claim_id not in latest_analysis or analysis.updated_at > latest_analysis[claim_id].updated_at:
-                latest_analysis[claim_id] = analysis
-
-        # result = list(latest_analysis.values())
-        result = [
-            analysis
-            for analysis in latest_analysis.values()
-            if (await self._claim_repo.get(analysis.claim_id)).language == language
-        ]
-
-        return result
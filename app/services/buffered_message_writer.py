@@ -0,0 +1,74 @@
+from typing import List, Optional
+import time
+
+from app.core.config import settings
+from app.models.domain.message import Message
+from app.repositories.implementations.message_repository import MessageRepository
+
+
+class BufferedMessageWriter:
+    """
+    Persists a streamed bot reply as a single message row.
+
+    The row is created empty up front; appended chunks are accumulated in memory and the
+    row's content is rewritten at most every flush_interval_seconds or flush_chars characters,
+    and once more on close, instead of once per chunk.
+    """
+
+    def __init__(
+        self,
+        message_repository: MessageRepository,
+        message: Message,
+        flush_interval_seconds: float = settings.MESSAGE_FLUSH_INTERVAL_SECONDS,
+        flush_chars: int = settings.MESSAGE_FLUSH_CHARS,
+    ):
+        self._message_repo = message_repository
+        self.message = message
+        self._flush_interval_seconds = flush_interval_seconds
+        self._flush_chars = flush_chars
+        self._parts: List[str] = []
+        self._pending_chars = 0
+        self._last_flush: Optional[float] = None
+
+    @property
+    def content(self) -> str:
+        return "".join(self._parts)
+
+    async def start(self, *preceding: Message) -> Message:
+        """Create the placeholder row, in the same commit as any preceding messages (e.g. the user's turn)."""
+        self.message.content = ""
+        if preceding:
+            created = await self._message_repo.insert_many([*preceding, self.message])
+            self.message = created[-1]
+        else:
+            self.message = await self._message_repo.create(self.message)
+        self._last_flush = time.monotonic()
+        return self.message
+
+    async def append(self, text: str) -> None:
+        """Buffer a chunk, flushing if the interval or size threshold has been reached."""
+        if not text:
+            return
+
+        self._parts.append(text)
+        self._pending_chars += len(text)
+        if (
+            self._pending_chars >= self._flush_chars
+            or time.monotonic() - self._last_flush >= self._flush_interval_seconds
+        ):
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write the content accumulated so far, if anything changed since the last write."""
+        if not self._pending_chars:
+            return
+
+        self.message.content = self.content
+        self.message = await self._message_repo.update(self.message)
+        self._pending_chars = 0
+        self._last_flush = time.monotonic()
+
+    async def close(self) -> Message:
+        """Write any remaining content and return the stored message."""
+        await self.flush()
+        return self.message
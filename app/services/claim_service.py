@@ -1,15 +1,9 @@
 from datetime import datetime, UTC
 from typing import List, Optional, Tuple
 from uuid import UUID, uuid4
-from wordcloud import WordCloud, STOPWORDS
-import json
-import plotly.graph_objects as go
+import asyncio
 import logging
 
-from sklearn.manifold import TSNE
-from sklearn.cluster import KMeans
-import plotly.express as px
-import pandas as pd
 import numpy as np
 
 from app.models.database.models import ClaimStatus
@@ -17,20 +11,15 @@ from app.models.domain.claim import Claim
 from app.repositories.implementations.claim_repository import ClaimRepository
 from app.repositories.implementations.analysis_repository import AnalysisRepository
 from app.services.analysis_orchestrator import AnalysisOrchestrator
+from app.services.clustering_engine import build_clustering_figure, clustering_engine
+from app.services.interfaces.embedding_generator import EmbeddingGeneratorInterface
+from app.core.analytics_executor import analytics_executor
+from app.core.config import settings
 from app.core.exceptions import MonthlyLimitExceededError
 
 from app.core.exceptions import NotFoundException, NotAuthorizedException
 
-from nltk.corpus import stopwords
-
-import nltk
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
-
-nltk.download("stopwords")
-
 logger = logging.getLogger(__name__)
-executor = ThreadPoolExecutor(max_workers=1)
 
 RESTRICTED_CLIENT_ID = "hHRhJr5OoJhWumP87MHk5RldejycVAmC@clients"
 MONTHLY_LIMIT = 3000
@@ -87,7 +76,44 @@ class ClaimService:
         claim = await self.get_claim(claim_id, user_id)
         claim.embedding = embedding
         claim.updated_at = datetime.now(UTC)
-        return await self._claim_repo.update(claim)
+        claim = await self._claim_repo.update(claim)
+        clustering_engine.add(embedding)
+        return claim
+
+    async def generate_claim_embeddings(
+        self, claim_ids: List[UUID], user_id: UUID, embedding_generator: EmbeddingGeneratorInterface
+    ) -> Tuple[int, List[UUID]]:
+        """Embed a user's claims in one batch. Returns the number updated and the ids not found for the user."""
+        rows = await self._claim_repo.get_claim_texts_by_ids(claim_ids=claim_ids, user_id=user_id)
+        updated = await self._embed_and_store(rows, embedding_generator)
+
+        found = {claim_id for claim_id, _ in rows}
+        return updated, [claim_id for claim_id in claim_ids if claim_id not in found]
+
+    async def backfill_embeddings(
+        self, embedding_generator: EmbeddingGeneratorInterface, batch_size: int = settings.EMBEDDING_BATCH_SIZE
+    ) -> int:
+        """Embed every claim that has no embedding yet, batch_size claims at a time."""
+        total = 0
+        while rows := await self._claim_repo.get_claims_without_embedding(limit=batch_size):
+            total += await self._embed_and_store(rows, embedding_generator)
+            logger.info(f"Embedded {total} claims")
+        return total
+
+    async def _embed_and_store(
+        self, rows: List[Tuple[UUID, str]], embedding_generator: EmbeddingGeneratorInterface
+    ) -> int:
+        if not rows:
+            return 0
+
+        embeddings = await embedding_generator.generate_embeddings([claim_text for _, claim_text in rows])
+        updated = await self._claim_repo.update_embeddings(
+            [(claim_id, embedding) for (claim_id, _), embedding in zip(rows, embeddings)]
+        )
+        for embedding in embeddings:
+            clustering_engine.add(embedding)
+
+        return updated
 
     async def get_claim(self, claim_id: UUID, user_id: Optional[UUID] = None) -> Claim:
         """Get a claim and optionally verify ownership."""
@@ -106,146 +132,34 @@ class ClaimService:
         """List claims for a user with pagination."""
         return await self._claim_repo.get_user_claims(user_id=user_id, status=status, limit=limit, offset=offset)
 
-    async def list_time_bound_claims(
-        self, start_date: datetime, end_date: datetime, language: str = "english"
-    ) -> List[Claim]:
-        """List claims for a specific date range."""
-        return await self._claim_repo.get_claims_in_date_range(
-            start_date=start_date, end_date=end_date, language=language
+    async def generate_clustering_graph(self, start_date: datetime, end_date: datetime, language: str) -> dict:
+        """
+        Scatter of the claims analyzed in a date range, laid out and colored by the clustering engine.
+
+        Until warm-up has fitted a first batch the figure is empty; the request never waits on it.
+        """
+        clustering_engine.start_warm_up()
+
+        claim_texts: List[str] = []
+        points, clusters = [np.empty((0, 2))], [np.empty(0, dtype=int)]
+        snapshot = await clustering_engine.snapshot()
+        if snapshot is not None:
+            # Each batch is reduced to its 2-D points as it arrives, so the full embeddings of a
+            # wide range are never held at once. numpy releases the GIL for the matrix products,
+            # so a thread keeps them off the event loop.
+            async for texts, embeddings in self._claim_repo.stream_claim_embeddings_in_date_range(
+                start_date=start_date, end_date=end_date, language=language, limit=settings.CLUSTERING_MAX_POINTS
+            ):
+                batch_points, batch_clusters = await asyncio.to_thread(snapshot.layout, embeddings)
+                claim_texts.extend(texts)
+                points.append(batch_points)
+                clusters.append(batch_clusters)
+
+        # Only the 2-D points cross the process boundary, not the full embeddings.
+        return await analytics_executor.run(
+            build_clustering_figure, np.vstack(points), np.concatenate(clusters), claim_texts
         )
 
-    async def generate_word_cloud(self, claims: List[Claim]) -> str:
-        def _heavy_word_cloud_math(claims):
-            claim_texts = list(map(lambda claim: claim.claim_text, claims))
-
-            if len(claim_texts) <= 0:
-                wordcloud = WordCloud(background_color="white", colormap="rainbow", margin=0).generate("Empty")
-
-                image = wordcloud.to_array()
-                fig = go.Figure(go.Image(z=image))
-
-                fig.update_layout(
-                    xaxis=dict(showgrid=False, zeroline=False, visible=False),
-                    yaxis=dict(showgrid=False, zeroline=False, visible=False),
-                    paper_bgcolor="white",
-                    plot_bgcolor="white",
-                    margin=dict(l=20, r=20, t=20, b=20),
-                )
-                fig_json = fig.to_json()
-                graph = json.loads(fig_json)
-                return graph
-
-            french_stopwords = set(stopwords.words("french"))
-            custom_stopwords = french_stopwords.union(STOPWORDS)
-
-            text = " ".join(claim_texts)
-            wordcloud = WordCloud(
-                background_color="white", colormap="rainbow", margin=0, stopwords=custom_stopwords
-            ).generate(text)
-
-            image = wordcloud.to_array()
-            fig = go.Figure(go.Image(z=image))
-
-            fig.update_layout(
-                xaxis=dict(showgrid=False, zeroline=False, visible=False),
-                yaxis=dict(showgrid=False, zeroline=False, visible=False),
-                paper_bgcolor="white",
-                plot_bgcolor="white",
-                margin=dict(l=20, r=20, t=20, b=20),
-            )
-            fig_json = fig.to_json()
-            graph = json.loads(fig_json)
-
-            logger.debug("generated word cloud picture")
-
-            return graph
-
-        loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(executor, _heavy_word_cloud_math, claims)
-        return result
-
-    async def generate_clustering_graph(self, claims: List[Claim], num_clusters: int) -> str:
-        def _heavy_clustering_math(claims, num_clusters):
-            claim_embed = list(map(lambda claim: claim.embedding, filter(lambda c: c.embedding is not None, claims)))
-
-            if len(claim_embed) > 5000:
-                logging.info("claim embed greater than 6000")
-                import random
-
-                random.seed(42)
-                claim_embed = random.sample(claim_embed, 5000)
-
-            if len(claim_embed) < 3:
-                fig = go.Figure()
-                fig.update_layout(
-                    title=None,  # Remove title
-                    xaxis_title=None,  # Remove x-axis title
-                    yaxis_title=None,  # Remove y-axis title
-                    xaxis=dict(showticklabels=False),  # Hide x-axis numbers
-                    yaxis=dict(showticklabels=False),  # Hide y-axis numbers
-                    template="plotly_white",
-                )
-                fig_json = fig.to_json()
-                graph = json.loads(fig_json)
-                return graph
-            else:
-                # Reduce embedding size
-                X = np.array(claim_embed, dtype=np.float32)
-                if len(claim_embed) < 30:
-                    X_embedded = TSNE(
-                        n_components=2, learning_rate="auto", init="random", perplexity=len(claim_embed) - 1
-                    ).fit_transform(X)
-                else:
-                    X_embedded = TSNE(n_components=2, learning_rate="auto", init="random", perplexity=30).fit_transform(
-                        X
-                    )
-
-                kmeans = KMeans(n_clusters=num_clusters, random_state=0, n_init="auto").fit(X_embedded)
-
-                df = pd.DataFrame(X_embedded, columns=["x", "y"])
-                df["cluster"] = kmeans.labels_  # Assign KMeans labels
-
-                df["claim_text"] = [
-                    (c.claim_text[:100] + "...") if len(c.claim_text) > 100 else c.claim_text
-                    for c in claims
-                    if c.embedding is not None
-                ]
-                # claim.claim_text for claim in claims if claim.embedding is not None
-
-                fig = px.scatter(
-                    df,
-                    x="x",
-                    y="y",
-                    color=df["cluster"].astype(str),
-                    title=None,
-                    labels={"cluster": "Cluster", "claim_text": "Claim text"},
-                    color_discrete_sequence=px.colors.qualitative.Set1,  # Custom color scheme
-                    template="plotly_white",
-                    hover_data={
-                        "x": False,  # Remove x-axis data from hover
-                        "y": False,  # Remove y-axis data from hover
-                        "cluster": True,  # Rename the color to 'cluster'
-                        "claim_text": True,  # Show claim_text
-                    },
-                )
-
-                fig.update_layout(
-                    xaxis_title=None,
-                    yaxis_title=None,
-                    xaxis=dict(showticklabels=False),
-                    yaxis=dict(showticklabels=False),
-                    legend_title="Cluster",  # Set custom legend title
-                )
-
-                fig_json = fig.to_json()
-                graph = json.loads(fig_json)
-
-                return graph
-
-        loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(executor, _heavy_clustering_math, claims, num_clusters)
-        return result
-
     async def create_claims_batch(
         self,
         claims: List[Claim],
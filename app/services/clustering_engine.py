@@ -0,0 +1,219 @@
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+import asyncio
+import json
+import logging
+
+import numpy as np
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.repositories.implementations.claim_repository import ClaimRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ClusteringSnapshot:
+    """Frozen copy of the fitted projection and centroids, cheap to apply and safe to pickle."""
+
+    mean: np.ndarray
+    components: np.ndarray
+    centroids: np.ndarray
+
+    def project(self, embeddings: np.ndarray) -> np.ndarray:
+        """2-D layout coordinates of embeddings."""
+        return (embeddings - self.mean) @ self.components.T
+
+    def assign(self, embeddings: np.ndarray) -> np.ndarray:
+        """Index of the nearest centroid for each embedding."""
+        distances = (
+            (embeddings**2).sum(axis=1)[:, None]
+            - 2 * embeddings @ self.centroids.T
+            + (self.centroids**2).sum(axis=1)[None, :]
+        )
+        return distances.argmin(axis=1)
+
+    def layout(self, embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Layout coordinates and cluster of each embedding."""
+        return self.project(embeddings), self.assign(embeddings)
+
+
+class ClusteringEngine:
+    """
+    Incrementally maintained 2-D projection and k-means centroids over every claim embedding.
+
+    Embeddings are buffered and folded in batches with IncrementalPCA and MiniBatchKMeans,
+    so the model covers all claims without ever refitting from scratch. sklearn is only
+    imported once the first batch is fitted. Warm-up over the stored embeddings runs as a
+    background task, so no request waits on it.
+    """
+
+    def __init__(self, n_clusters: int, batch_size: int):
+        self.n_clusters = n_clusters
+        self._batch_size = batch_size
+        self._pca = None
+        self._kmeans = None
+        # Only touched on the event loop; fits run on the default executor under _fit_lock.
+        self._buffer: List[np.ndarray] = []
+        self._buffered = 0
+        self._fitted = False
+        self._warm = False
+        self._fit_lock = asyncio.Lock()
+        self._warm_lock = asyncio.Lock()
+        self._fold_task: Optional[asyncio.Task] = None
+        self._warm_task: Optional[asyncio.Task] = None
+
+    def _append(self, embeddings: np.ndarray) -> None:
+        self._buffer.append(np.atleast_2d(embeddings))
+        self._buffered += len(self._buffer[-1])
+
+    def _fit(self, batch: np.ndarray) -> None:
+        if self._pca is None:
+            from sklearn.cluster import MiniBatchKMeans
+            from sklearn.decomposition import IncrementalPCA
+
+            self._pca = IncrementalPCA(n_components=2)
+            self._kmeans = MiniBatchKMeans(
+                n_clusters=self.n_clusters, random_state=0, n_init=3, batch_size=self._batch_size
+            )
+
+        self._pca.partial_fit(batch)
+        self._kmeans.partial_fit(batch)
+        self._fitted = True
+
+    async def _fold(self, full_batch: bool) -> None:
+        """
+        Fit the buffered embeddings off the event loop, one fit at a time.
+
+        With full_batch, only once a whole batch is buffered; otherwise any remainder, as long as
+        the first fit has enough rows for every cluster and PCA gets at least two.
+        """
+        async with self._fit_lock:
+            if full_batch:
+                minimum = self._batch_size
+            else:
+                minimum = 2 if self._fitted else max(self.n_clusters, 2)
+            if self._buffered < minimum:
+                return
+
+            batch = np.vstack(self._buffer).astype(np.float32)
+            self._buffer, self._buffered = [], 0
+            await asyncio.get_running_loop().run_in_executor(None, self._fit, batch)
+
+    async def _fold_in_background(self) -> None:
+        try:
+            await self._fold(full_batch=True)
+        except Exception as e:
+            logger.error(f"Clustering engine update failed: {str(e)}", exc_info=True)
+
+    def add(self, embedding: Sequence[float]) -> None:
+        """
+        Buffer a newly generated embedding; a full batch is fitted by a background task.
+
+        Ignored until warm-up, which reads it from the database.
+        """
+        if not self._warm:
+            return
+
+        self._append(np.asarray(embedding, dtype=np.float32))
+        if self._buffered >= self._batch_size and (self._fold_task is None or self._fold_task.done()):
+            self._fold_task = asyncio.create_task(self._fold_in_background())
+
+    async def snapshot(self) -> Optional[ClusteringSnapshot]:
+        """Current projection and centroids, or None when there are too few embeddings to cluster."""
+        await self._fold(full_batch=False)
+
+        async with self._fit_lock:
+            if not self._fitted:
+                return None
+
+            return ClusteringSnapshot(
+                mean=self._pca.mean_.copy(),
+                components=self._pca.components_.copy(),
+                centroids=self._kmeans.cluster_centers_.copy(),
+            )
+
+    async def warm_up(self, claim_repository: ClaimRepository) -> None:
+        """Fit the model on every stored embedding, including the final partial batch."""
+        if self._warm:
+            return
+
+        async with self._warm_lock:
+            if self._warm:
+                return
+
+            count = 0
+            async for batch in claim_repository.stream_embeddings(batch_size=self._batch_size):
+                self._append(batch)
+                await self._fold(full_batch=True)
+                count += len(batch)
+
+            await self._fold(full_batch=False)
+            self._warm = True
+            logger.info(f"Clustering engine warmed up on {count} embeddings")
+
+    async def _warm_up_in_background(self) -> None:
+        try:
+            async with AsyncSessionLocal() as session:
+                await self.warm_up(ClaimRepository(session))
+        except Exception as e:
+            logger.error(f"Clustering engine warm-up failed: {str(e)}", exc_info=True)
+
+    def start_warm_up(self) -> Optional[asyncio.Task]:
+        """Schedule warm-up in the background unless the model is already warm or warming up."""
+        if self._warm:
+            return None
+        if self._warm_task is None or self._warm_task.done():
+            self._warm_task = asyncio.create_task(self._warm_up_in_background())
+        return self._warm_task
+
+
+clustering_engine = ClusteringEngine(
+    n_clusters=settings.CLUSTERING_NUM_CLUSTERS, batch_size=settings.CLUSTERING_BATCH_SIZE
+)
+
+
+def build_clustering_figure(points: np.ndarray, clusters: np.ndarray, claim_texts: List[str]) -> dict:
+    """Plotly scatter of claims at their 2-D layout coordinates, colored by cluster."""
+    import pandas as pd
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    if len(claim_texts) < 3:
+        fig = go.Figure()
+        fig.update_layout(
+            title=None,
+            xaxis_title=None,
+            yaxis_title=None,
+            xaxis=dict(showticklabels=False),
+            yaxis=dict(showticklabels=False),
+            template="plotly_white",
+        )
+        return json.loads(fig.to_json())
+
+    df = pd.DataFrame(points, columns=["x", "y"])
+    df["cluster"] = clusters
+    df["claim_text"] = [(text[:100] + "...") if len(text) > 100 else text for text in claim_texts]
+
+    fig = px.scatter(
+        df,
+        x="x",
+        y="y",
+        color=df["cluster"].astype(str),
+        title=None,
+        labels={"cluster": "Cluster", "claim_text": "Claim text"},
+        color_discrete_sequence=px.colors.qualitative.Set1,
+        template="plotly_white",
+        hover_data={"x": False, "y": False, "cluster": True, "claim_text": True},
+        render_mode="webgl",
+    )
+    fig.update_layout(
+        xaxis_title=None,
+        yaxis_title=None,
+        xaxis=dict(showticklabels=False),
+        yaxis=dict(showticklabels=False),
+        legend_title="Cluster",
+    )
+
+    return json.loads(fig.to_json())
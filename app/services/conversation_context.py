@@ -0,0 +1,187 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from uuid import UUID
+import asyncio
+import logging
+
+from cachetools import TTLCache
+
+from app.core.config import settings
+from app.core.llm.interfaces import LLMProvider
+from app.core.llm.messages import Message as LLMMessage
+from app.core.utils.tokens import count_message_tokens
+from app.db.session import AsyncSessionLocal
+from app.models.database.models import MessageSenderType
+from app.models.domain.claim_conversation import ClaimConversation, ClaimDiscussionContext
+from app.models.domain.message import Message
+from app.repositories.implementations.claim_conversation_repository import ClaimConversationRepository
+from app.repositories.implementations.message_repository import MessageRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedDiscussion:
+    """Prepared per-claim-conversation state reused across the turns of a discussion."""
+
+    user_id: UUID
+    discussion: ClaimDiscussionContext
+    system_context: str
+
+
+# claim_conversation_id -> CachedDiscussion, revalidated on every hit and dropped locally on analysis writes.
+_discussion_cache: TTLCache = TTLCache(
+    maxsize=settings.DISCUSSION_CONTEXT_CACHE_SIZE, ttl=settings.DISCUSSION_CONTEXT_CACHE_TTL_SECONDS
+)
+
+
+def get_cached_discussion(claim_conversation_id: UUID) -> Optional[CachedDiscussion]:
+    return _discussion_cache.get(claim_conversation_id)
+
+
+def cache_discussion(user_id: UUID, discussion: ClaimDiscussionContext, system_context: str) -> CachedDiscussion:
+    entry = CachedDiscussion(user_id=user_id, discussion=discussion, system_context=system_context)
+    _discussion_cache[discussion.claim_conversation.id] = entry
+    return entry
+
+
+def invalidate_discussion_context(claim_id: UUID) -> None:
+    """Forget cached discussions of a claim, so the next turn picks up its latest analysis."""
+    stale = [
+        key for key, entry in _discussion_cache.items() if entry.discussion.claim_conversation.claim_id == claim_id
+    ]
+    for key in stale:
+        _discussion_cache.pop(key, None)
+
+
+@dataclass
+class ConversationContext:
+    """Prompt for a claim discussion turn, plus the older turns the stored summary does not cover yet."""
+
+    messages: List[LLMMessage]
+    unsummarized: List[Message] = field(default_factory=list)
+
+
+def _to_llm_message(message: Message) -> LLMMessage:
+    role = "assistant" if message.sender_type == MessageSenderType.bot else "user"
+    return LLMMessage(role=role, content=message.content)
+
+
+class ConversationContextBuilder:
+    """
+    Fits a claim discussion into a token budget.
+
+    The newest turns are sent verbatim for as long as they fit; everything older is represented
+    by a rolling summary stored on the claim conversation, which is extended in the background
+    after each reply (see schedule_summary_update), off the request path.
+    """
+
+    def __init__(
+        self,
+        llm: LLMProvider,
+        message_repository: MessageRepository,
+        claim_conversation_repository: ClaimConversationRepository,
+        token_budget: int = settings.CONTEXT_TOKEN_BUDGET,
+        max_messages: int = settings.CONTEXT_MAX_MESSAGES,
+    ):
+        self._llm = llm
+        self._message_repo = message_repository
+        self._claim_conversation_repo = claim_conversation_repository
+        self._token_budget = token_budget
+        self._max_messages = max_messages
+
+    async def build(
+        self, claim_conversation: ClaimConversation, system_context: str, user_message: Message
+    ) -> ConversationContext:
+        """Messages to send for user_message, newest history first until the budget is spent."""
+        history = await self._message_repo.get_claim_conversation_messages(
+            claim_conversation_id=claim_conversation.id, limit=self._max_messages
+        )
+        # Newest first; skip the message being answered and empty reply placeholders.
+        history = [message for message in history if message.id != user_message.id and message.content]
+
+        summary = claim_conversation.context_summary
+        summary_message = (
+            LLMMessage(role="system", content=f"Summary of the earlier discussion: {summary}") if summary else None
+        )
+
+        remaining = (
+            self._token_budget - count_message_tokens(system_context) - count_message_tokens(user_message.content)
+        )
+        if summary_message:
+            remaining -= count_message_tokens(summary_message.content)
+
+        included: List[Message] = []
+        for message in history:
+            if claim_conversation.summary_through and message.timestamp <= claim_conversation.summary_through:
+                break
+            cost = count_message_tokens(message.content)
+            if cost > remaining:
+                break
+            remaining -= cost
+            included.append(message)
+
+        overflow = history[len(included) :]
+        unsummarized = [
+            message
+            for message in overflow
+            if not claim_conversation.summary_through or message.timestamp > claim_conversation.summary_through
+        ]
+
+        messages = [LLMMessage(role="system", content=system_context)]
+        if summary_message:
+            messages.append(summary_message)
+        messages.extend(_to_llm_message(message) for message in reversed(included))
+        messages.append(LLMMessage(role="user", content=user_message.content))
+        return ConversationContext(messages=messages, unsummarized=list(reversed(unsummarized)))
+
+    async def update_summary(self, claim_conversation: ClaimConversation, context: ConversationContext) -> None:
+        """Fold the turns that fell out of the window into the stored summary."""
+        if not context.unsummarized:
+            return
+
+        transcript = "\n".join(str(_to_llm_message(message)) for message in context.unsummarized)
+        previous = claim_conversation.context_summary or "(none)"
+        prompt = (
+            "You maintain a running summary of a fact-checking discussion about a claim. "
+            f"Update the summary with the new messages below, in at most {settings.CONTEXT_SUMMARY_MAX_WORDS} "
+            "words. Keep the points the user questioned and the facts and sources discussed. "
+            "Return only the summary.\n\n"
+            f"Current summary: {previous}\n\n"
+            f"New messages:\n{transcript}"
+        )
+        response = await self._llm.generate_response([LLMMessage(role="user", content=prompt)], temperature=0.2)
+
+        summary_through = context.unsummarized[-1].timestamp
+        await self._claim_conversation_repo.update_summary(
+            claim_conversation.id, response.text.strip(), summary_through
+        )
+        claim_conversation.context_summary = response.text.strip()
+        claim_conversation.summary_through = summary_through
+
+
+# claim_conversation_id -> summary update in flight, so turns arriving meanwhile don't start another.
+_summary_tasks: Dict[UUID, asyncio.Task] = {}
+
+
+def schedule_summary_update(
+    llm: LLMProvider, claim_conversation: ClaimConversation, context: ConversationContext
+) -> None:
+    """Extend a claim conversation's rolling summary in a background task with its own session."""
+    if not context.unsummarized or claim_conversation.id in _summary_tasks:
+        return
+
+    task = asyncio.create_task(_update_summary(llm, claim_conversation, context))
+    _summary_tasks[claim_conversation.id] = task
+    task.add_done_callback(lambda _: _summary_tasks.pop(claim_conversation.id, None))
+
+
+async def _update_summary(
+    llm: LLMProvider, claim_conversation: ClaimConversation, context: ConversationContext
+) -> None:
+    try:
+        async with AsyncSessionLocal() as session:
+            builder = ConversationContextBuilder(llm, MessageRepository(session), ClaimConversationRepository(session))
+            await builder.update_summary(claim_conversation, context)
+    except Exception as e:
+        logger.warning(f"Failed to update context summary for {claim_conversation.id}: {str(e)}", exc_info=True)
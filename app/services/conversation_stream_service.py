@@ -12,6 +12,7 @@ from app.models.database.models import MessageSenderType, ConversationStatus
 from app.repositories.implementations.conversation_repository import ConversationRepository
 from app.repositories.implementations.claim_conversation_repository import ClaimConversationRepository
 from app.repositories.implementations.message_repository import MessageRepository
+from app.services.buffered_message_writer import BufferedMessageWriter
 
 logger = logging.getLogger(__name__)
 
@@ -123,20 +124,20 @@ class ConversationStreamService:
                 timestamp=datetime.now(UTC),
                 claim_id=claim_id,
             )
-            bot_msg = await self._message_repo.create(bot_msg)
-
-            response_content = []
-            async for chunk in self._llm.generate_stream(messages):
-                if not chunk.is_complete:
-                    response_content.append(chunk.text)
-                    yield {
-                        "type": "content",
-                        "content": chunk.text,
-                        "message_id": str(bot_msg.id),
-                    }
-
-            bot_msg.content = "".join(response_content)
-            await self._message_repo.update(bot_msg)
+            writer = BufferedMessageWriter(self._message_repo, bot_msg)
+            bot_msg = await writer.start()
+
+            try:
+                async for chunk in self._llm.generate_stream(messages):
+                    if not chunk.is_complete:
+                        await writer.append(chunk.text)
+                        yield {
+                            "type": "content",
+                            "content": chunk.text,
+                            "message_id": str(bot_msg.id),
+                        }
+            finally:
+                await writer.close()
 
             yield {
                 "type": "message_complete",
@@ -0,0 +1,109 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+import asyncio
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_Request = Tuple[List[str], asyncio.Future]
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent encode requests into micro-batches.
+
+    Requests are queued; a single consumer task drains up to max_batch_size texts (waiting at
+    most max_wait_seconds for more to arrive) and runs them as one forward pass on a dedicated
+    inference thread, then resolves each caller's future with its slice of the vectors.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[List[str]], np.ndarray],
+        max_batch_size: int,
+        max_wait_seconds: float,
+        torch_threads: int,
+    ):
+        self._encode = encode
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max_wait_seconds
+        self._torch_threads = torch_threads
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="embedding", initializer=self._init_inference_thread
+        )
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumer: Optional[asyncio.Task] = None
+
+    def _init_inference_thread(self) -> None:
+        import torch
+
+        torch.set_num_threads(self._torch_threads)
+
+    def _ensure_consumer(self) -> asyncio.Queue:
+        if self._consumer is None or self._consumer.done():
+            self._queue = asyncio.Queue()
+            self._consumer = asyncio.create_task(self._consume())
+        return self._queue
+
+    async def encode(self, texts: List[str]) -> List[np.ndarray]:
+        """Embed texts, sharing the forward pass with any concurrent requests."""
+        if not texts:
+            return []
+
+        queue = self._ensure_consumer()
+        future = asyncio.get_running_loop().create_future()
+        await queue.put((texts, future))
+        return await future
+
+    async def _next_batch(self) -> List[_Request]:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        size = len(batch[0][0])
+        deadline = loop.time() + self._max_wait_seconds
+
+        while size < self._max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                request = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            batch.append(request)
+            size += len(request[0])
+
+        return batch
+
+    async def _consume(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._next_batch()
+            texts = [text for request_texts, _ in batch for text in request_texts]
+
+            try:
+                vectors = await loop.run_in_executor(self._executor, self._encode, texts)
+            except Exception as e:
+                logger.error(f"Embedding batch of {len(texts)} texts failed: {str(e)}", exc_info=True)
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            offset = 0
+            for request_texts, future in batch:
+                if not future.done():
+                    future.set_result(list(vectors[offset : offset + len(request_texts)]))
+                offset += len(request_texts)
+
+    async def close(self) -> None:
+        """Stop the consumer task and the inference thread."""
+        if self._consumer is not None:
+            self._consumer.cancel()
+            try:
+                await self._consumer
+            except asyncio.CancelledError:
+                pass
+            self._consumer = None
+        self._executor.shutdown(wait=False)
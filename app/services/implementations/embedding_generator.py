@@ -1,19 +1,113 @@
-from typing import List
+from typing import TYPE_CHECKING, Dict, List, Optional
 import logging
+import threading
+
+import numpy as np
+from cachetools import LRUCache
+
+from app.core.config import settings
+from app.core.utils.embeddings import embedding_cache_key
+from app.repositories.implementations.embedding_cache_repository import EmbeddingCacheRepository
+from app.services.implementations.embedding_batcher import EmbeddingBatcher
 from app.services.interfaces.embedding_generator import EmbeddingGeneratorInterface
-from sentence_transformers import SentenceTransformer
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
 # TODO: Maybe move that to the config file eventually/settings
-model = SentenceTransformer("all-MiniLM-L6-v2")
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+
+_model: Optional["SentenceTransformer"] = None
+_model_lock = threading.Lock()
+_warm_up_error: Optional[str] = None
+
+
+def get_model() -> "SentenceTransformer":
+    """The sentence transformer, loaded (with torch) on first use rather than at import."""
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                from sentence_transformers import SentenceTransformer
+
+                _model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+                logger.info(f"Loaded embedding model {EMBEDDING_MODEL_NAME}")
+    return _model
+
+
+def is_model_loaded() -> bool:
+    return _model is not None
+
+
+def get_warm_up_error() -> Optional[str]:
+    """Why the startup warm-up failed, or None if it has not failed."""
+    return _warm_up_error
+
+
+def _encode(texts: List[str]):
+    return get_model().encode(texts, batch_size=settings.EMBEDDING_MAX_BATCH_SIZE, convert_to_numpy=True)
+
+
+embedding_batcher = EmbeddingBatcher(
+    _encode,
+    max_batch_size=settings.EMBEDDING_MAX_BATCH_SIZE,
+    max_wait_seconds=settings.EMBEDDING_MAX_WAIT_MS / 1000,
+    torch_threads=settings.EMBEDDING_TORCH_THREADS,
+)
+
+# In-process tier of the embedding cache, in front of the embedding_cache table.
+_embedding_cache: LRUCache = LRUCache(maxsize=settings.EMBEDDING_CACHE_SIZE)
+
+
+async def warm_up_embedding_model() -> None:
+    """Load the model and run one forward pass on the inference thread, so the first request is not cold."""
+    global _warm_up_error
+    try:
+        await embedding_batcher.encode(["warm up"])
+        _warm_up_error = None
+    except Exception as e:
+        _warm_up_error = str(e)
+        logger.error(f"Embedding model warm-up failed: {str(e)}", exc_info=True)
 
 
 class EmbeddingGenerator(EmbeddingGeneratorInterface):
-    def __init__(self):
-        self.model = model
+    def __init__(self, cache_repository: Optional[EmbeddingCacheRepository] = None):
+        self.batcher = embedding_batcher
+        self.cache_repository = cache_repository
 
     async def generate_embedding(self, claim: str) -> List[float]:
+        embeddings = await self.generate_embeddings([claim])
+        return embeddings[0]
+
+    async def generate_embeddings(self, claims: List[str]) -> List[List[float]]:
+        """
+        Embed texts, reusing cached vectors for texts seen before.
+
+        Lookups go to the in-process LRU, then the persistent cache table; only the remaining
+        distinct texts are sent to the model, and their vectors are written back to both tiers.
+        Vectors are kept as float32 arrays internally and returned as plain lists of floats.
+        """
+        if not claims:
+            return []
+
+        keys = [embedding_cache_key(claim, EMBEDDING_MODEL_NAME) for claim in claims]
+        found: Dict[str, np.ndarray] = {key: _embedding_cache[key] for key in set(keys) if key in _embedding_cache}
+
+        if self.cache_repository is not None:
+            stored = await self.cache_repository.get_many([key for key in set(keys) if key not in found])
+            _embedding_cache.update(stored)
+            found.update(stored)
+
+        missing = {key: claim for key, claim in zip(keys, claims) if key not in found}
+        if missing:
+            vectors = await self.batcher.encode(list(missing.values()))
+            computed = dict(zip(missing.keys(), vectors))
+            _embedding_cache.update(computed)
+            found.update(computed)
+            if self.cache_repository is not None:
+                await self.cache_repository.put_many(computed)
 
-        embedding = self.model.encode(claim)
-        return embedding
+        logger.debug(f"Embedded {len(claims)} texts, {len(missing)} ran through the model")
+        return [found[key].tolist() for key in keys]
@@ -1,17 +1,15 @@
-from typing import List, Optional
+from typing import List
 import aiohttp
-from datetime import UTC, datetime
 import logging
 from uuid import UUID, uuid4
 from app.core.config import settings
-from sqlalchemy.exc import IntegrityError
 
 from app.core.exceptions import ValidationError
-from app.models.database.models import SourceModel
+from app.models.database.models import SourceDocumentModel, SourceModel
 from app.services.interfaces.web_search_service import WebSearchServiceInterface
 from app.repositories.implementations.source_repository import SourceRepository
 from app.services.domain_service import DomainService
-from app.core.utils.url import normalize_domain_name
+from app.core.utils.url import normalize_domain_name, normalize_url
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +53,7 @@ class GoogleWebSearchService(WebSearchServiceInterface):
                     "lr": "lang_fr",
                 }
 
-            sources = []
+            results = []
             async with aiohttp.ClientSession() as session:
                 async with session.get(self.search_endpoint, params=params) as response:
                     if response.status != 200:
@@ -76,55 +74,30 @@ class GoogleWebSearchService(WebSearchServiceInterface):
                             if is_new:
                                 logger.info(f"Created new domain record for: {domain_name}")
 
-                            source = await self._create_new_source(item, search_id, domain.id, domain.credibility_score)
-                            if source:
-                                sources.append(source)
-                                logger.debug(f"Created new source for URL: {item['link']}")
+                            results.append((self._to_document(item, domain.id), domain.credibility_score))
 
                         except Exception as e:
                             logger.error(f"Error processing search result: {str(e)}", exc_info=True)
                             continue
 
+            sources = await self.source_repository.create_for_search(search_id, results)
+            logger.debug(f"Linked {len(sources)} sources to search {search_id}")
             return sources
 
         except Exception as e:
             logger.error(f"Error performing web search: {str(e)}", exc_info=True)
             return []
 
-    async def _get_existing_source(self, url: str) -> Optional[SourceModel]:
-        return await self.source_repository.get_by_url(url)
-
-    async def _update_source_analysis(
-        self, source: SourceModel, search_id: UUID, credibility_score: float
-    ) -> SourceModel:
-        source.search_id = search_id
-        source.credibility_score = credibility_score
-        source.updated_at = datetime.now(UTC)
-        return await self.source_repository.update(source)
-
-    async def _create_new_source(
-        self, item: dict, search_id: UUID, domain_id: UUID, credibility_score: float
-    ) -> Optional[SourceModel]:
-        try:
-            source = SourceModel(
-                id=uuid4(),
-                search_id=search_id,
-                url=item["link"],
-                title=item["title"],
-                snippet=item["snippet"],
-                domain_id=domain_id,
-                content=None,
-                credibility_score=credibility_score,
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-            )
-            return await self.source_repository.create_with_domain(source)
-        except IntegrityError:
-            logger.warning(f"Race condition creating source for URL: {item['link']}")
-            existing = await self._get_existing_source(item["link"])
-            if existing:
-                return await self._update_source_analysis(existing, search_id, credibility_score)
-            return None
+    def _to_document(self, item: dict, domain_id: UUID) -> SourceDocumentModel:
+        """Document for a search result, keyed by its normalized URL; stored documents with that URL are reused."""
+        return SourceDocumentModel(
+            id=uuid4(),
+            url=normalize_url(item["link"]),
+            title=item["title"],
+            snippet=item["snippet"],
+            domain_id=domain_id,
+            content=None,
+        )
 
     def format_sources_for_prompt(self, sources: List[SourceModel], language: str = "english") -> str:
         """Format sources into a string for the LLM prompt."""
@@ -138,9 +111,11 @@ class GoogleWebSearchService(WebSearchServiceInterface):
                     f"Source {i}:",
                     f"Title: {source.title}",
                     f"URL: {source.url}",
-                    f"Credibility Score: {source.credibility_score:.2f}"
-                    if source.credibility_score is not None
-                    else "Credibility Score: N/A",
+                    (
+                        f"Credibility Score: {source.credibility_score:.2f}"
+                        if source.credibility_score is not None
+                        else "Credibility Score: N/A"
+                    ),
                     f"Excerpt: {source.snippet}",
                 ]
 
@@ -161,9 +136,11 @@ class GoogleWebSearchService(WebSearchServiceInterface):
                     f"Source {i}:",
                     f"Titre: {source.title}",
                     f"URL: {source.url}",
-                    f"Index de crédibilité: {source.credibility_score:.2f}"
-                    if source.credibility_score is not None
-                    else "Index de crédibilité: N/A",
+                    (
+                        f"Index de crédibilité: {source.credibility_score:.2f}"
+                        if source.credibility_score is not None
+                        else "Index de crédibilité: N/A"
+                    ),
                     f"Extrait: {source.snippet}",
                 ]
 
@@ -6,3 +6,7 @@ class EmbeddingGeneratorInterface(ABC):
     @abstractmethod
     async def generate_embedding(self, claim: str) -> List[float]:
         pass
+
+    @abstractmethod
+    async def generate_embeddings(self, claims: List[str]) -> List[List[float]]:
+        pass
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List
 from uuid import UUID
-from app.models.database.models import SourceModel
+from app.models.database.models import SourceDocumentModel, SourceModel
 
 
 class WebSearchServiceInterface(ABC):
@@ -12,19 +12,7 @@ class WebSearchServiceInterface(ABC):
         pass
 
     @abstractmethod
-    async def _get_existing_source(self, url: str) -> Optional[SourceModel]:
-        pass
-
-    @abstractmethod
-    async def _update_source_analysis(
-        self, source: SourceModel, search_id: UUID, credibility_score: float
-    ) -> SourceModel:
-        pass
-
-    @abstractmethod
-    async def _create_new_source(
-        self, item: dict, search_id: UUID, domain_id: UUID, credibility_score: float
-    ) -> Optional[SourceModel]:
+    def _to_document(self, item: dict, domain_id: UUID) -> SourceDocumentModel:
         pass
 
     @abstractmethod
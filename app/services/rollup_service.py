@@ -0,0 +1,313 @@
+from collections import Counter, defaultdict
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import logging
+
+from cachetools import TTLCache
+
+from app.core.analytics_executor import analytics_executor
+from app.core.config import settings
+from app.core.utils.terms import count_terms
+from app.core.utils.word_cloud import render_word_cloud
+from app.db.session import AsyncSessionLocal
+from app.models.domain.daily_rollup import DailyClaimRollup
+from app.repositories.aggregates import AggregationPeriod
+from app.repositories.implementations.analysis_repository import AnalysisRepository
+from app.repositories.implementations.claim_repository import ClaimRepository
+from app.repositories.implementations.rollup_repository import RollupRepository
+from app.repositories.implementations.source_repository import SourceRepository
+
+logger = logging.getLogger(__name__)
+
+_word_cloud_cache: TTLCache = TTLCache(
+    maxsize=settings.WORD_CLOUD_CACHE_SIZE, ttl=settings.WORD_CLOUD_CACHE_TTL_SECONDS
+)
+
+
+async def mark_rollup_dirty(*days: date) -> None:
+    """
+    Schedule days' rollups to be recomputed on the next refresh.
+
+    The marks are stored in rollup_dirty_days, so whichever worker runs the refresh picks them up.
+    """
+    async with AsyncSessionLocal() as session:
+        await RollupRepository(session).mark_dirty(days)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def _midnight(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=UTC)
+
+
+def _bucket_start(day: date, period: AggregationPeriod) -> datetime:
+    """Start of the day/week bucket containing a day, matching Postgres date_trunc (weeks start on Monday)."""
+    if period == AggregationPeriod.week:
+        day = day - timedelta(days=day.weekday())
+    return _midnight(day)
+
+
+class RollupService:
+    """
+    Dashboard aggregates served from the daily rollup tables.
+
+    Whole past days are read from the rollups; the partial days at either end of a
+    range (including today), and any day not rolled up yet, are computed live from the
+    raw tables and merged in.
+    """
+
+    def __init__(
+        self,
+        rollup_repository: RollupRepository,
+        claim_repository: ClaimRepository,
+        analysis_repository: AnalysisRepository,
+        source_repository: SourceRepository,
+    ):
+        self._rollup_repo = rollup_repository
+        self._claim_repo = claim_repository
+        self._analysis_repo = analysis_repository
+        self._source_repo = source_repository
+
+    async def _split_range(
+        self, start_date: datetime, end_date: datetime
+    ) -> Tuple[date, date, List[Tuple[datetime, datetime]]]:
+        """
+        Split [start_date, end_date] into rollup days [first_day, last_day) and live datetime ranges.
+
+        Days in between that have not been rolled up yet (yesterday until the next refresh, or
+        history before a backfill) have no rollup rows and are added to the live ranges.
+        """
+        start_date, end_date = _as_utc(start_date), _as_utc(end_date)
+        first_day = (
+            start_date.date() if start_date == _midnight(start_date.date()) else start_date.date() + timedelta(1)
+        )
+        last_day = min(end_date.date(), datetime.now(UTC).date())
+
+        if first_day >= last_day:
+            return first_day, first_day, [(start_date, end_date)]
+
+        live_ranges = []
+        if start_date < _midnight(first_day):
+            live_ranges.append((start_date, _midnight(first_day) - timedelta(microseconds=1)))
+
+        rolled_up = set(await self._rollup_repo.get_rolled_up_days(first_day, last_day))
+        day = first_day
+        while day < last_day:
+            if day in rolled_up:
+                day += timedelta(days=1)
+                continue
+            gap_start = day
+            while day < last_day and day not in rolled_up:
+                day += timedelta(days=1)
+            live_ranges.append((_midnight(gap_start), _midnight(day) - timedelta(microseconds=1)))
+
+        if _midnight(last_day) <= end_date:
+            live_ranges.append((_midnight(last_day), end_date))
+
+        return first_day, last_day, live_ranges
+
+    async def count_claims(
+        self, start_date: datetime, end_date: datetime, language: str, period: Optional[AggregationPeriod] = None
+    ) -> Tuple[int, List[Tuple[datetime, int]]]:
+        """Number of analyzed claims in a range, and per-period counts when a period is given."""
+        first_day, last_day, live_ranges = await self._split_range(start_date, end_date)
+        buckets: Dict[datetime, int] = defaultdict(int)
+        total = 0
+
+        for rollup in await self._rollup_repo.get_claim_rollups(first_day, last_day, language):
+            total += rollup.claim_count
+            if period and rollup.claim_count:
+                buckets[_bucket_start(rollup.day, period)] += rollup.claim_count
+
+        for start, end in live_ranges:
+            total += await self._claim_repo.count_claims_in_date_range(start, end, language)
+            if period:
+                for bucket, count in await self._claim_repo.count_claims_by_period(start, end, language, period):
+                    buckets[_as_utc(bucket)] += count
+
+        return total, sorted(buckets.items())
+
+    async def average_veracity(
+        self, start_date: datetime, end_date: datetime, language: str, period: Optional[AggregationPeriod] = None
+    ) -> Tuple[float, List[Tuple[datetime, float, int]]]:
+        """Average veracity of the latest analysis of each claim, and per-period averages when a period is given."""
+        first_day, last_day, live_ranges = await self._split_range(start_date, end_date)
+        buckets: Dict[datetime, List[float]] = defaultdict(lambda: [0.0, 0])
+        veracity_sum, count = 0.0, 0
+
+        for rollup in await self._rollup_repo.get_claim_rollups(first_day, last_day, language):
+            veracity_sum += rollup.veracity_sum
+            count += rollup.analysis_count
+            if period and rollup.analysis_count:
+                bucket = buckets[_bucket_start(rollup.day, period)]
+                bucket[0] += rollup.veracity_sum
+                bucket[1] += rollup.analysis_count
+
+        for start, end in live_ranges:
+            average, live_count = await self._analysis_repo.get_average_latest_veracity(start, end, language)
+            if live_count:
+                veracity_sum += average * live_count
+                count += live_count
+            if period:
+                for (
+                    bucket_start,
+                    bucket_average,
+                    bucket_count,
+                ) in await self._analysis_repo.get_average_latest_veracity_by_period(start, end, language, period):
+                    bucket = buckets[_as_utc(bucket_start)]
+                    bucket[0] += bucket_average * bucket_count
+                    bucket[1] += bucket_count
+
+        average = veracity_sum / count if count else 0.0
+        return average, [(start, total / n, n) for start, (total, n) in sorted(buckets.items())]
+
+    async def domain_stats(
+        self, start_date: datetime, end_date: datetime, language: str, limit: int = 50
+    ) -> Tuple[List[dict], int]:
+        """Share of retrieved sources per domain for a date range, most retrieved first."""
+        first_day, last_day, live_ranges = await self._split_range(start_date, end_date)
+        domains: Dict[str, List] = {}
+
+        total_sources = sum(
+            rollup.source_count for rollup in await self._rollup_repo.get_claim_rollups(first_day, last_day, language)
+        )
+        domain_counts = await self._rollup_repo.get_domain_counts(first_day, last_day, language)
+
+        for start, end in live_ranges:
+            total_sources += await self._source_repo.count_sources_in_date_range(start, end, language)
+            domain_counts += await self._source_repo.get_domain_counts_in_date_range(start, end, language, limit=None)
+
+        if not total_sources:
+            return [], 0
+
+        for domain_name, credibility_score, source_count in domain_counts:
+            domain = domains.setdefault(domain_name, [credibility_score, 0])
+            domain[1] += source_count
+
+        top_domains = sorted(domains.items(), key=lambda item: (-item[1][1], item[0]))[:limit]
+        aggregates = [
+            {
+                "percent_retrieved": source_count / total_sources,
+                "source_count": source_count,
+                "domain_name": domain_name,
+                "credibility_score": credibility_score,
+            }
+            for domain_name, (credibility_score, source_count) in top_domains
+        ]
+
+        return aggregates, total_sources
+
+    async def term_counts(self, start_date: datetime, end_date: datetime, language: str) -> Dict[str, int]:
+        """Most frequent terms across the analyzed claims of a range."""
+        first_day, last_day, live_ranges = await self._split_range(start_date, end_date)
+        counts: Counter = Counter()
+
+        for rollup in await self._rollup_repo.get_claim_rollups(first_day, last_day, language):
+            counts.update(rollup.term_counts)
+
+        for start, end in live_ranges:
+            async for claim_texts in self._claim_repo.stream_claim_texts_in_date_range(start, end, language):
+                counts.update(count_terms(claim_texts, language))
+
+        return dict(counts.most_common(settings.ROLLUP_TOP_TERMS))
+
+    async def word_cloud(self, start_date: datetime, end_date: datetime, language: str) -> dict:
+        """
+        Plotly word cloud figure for a range, cached until any of its days is rolled up again.
+
+        The key comes from the database, so a refresh by any worker invalidates every worker's
+        cache. Claims analyzed on days still computed live (today included) show up once the
+        entry expires, so WORD_CLOUD_CACHE_TTL_SECONDS bounds how stale those days can be.
+        """
+        first_day, last_day, _ = await self._split_range(start_date, end_date)
+        rollups_updated_at = await self._rollup_repo.get_rollups_updated_at(first_day, last_day)
+        key = (_as_utc(start_date), _as_utc(end_date), language, rollups_updated_at)
+        figure = _word_cloud_cache.get(key)
+
+        if figure is None:
+            frequencies = await self.term_counts(start_date, end_date, language)
+            figure = await analytics_executor.run(render_word_cloud, frequencies)
+            _word_cloud_cache[key] = figure
+            logger.debug("generated word cloud picture")
+
+        return figure
+
+    async def refresh_day(self, day: date) -> None:
+        """Recompute and store every rollup of a single UTC day."""
+        start, end = _midnight(day), _midnight(day + timedelta(days=1))
+
+        await self._rollup_repo.lock_day(day)
+        try:
+            claim_counts = await self._rollup_repo.compute_claim_counts(start, end)
+            veracity = await self._rollup_repo.compute_latest_veracity(start, end)
+            source_counts = await self._rollup_repo.compute_source_counts(start, end)
+            domain_counts = await self._rollup_repo.compute_domain_counts(start, end)
+
+            texts: Dict[str, List[str]] = defaultdict(list)
+            for language, claim_text in await self._rollup_repo.get_claim_texts(start, end):
+                texts[language].append(claim_text)
+
+            languages = set(claim_counts) | set(veracity) | set(source_counts) | set(texts)
+            rollups = [
+                DailyClaimRollup(
+                    day=day,
+                    language=language,
+                    claim_count=claim_counts.get(language, 0),
+                    analysis_count=veracity.get(language, (0, 0.0))[0],
+                    veracity_sum=veracity.get(language, (0, 0.0))[1],
+                    source_count=source_counts.get(language, 0),
+                    term_counts=count_terms(texts[language], language, limit=settings.ROLLUP_TOP_TERMS),
+                )
+                for language in sorted(languages)
+            ]
+        except Exception:
+            await self._rollup_repo.release_day()
+            raise
+
+        await self._rollup_repo.replace_day(day, rollups, domain_counts)
+
+    async def refresh_pending(self) -> List[date]:
+        """Refresh days marked dirty plus the trailing ROLLUP_REFRESH_DAYS complete days."""
+        today = datetime.now(UTC).date()
+        days = {today - timedelta(days=offset) for offset in range(1, settings.ROLLUP_REFRESH_DAYS + 1)}
+
+        # Today is always computed live, so it never needs a rollup; its mark is kept for tomorrow.
+        dirty = {day: marked_at for day, marked_at in await self._rollup_repo.get_dirty_days() if day < today}
+        days.update(dirty)
+
+        refreshed = []
+        for day in sorted(days):
+            try:
+                await self.refresh_day(day)
+                if day in dirty:
+                    await self._rollup_repo.clear_dirty_day(day, dirty[day])
+                refreshed.append(day)
+            except Exception as e:
+                # The mark stays in place, so the day is retried on the next refresh.
+                logger.error(f"Failed to refresh rollups for {day}: {str(e)}", exc_info=True)
+
+        return refreshed
+
+
+async def run_rollup_refresh_loop(interval_seconds: int = settings.ROLLUP_REFRESH_INTERVAL_SECONDS) -> None:
+    """Periodically refresh pending rollups until cancelled."""
+    while True:
+        try:
+            async with AsyncSessionLocal() as session:
+                service = RollupService(
+                    RollupRepository(session),
+                    ClaimRepository(session),
+                    AnalysisRepository(session),
+                    SourceRepository(session),
+                )
+                refreshed = await service.refresh_pending()
+                logger.info(f"Refreshed dashboard rollups for {len(refreshed)} day(s)")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Rollup refresh failed: {str(e)}", exc_info=True)
+
+        await asyncio.sleep(interval_seconds)
@@ -1,7 +1,8 @@
+import base64
+import json
 import logging
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from uuid import UUID
-from datetime import datetime
 
 from app.models.domain.source import Source
 from app.repositories.implementations.source_repository import SourceRepository
@@ -9,11 +10,23 @@ from app.repositories.implementations.search_repository import SearchRepository
 from app.repositories.implementations.analysis_repository import AnalysisRepository
 from app.repositories.implementations.claim_repository import ClaimRepository
 from app.services.domain_service import DomainService
-from app.core.exceptions import NotFoundException, NotAuthorizedException
+from app.core.exceptions import NotFoundException, NotAuthorizedException, ValidationError
 
 logger = logging.getLogger(__name__)
 
 
+def _encode_search_cursor(rank: float, source_id: UUID) -> str:
+    return base64.urlsafe_b64encode(json.dumps([rank, str(source_id)]).encode()).decode()
+
+
+def _decode_search_cursor(cursor: str) -> Tuple[float, UUID]:
+    try:
+        rank, source_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return float(rank), UUID(source_id)
+    except (ValueError, TypeError) as e:
+        raise ValidationError("Invalid search cursor") from e
+
+
 class SourceService:
     def __init__(
         self,
@@ -102,66 +115,41 @@ class SourceService:
         if not domain:
             raise NotFoundException("Domain not found")
 
-        # Get all sources for the domain
-        # TODO Check method definition
-        sources, total = await self._source_repo.get_by_domain(domain_id=domain_id, limit=limit, offset=offset)
-
-        # Filter sources based on user access
-        authorized_sources = []
-        for source in sources:
-            try:
-                if await self._check_analysis_access(source.search_id, user_id):
-                    authorized_sources.append(source)
-            except NotFoundException:
-                continue
-
-        return authorized_sources, len(authorized_sources)
+        return await self._source_repo.get_by_domain_for_user(
+            domain_id=domain_id, user_id=user_id, limit=limit, offset=offset
+        )
 
     async def search_sources(
-        self, query: str, user_id: UUID, limit: int = 50, offset: int = 0
-    ) -> Tuple[List[Source], int]:
-        """Search through sources with authorization check."""
-        # TODO Check method definition
-        sources, total = await self._source_repo.search_sources(query=query, limit=limit, offset=offset)
-
-        # Filter sources based on user access
-        authorized_sources = []
-        for source in sources:
-            try:
-                if await self._check_analysis_access(source.search_id, user_id):
-                    authorized_sources.append(source)
-            except NotFoundException:
-                continue
-
-        return authorized_sources, len(authorized_sources)
-
-    async def list_time_bound_sources(
-        self, start_date: datetime, end_date: datetime, language: str = "english"
-    ) -> List[Source]:
-        """List sources for a specific date range."""
-        sources = await self._source_repo.get_sources_filtered_by_date_and_language(
-            start_date=start_date, end_date=end_date, language=language
+        self, query: str, user_id: UUID, limit: int = 50, cursor: Optional[str] = None
+    ) -> Tuple[List[Source], Optional[str]]:
+        """Full-text search through the user's sources; returns a page and the cursor of the next one, if any."""
+        after = _decode_search_cursor(cursor) if cursor else None
+        rows = await self._source_repo.search_sources_for_user(
+            text=query, user_id=user_id, limit=limit + 1, after=after
         )
 
-        return sources
-
-    async def calculate_domain_stats(self, grouped_sources, total_objects):
-        result = []
-
-        for group in grouped_sources:
-            if not group:
-                continue
-
-            domain_name = group[0].domain.domain_name
-            credibility_score = group[0].domain.credibility_score
-            percent_retrieved = len(group) / total_objects
-
-            result.append(
-                {
-                    "percent_retrieved": percent_retrieved,
-                    "domain_name": domain_name,
-                    "credibility_score": credibility_score,
-                }
-            )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_source, last_rank = rows[-1]
+            next_cursor = _encode_search_cursor(last_rank, last_source.id)
+        return [source for source, _ in rows], next_cursor
+
+    async def get_analysis_sources(self, analysis_id: UUID, user_id: UUID, unique: bool = False) -> List[Source]:
+        """Get all sources of an analysis, most credible first, with authorization check."""
+        sources = await self._source_repo.get_by_analysis_for_user(
+            analysis_id=analysis_id, user_id=user_id, unique=unique
+        )
+        if sources:
+            return sources
 
-        return result
+        # Nothing matched: tell a missing or foreign analysis apart from one without sources.
+        analysis = await self._analysis_repo.get(analysis_id)
+        if not analysis:
+            raise NotFoundException("Analysis not found")
+        claim = await self._claim_repo.get(analysis.claim_id)
+        if not claim:
+            raise NotFoundException("Claim not found")
+        if claim.user_id != user_id:
+            raise NotAuthorizedException("Not authorized to access these sources")
+        return []
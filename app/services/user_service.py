@@ -1,9 +1,10 @@
 from uuid import UUID, uuid4
 from typing import Optional
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
 
 from app.models.domain.user import User
 from app.repositories.implementations.user_repository import UserRepository
+from app.core.config import settings
 from app.core.exceptions import NotFoundException, DuplicateUserError
 
 
@@ -50,11 +51,16 @@ class UserService:
         """Get user by email."""
         return await self._user_repo.get_by_email(email)
 
-    async def record_login(self, user_id: UUID) -> User:
-        """Record user login."""
-        user = await self.get_user(user_id)
-        user.last_login = datetime.now(UTC)
-        return await self._user_repo.update(user)
+    async def record_login(self, user: User) -> User:
+        """Record user login, writing last_login at most once per LAST_LOGIN_UPDATE_INTERVAL_SECONDS."""
+        now = datetime.now(UTC)
+        stale_before = now - timedelta(seconds=settings.LAST_LOGIN_UPDATE_INTERVAL_SECONDS)
+        if user.last_login is not None and user.last_login >= stale_before:
+            return user
+
+        if await self._user_repo.touch_last_login(user.id, now, stale_before):
+            user.last_login = now
+        return user
 
     async def deactivate_user(self, user_id: UUID) -> User:
         """Deactivate a user account."""
@@ -0,0 +1,54 @@
+"""store claim embeddings as float32 bytea
+
+Revision ID: 7c4e2a91d5f0
+Revises: b3e07d4a9c21
+Create Date: 2026-10-19 13:05:18.402931
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c4e2a91d5f0"
+down_revision: Union[str, None] = "b3e07d4a9c21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+
+def convert_embeddings(source: str, target: str, convert) -> None:
+    """Copy claims.<source> into claims.<target> in id-ordered batches, converting each value."""
+    bind = op.get_bind()
+    select_batch = sa.text(
+        f"SELECT id, {source} FROM claims WHERE {source} IS NOT NULL AND id > :last_id ORDER BY id LIMIT :limit"
+    )
+    update_row = sa.text(f"UPDATE claims SET {target} = :value WHERE id = :id")
+
+    last_id = "00000000-0000-0000-0000-000000000000"
+    while True:
+        rows = bind.execute(select_batch, {"last_id": last_id, "limit": BATCH_SIZE}).all()
+        if not rows:
+            break
+        bind.execute(update_row, [{"id": row[0], "value": convert(row[1])} for row in rows])
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    op.add_column("claims", sa.Column("embedding_f32", sa.LargeBinary(), nullable=True))
+    convert_embeddings("embedding", "embedding_f32", lambda value: np.asarray(value, dtype="<f4").tobytes())
+    op.drop_column("claims", "embedding")
+    op.alter_column("claims", "embedding_f32", new_column_name="embedding")
+
+
+def downgrade() -> None:
+    op.add_column("claims", sa.Column("embedding_f64", postgresql.ARRAY(postgresql.DOUBLE_PRECISION()), nullable=True))
+    convert_embeddings("embedding", "embedding_f64", lambda value: np.frombuffer(value, dtype="<f4").tolist())
+    op.drop_column("claims", "embedding")
+    op.alter_column("claims", "embedding_f64", new_column_name="embedding")
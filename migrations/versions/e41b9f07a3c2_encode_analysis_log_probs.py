@@ -0,0 +1,160 @@
+"""encode analysis log_probs without pickle
+
+Revision ID: e41b9f07a3c2
+Revises: 7c4e2a91d5f0
+Create Date: 2026-10-19 13:48:02.915473
+
+"""
+
+from typing import Any, List, Optional, Sequence, Tuple, Union
+import io
+import logging
+import math
+import pickle
+import struct
+
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e41b9f07a3c2"
+down_revision: Union[str, None] = "7c4e2a91d5f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+
+# The encoding and the analysis table are frozen here as of this revision, so later changes to the
+# application code cannot alter what this migration writes.
+MAGIC = b"LPB"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<3sBII")
+
+# Where the pickled values' class lived when they were written.
+PICKLED_CLASS = ("app.models.domain.analysis", "LogProbsData")
+
+analysis = sa.table(
+    "analysis",
+    sa.column("id", sa.UUID()),
+    sa.column("log_probs", sa.LargeBinary()),
+)
+
+
+def as_logprob(value: Any) -> float:
+    if value is None:
+        return math.nan
+    if isinstance(value, (int, float)):
+        return float(value)
+    content = getattr(value, "content", None)
+    if content:
+        return float(sum(token.logprob for token in content))
+    return math.nan
+
+
+def encode_log_probs(tokens: Sequence[str], probs: Sequence[Any]) -> bytes:
+    encoded_tokens = [token.encode("utf-8") for token in tokens]
+    return b"".join(
+        [
+            HEADER.pack(MAGIC, FORMAT_VERSION, len(probs), len(encoded_tokens)),
+            np.asarray([as_logprob(p) for p in probs], dtype="<f4").tobytes(),
+            np.asarray([len(token) for token in encoded_tokens], dtype="<u4").tobytes(),
+            *encoded_tokens,
+        ]
+    )
+
+
+def decode_log_probs(data: bytes) -> Tuple[List[str], List[Optional[float]]]:
+    magic, version, prob_count, token_count = HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported log_probs format {magic!r} v{version}")
+
+    offset = HEADER.size
+    probs = np.frombuffer(data, dtype="<f4", count=prob_count, offset=offset)
+    offset += probs.nbytes
+    lengths = np.frombuffer(data, dtype="<u4", count=token_count, offset=offset)
+    offset += lengths.nbytes
+
+    tokens = []
+    for length in lengths.tolist():
+        tokens.append(data[offset : offset + length].decode("utf-8"))
+        offset += length
+
+    return tokens, [None if math.isnan(p) else p for p in probs.tolist()]
+
+
+class PickledLogProbs:
+    """Stand-in for the pickled dataclass, which only needs to receive its tokens and probs."""
+
+    tokens: List[str]
+    probs: List[Any]
+
+
+class LogProbsUnpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str):
+        if (module, name) == PICKLED_CLASS:
+            return PickledLogProbs
+        return super().find_class(module, name)
+
+
+def rewrite_log_probs(convert) -> None:
+    """Rewrite every analysis.log_probs value in id-ordered batches; values that fail to convert become NULL."""
+    bind = op.get_bind()
+    update_row = (
+        analysis.update().where(analysis.c.id == sa.bindparam("analysis_id")).values(log_probs=sa.bindparam("value"))
+    )
+
+    last_id = None
+    while True:
+        select_batch = sa.select(analysis.c.id, analysis.c.log_probs).where(analysis.c.log_probs.is_not(None))
+        if last_id is not None:
+            select_batch = select_batch.where(analysis.c.id > last_id)
+        rows = bind.execute(select_batch.order_by(analysis.c.id).limit(BATCH_SIZE)).all()
+        if not rows:
+            break
+
+        updates = []
+        for analysis_id, value in rows:
+            try:
+                updates.append({"analysis_id": analysis_id, "value": convert(bytes(value))})
+            except Exception as e:
+                logger.warning(f"Dropping unreadable log_probs of analysis {analysis_id}: {e}")
+                updates.append({"analysis_id": analysis_id, "value": None})
+
+        bind.execute(update_row, updates)
+        last_id = rows[-1][0]
+
+
+def from_pickle(value: bytes) -> bytes:
+    data = LogProbsUnpickler(io.BytesIO(value)).load()
+    return encode_log_probs(data.tokens, data.probs)
+
+
+def to_pickle(value: bytes) -> bytes:
+    """Pickle the decoded value exactly as the dataclass would have been, without importing it."""
+    tokens, probs = decode_log_probs(value)
+    state = pickle.dumps({"tokens": tokens, "probs": probs}, protocol=2)
+    module, name = PICKLED_CLASS
+    return b"".join(
+        [
+            pickle.PROTO + b"\x02",
+            pickle.GLOBAL + f"{module}\n{name}\n".encode("ascii"),
+            pickle.EMPTY_TUPLE,
+            pickle.NEWOBJ,
+            # The state dict's own opcodes, without its PROTO header and STOP.
+            state[2:-1],
+            pickle.BUILD,
+            pickle.STOP,
+        ]
+    )
+
+
+def upgrade() -> None:
+    rewrite_log_probs(from_pickle)
+
+
+def downgrade() -> None:
+    rewrite_log_probs(to_pickle)
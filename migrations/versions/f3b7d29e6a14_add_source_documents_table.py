@@ -0,0 +1,185 @@
+"""add source documents table
+
+Revision ID: f3b7d29e6a14
+Revises: c81e5a3d47b9
+Create Date: 2026-10-19 18:05:37.240981
+
+"""
+
+from typing import Sequence, Union
+from urllib.parse import urlsplit, urlunsplit
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b7d29e6a14"
+down_revision: Union[str, None] = "c81e5a3d47b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(snippet, '')), 'B') || "
+    "setweight(to_tsvector('simple', left(coalesce(content, ''), 100000)), 'C')"
+)
+
+BATCH_SIZE = 1000
+
+
+def normalize_url(url: str) -> str:
+    """app.core.utils.url.normalize_url as of this revision, so stored URLs match what new searches insert."""
+    try:
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or "").lower()
+        if ":" in host:
+            host = f"[{host}]"
+        if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+            host = f"{host}:{parts.port}"
+        if parts.username or parts.password:
+            host = f"{parts.netloc.rsplit('@', 1)[0]}@{host}"
+        return urlunsplit((scheme, host, parts.path or "/", parts.query, ""))
+    except ValueError:
+        return url.strip()
+
+
+def normalize_source_urls() -> None:
+    """Rewrite sources.url to its normalized form, in batches of distinct URLs."""
+    # Temporary plain index on url, so each batch and each update is an index scan rather than a full scan.
+    op.create_index("ix_sources_url_backfill", "sources", ["url"], unique=False)
+    bind = op.get_bind()
+    select_batch = sa.text("SELECT DISTINCT url FROM sources WHERE url > :last_url ORDER BY url LIMIT :limit")
+    update_url = sa.text("UPDATE sources SET url = :normalized WHERE url = :url")
+
+    last_url = ""
+    while True:
+        urls = bind.execute(select_batch, {"last_url": last_url, "limit": BATCH_SIZE}).scalars().all()
+        if not urls:
+            break
+
+        updates = [{"url": url, "normalized": normalize_url(url)} for url in urls]
+        updates = [update for update in updates if update["normalized"] != update["url"]]
+        if updates:
+            bind.execute(update_url, updates)
+        last_url = urls[-1]
+
+    op.drop_index("ix_sources_url_backfill", table_name="sources")
+
+
+def upgrade() -> None:
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.create_table(
+        "source_documents",
+        sa.Column("url", sa.String(length=2048), nullable=False),
+        sa.Column("title", sa.String(length=512), nullable=False),
+        sa.Column("snippet", sa.Text(), nullable=True),
+        sa.Column("domain_id", sa.UUID(), nullable=True),
+        sa.Column("content", sa.Text(), nullable=True),
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR, persisted=True),
+            nullable=True,
+        ),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["domain_id"], ["domains.id"], name=op.f("fk_source_documents_domain_id_domains")),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_source_documents")),
+    )
+    op.add_column("sources", sa.Column("document_id", sa.UUID(), nullable=True))
+
+    # URLs that only differ in scheme or host case, default port or fragment collapse onto one document.
+    normalize_source_urls()
+
+    # One document per distinct URL, from its most recent source row (preferring one with fetched content).
+    op.execute(
+        """
+        INSERT INTO source_documents (id, url, title, snippet, domain_id, content, created_at, updated_at)
+        SELECT DISTINCT ON (md5(url)) gen_random_uuid(), url, title, snippet, domain_id, content, created_at, updated_at
+        FROM sources
+        ORDER BY md5(url), content IS NULL, created_at DESC
+        """
+    )
+    op.execute(
+        """
+        UPDATE sources SET document_id = source_documents.id
+        FROM source_documents
+        WHERE md5(source_documents.url) = md5(sources.url)
+        """
+    )
+
+    # Indexes are built after the backfill, which is much faster than maintaining them row by row.
+    op.create_index("ix_source_documents_url_hash", "source_documents", [sa.text("md5(url)")], unique=True)
+    op.create_index(op.f("ix_source_documents_domain_id"), "source_documents", ["domain_id"], unique=False)
+    op.create_index(
+        "ix_source_documents_search_vector",
+        "source_documents",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.alter_column("sources", "document_id", existing_type=sa.UUID(), nullable=False)
+    op.create_index(op.f("ix_sources_document_id"), "sources", ["document_id"], unique=False)
+    op.create_foreign_key(
+        op.f("fk_sources_document_id_source_documents"), "sources", "source_documents", ["document_id"], ["id"]
+    )
+
+    op.drop_index("ix_sources_search_vector", table_name="sources", postgresql_using="gin")
+    op.drop_index("ix_source_url_hash", table_name="sources")
+    op.drop_index(op.f("ix_sources_domain_id"), table_name="sources")
+    op.drop_column("sources", "search_vector")
+    op.drop_column("sources", "content")
+    op.drop_column("sources", "domain_id")
+    op.drop_column("sources", "snippet")
+    op.drop_column("sources", "title")
+    op.drop_column("sources", "url")
+    # ### end Alembic commands ###
+
+
+def downgrade() -> None:
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.add_column("sources", sa.Column("url", sa.String(length=2048), nullable=True))
+    op.add_column("sources", sa.Column("title", sa.String(length=512), nullable=True))
+    op.add_column("sources", sa.Column("snippet", sa.Text(), nullable=True))
+    op.add_column("sources", sa.Column("domain_id", sa.UUID(), nullable=True))
+    op.add_column("sources", sa.Column("content", sa.Text(), nullable=True))
+    op.execute(
+        """
+        UPDATE sources
+        SET url = source_documents.url,
+            title = source_documents.title,
+            snippet = source_documents.snippet,
+            domain_id = source_documents.domain_id,
+            content = source_documents.content
+        FROM source_documents
+        WHERE source_documents.id = sources.document_id
+        """
+    )
+    op.alter_column("sources", "url", existing_type=sa.String(length=2048), nullable=False)
+    op.alter_column("sources", "title", existing_type=sa.String(length=512), nullable=False)
+    op.create_foreign_key(op.f("fk_sources_domain_id_domains"), "sources", "domains", ["domain_id"], ["id"])
+    op.add_column(
+        "sources",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(op.f("ix_sources_domain_id"), "sources", ["domain_id"], unique=False)
+    op.create_index("ix_source_url_hash", "sources", [sa.text("md5(url)")], unique=False)
+    op.create_index("ix_sources_search_vector", "sources", ["search_vector"], unique=False, postgresql_using="gin")
+
+    op.drop_constraint(op.f("fk_sources_document_id_source_documents"), "sources", type_="foreignkey")
+    op.drop_index(op.f("ix_sources_document_id"), table_name="sources")
+    op.drop_column("sources", "document_id")
+    op.drop_index("ix_source_documents_search_vector", table_name="source_documents", postgresql_using="gin")
+    op.drop_index(op.f("ix_source_documents_domain_id"), table_name="source_documents")
+    op.drop_index("ix_source_documents_url_hash", table_name="source_documents")
+    op.drop_table("source_documents")
+    # ### end Alembic commands ###
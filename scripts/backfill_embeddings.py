@@ -0,0 +1,32 @@
+import argparse
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.repositories.implementations.analysis_repository import AnalysisRepository
+from app.repositories.implementations.claim_repository import ClaimRepository
+from app.repositories.implementations.embedding_cache_repository import EmbeddingCacheRepository
+from app.services.claim_service import ClaimService
+from app.services.implementations.embedding_generator import EmbeddingGenerator
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+
+async def backfill(batch_size: int) -> None:
+    """Embed every claim whose embedding is still NULL."""
+    async with AsyncSessionLocal() as session:
+        service = ClaimService(ClaimRepository(session), AnalysisRepository(session))
+        total = await service.backfill_embeddings(
+            EmbeddingGenerator(EmbeddingCacheRepository(session)), batch_size=batch_size
+        )
+        logger.info(f"Backfill complete: {total} claims embedded")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate embeddings for claims that have none.")
+    parser.add_argument("--batch-size", type=int, default=settings.EMBEDDING_BATCH_SIZE)
+    args = parser.parse_args()
+
+    asyncio.run(backfill(args.batch_size))
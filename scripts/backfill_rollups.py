@@ -0,0 +1,49 @@
+import argparse
+import asyncio
+import logging
+from datetime import UTC, date, datetime, timedelta
+
+from sqlalchemy import func, select
+
+from app.db.session import AsyncSessionLocal
+from app.models.database.models import ClaimModel
+from app.repositories.implementations.analysis_repository import AnalysisRepository
+from app.repositories.implementations.claim_repository import ClaimRepository
+from app.repositories.implementations.rollup_repository import RollupRepository
+from app.repositories.implementations.source_repository import SourceRepository
+from app.services.rollup_service import RollupService
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+
+async def backfill(start_day: date = None, end_day: date = None) -> None:
+    """Compute dashboard rollups for every complete day in [start_day, end_day)."""
+    end_day = end_day or datetime.now(UTC).date()
+
+    async with AsyncSessionLocal() as session:
+        if start_day is None:
+            first_claim = (await session.execute(select(func.min(ClaimModel.created_at)))).scalar()
+            if first_claim is None:
+                logger.info("No claims found, nothing to backfill")
+                return
+            start_day = first_claim.date()
+
+        service = RollupService(
+            RollupRepository(session), ClaimRepository(session), AnalysisRepository(session), SourceRepository(session)
+        )
+
+        day = start_day
+        while day < end_day:
+            await service.refresh_day(day)
+            logger.info(f"Rolled up {day}")
+            day += timedelta(days=1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill the daily dashboard rollup tables.")
+    parser.add_argument("--start", type=date.fromisoformat, help="First day to compute (default: first claim)")
+    parser.add_argument("--end", type=date.fromisoformat, help="Day to stop before (default: today)")
+    args = parser.parse_args()
+
+    asyncio.run(backfill(args.start, args.end))
@@ -0,0 +1,76 @@
+import argparse
+import json
+import logging
+import statistics
+import subprocess
+import sys
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+# Runs in a fresh interpreter so every measurement starts from a cold import cache.
+PROBE = """
+import json
+import sys
+import time
+
+claim_id, token = sys.argv[1:3]
+
+start = time.perf_counter()
+import app.main  # noqa: F401
+import_seconds = time.perf_counter() - start
+
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_embedding_generator
+from app.services.implementations.embedding_generator import EmbeddingGenerator
+
+# Skip the persistent embedding cache, so every request reaches the model instead of an earlier run's vector.
+# The override must take no arguments, or FastAPI reads the constructor's parameters as request fields.
+app.main.app.dependency_overrides[get_embedding_generator] = lambda: EmbeddingGenerator()
+
+headers = {"Authorization": f"Bearer {token}"}
+path = f"/v1/claims/{claim_id}/embedding"
+
+start = time.perf_counter()
+with TestClient(app.main.app) as client:
+    startup_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    client.patch(path, headers=headers).raise_for_status()
+    first_embedding_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    client.patch(path, headers=headers).raise_for_status()
+    warm_embedding_seconds = time.perf_counter() - start
+
+print(json.dumps({
+    "import_app": import_seconds,
+    "startup": startup_seconds,
+    "first_embedding": first_embedding_seconds,
+    "warm_embedding": warm_embedding_seconds,
+}))
+"""
+
+
+def run_probe(claim_id: str, token: str) -> dict:
+    result = subprocess.run([sys.executable, "-c", PROBE, claim_id, token], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def benchmark(runs: int, claim_id: str, token: str) -> None:
+    """Report median cold-start timings over several fresh interpreters."""
+    samples = [run_probe(claim_id, token) for _ in range(runs)]
+    for name in samples[0]:
+        values = [sample[name] for sample in samples]
+        logger.info(f"{name:>16}: median {statistics.median(values) * 1000:8.1f} ms, max {max(values) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure API import time and first-request latency.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--claim-id", required=True, help="Claim owned by the token's user, re-embedded on each run")
+    parser.add_argument("--token", required=True, help="Bearer token accepted by the API")
+    args = parser.parse_args()
+
+    benchmark(args.runs, args.claim_id, args.token)